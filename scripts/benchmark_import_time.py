@@ -0,0 +1,39 @@
+"""Measures the time it takes to import the text_anonymizer package and to access TextAnonymizer.
+
+Every measurement runs in a new interpreter, so no module is imported in advance:
+
+    python scripts/benchmark_import_time.py [--repeat 5]
+
+Importing text_anonymizer must not import spaCy, Presidio, phonenumbers or yaml. This is checked by tests/test_imports.py.
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = {
+    "import text_anonymizer": "import text_anonymizer",
+    "from text_anonymizer import TextAnonymizer": "from text_anonymizer import TextAnonymizer",
+}
+
+
+def measure_import_time(statement: str) -> float:
+    """Returns the seconds a new interpreter takes to execute the given import statement."""
+    code = "import time\nstart = time.perf_counter()\n{}\nprint(time.perf_counter() - start)".format(statement)
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    return float(output.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Number of measurements per statement.")
+    args = parser.parse_args()
+
+    for name, statement in STATEMENTS.items():
+        times = [measure_import_time(statement) for _ in range(args.repeat)]
+        print("{:<45} median {:.3f} s, min {:.3f} s".format(name, statistics.median(times), min(times)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""Generates the static registry of recognizer classes in src/text_anonymizer/recognizer_registry.py.
+
+Run this script after adding a recognizer class or changing the class variables POSSIBLE_LANGUAGES, POSSIBLE_ENTITIES or
+POSSIBLE_REGIONS of a recognizer class:
+
+    python scripts/generate_recognizer_registry.py
+"""
+
+import json
+import os
+
+from text_anonymizer.recognizer_manager import get_recognizer_registry_entries
+
+REGISTRY_FILE = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "src", "text_anonymizer", "recognizer_registry.py"
+)
+
+HEADER = '''"""Static registry of the recognizer classes of package text_anonymizer.recognizers.
+
+The RecognizerManager looks up the recognizer classes matching its languages, entities and regions in this registry
+and imports only their modules. This module is generated by scripts/generate_recognizer_registry.py. Do not edit it
+manually.
+"""
+
+from typing import List, Optional, Tuple, Union
+
+# Module name, class name, possible languages, possible entities and possible regions of a recognizer class.
+RecognizerRegistryEntry = Tuple[str, str, Optional[List[str]], Optional[List[str]], Union[List[str], str, None]]
+
+'''
+
+
+# Maximum line length of the code formatter black as configured in pyproject.toml.
+MAX_LINE_LENGTH = 120
+
+
+def _format_value(value) -> str:
+    """Formats a value of a registry entry as Python source code in the style of black."""
+    if value is None:
+        return "None"
+    if isinstance(value, str):
+        return json.dumps(value)
+    return "[" + ", ".join(json.dumps(item) for item in value) + "]"
+
+
+def _format_entry(entry) -> str:
+    """Formats a registry entry as Python source code in the style of black."""
+    values = [_format_value(value) for value in entry]
+    line = "    (" + ", ".join(values) + "),\n"
+    if len(line) - 1 <= MAX_LINE_LENGTH:
+        return line
+    return "    (\n" + "".join("        " + value + ",\n" for value in values) + "    ),\n"
+
+
+def generate_recognizer_registry():
+    """Writes the entries of all recognizer classes of this library to the registry module."""
+    entries = "".join(_format_entry(entry) for entry in get_recognizer_registry_entries())
+    with open(REGISTRY_FILE, "w", encoding="utf-8") as file:
+        file.write(HEADER + "RECOGNIZER_REGISTRY: List[RecognizerRegistryEntry] = [\n" + entries + "]\n")
+    print("Wrote recognizer registry to {}".format(os.path.normpath(REGISTRY_FILE)))
+
+
+if __name__ == "__main__":
+    generate_recognizer_registry()
@@ -1,34 +1,46 @@
 import os
-from text_anonymizer import TextAnonymizer
+from text_anonymizer import TextAnonymizer, constants
+from text_anonymizer.streaming import detect_lines
 
 # Path to the log file generated during integration tests
 LOG_FILE = "../logstest/application-direct-log.txt"
 OUTPUT_FILE = "../logstest/pii_detection_result.txt"
+# Number of log lines analyzed at once. The language is detected once per batch.
+BATCH_SIZE = 256
+# Language of a batch whose language cannot be detected, e.g. a batch of timestamps and stack traces.
+FALLBACK_LANGUAGE = constants.LANGUAGE_CODE_EN
 
 def detect_pii():
-    """Reads the log file, detects PII, and writes the result to OUTPUT_FILE."""
-    text_anonymizer = TextAnonymizer()
+    """Streams the log file line by line, detects PII, and writes the result to OUTPUT_FILE."""
+    text_anonymizer = TextAnonymizer(lazy_load_models=True)
 
     if not os.path.exists(LOG_FILE):
         print(f"Error: Log file {LOG_FILE} not found!")
         return
 
-    with open(LOG_FILE, "r", encoding="utf-8") as file:
-        logs = file.read()
+    pii_detected = False
+    with open(LOG_FILE, "r", encoding="utf-8") as file, open(OUTPUT_FILE, "w", encoding="utf-8") as output:
+        # Call AnonyMate (i3-anonymate) to detect PII
+        for record in detect_lines(
+            text_anonymizer,
+            lines=file,
+            detect_language=True,
+            fallback_language=FALLBACK_LANGUAGE,
+            batch_size=BATCH_SIZE,
+        ):
+            if not pii_detected:
+                output.write("Caution: PII detected in logs!\n")
+                pii_detected = True
+            for entity in record['entities']:
+                output.write(f"{entity['type']} found in line {record['line']} at position {entity['start']}-{entity['end']}\n")
 
-    # Call AnonyMate (i3-anonymate) to detect PII
-    result = text_anonymizer.process(text=logs, detect_language=True, detect=True)
-
-    with open(OUTPUT_FILE, "w", encoding="utf-8") as output:
-        if result.get('entities'):
-            output.write("Caution: PII detected in logs!\n")
-            for entity in result['entities']:
-                output.write(f"{entity['type']} found at position {entity['start']}-{entity['end']}\n")
-            print("❌ PII detected! Failing build...")
-            exit(1)
-        else:
+        if not pii_detected:
             output.write("✅ No PII detected.\n")
-            print("✅ No PII detected.")
+
+    if pii_detected:
+        print("❌ PII detected! Failing build...")
+        exit(1)
+    print("✅ No PII detected.")
 
 if __name__ == "__main__":
     detect_pii()
@@ -1,7 +1,21 @@
+from typing import Any
+
 from text_anonymizer.logging_config import setup_logging
-from text_anonymizer.text_anonymizer import TextAnonymizer
 from text_anonymizer.utils import text_anonymizer_info
 
 setup_logging()
 
 __all__ = ["TextAnonymizer", "text_anonymizer_info"]
+
+
+def __getattr__(name: str) -> Any:
+    """Imports TextAnonymizer on first access, since it imports spaCy, Presidio and lingua (PEP 562)."""
+    if name == "TextAnonymizer":
+        from text_anonymizer.text_anonymizer import TextAnonymizer
+
+        return TextAnonymizer
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
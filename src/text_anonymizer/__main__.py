@@ -0,0 +1,120 @@
+"""Anonymize line-oriented texts like log files from the command line.
+
+Examples:
+    python -m text_anonymizer --language en < application.log > application_anonymized.log
+    python -m text_anonymizer --detect-language --fallback-language en --detect application.log
+"""
+
+import argparse
+import json
+import logging
+import sys
+from typing import List, Optional
+
+from text_anonymizer import constants
+from text_anonymizer.streaming import anonymize_lines, detect_lines
+from text_anonymizer.text_anonymizer import TextAnonymizer
+
+
+def parse_arguments(args: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        prog="python -m text_anonymizer",
+        description="Anonymize a text line by line or list the entities found per line as JSON lines.",
+    )
+    parser.add_argument("input", nargs="?", default="-", help="Path of the input file. Defaults to stdin.")
+    parser.add_argument("-o", "--output", default="-", help="Path of the output file. Defaults to stdout.")
+    language_group = parser.add_mutually_exclusive_group()
+    language_group.add_argument("--language", choices=constants.AVAILABLE_LANGUAGES, help="Language of the text.")
+    language_group.add_argument(
+        "--detect-language", action="store_true", help="Detect the language once per batch of lines."
+    )
+    parser.add_argument(
+        "--fallback-language",
+        choices=constants.AVAILABLE_LANGUAGES,
+        help="Language of a batch whose language cannot be detected.",
+    )
+    parser.add_argument("--languages", nargs="+", choices=constants.AVAILABLE_LANGUAGES, help="Supported languages.")
+    parser.add_argument("--entities", nargs="+", choices=constants.AVAILABLE_ENTITIES, help="Entities to find.")
+    parser.add_argument("--regions", nargs="+", choices=constants.AVAILABLE_REGIONS, help="Regions to consider.")
+    parser.add_argument("--model-preset", choices=constants.AVAILABLE_MODEL_PRESETS, help="Preset of spaCy models.")
+    parser.add_argument(
+        "--technique",
+        choices=constants.AVAILABLE_TECHNIQUES,
+        default=constants.TECHNIQUE_REPLACE,
+        help="Anonymization technique.",
+    )
+    parser.add_argument("--anonymize-complete-vin", action="store_true", help="Censor the whole VIN.")
+    parser.add_argument(
+        "--detect", action="store_true", help="Write the entities found per line as JSON lines instead of the text."
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=constants.DEFAULT_BATCH_SIZE, help="Number of lines processed at once."
+    )
+    parser.add_argument("--verbose", action="store_true", help="Log info messages.")
+    arguments = parser.parse_args(args)
+
+    # Without a language, the text anonymizer can only process texts, if it supports exactly one language.
+    supported_languages = arguments.languages or constants.AVAILABLE_LANGUAGES
+    if arguments.language is None and not arguments.detect_language and len(supported_languages) > 1:
+        parser.error(
+            "one of the arguments --language --detect-language is required, if more than one language is supported. "
+            "Supported: {}.".format(", ".join(supported_languages))
+        )
+    return arguments
+
+
+def _configure_logging(verbose: bool) -> None:
+    # Logs would mix with the output on stdout.
+    for logger_name in [None, "text_anonymizer"]:
+        logger = logging.getLogger(logger_name)
+        logger.setLevel(logging.INFO if verbose else logging.WARNING)
+        for handler in logger.handlers:
+            if isinstance(handler, logging.StreamHandler):
+                handler.setStream(sys.stderr)
+
+
+def main(args: Optional[List[str]] = None) -> None:
+    arguments = parse_arguments(args)
+    _configure_logging(verbose=arguments.verbose)
+
+    languages = arguments.languages
+    if languages is None and arguments.language is not None:
+        languages = [arguments.language]
+    text_anonymizer = TextAnonymizer(
+        supported_languages=languages,
+        supported_entities=arguments.entities,
+        supported_regions=arguments.regions,
+        lazy_load_models=True,
+        model_preset=arguments.model_preset,
+    )
+
+    input_file = sys.stdin if arguments.input == "-" else open(arguments.input, "r", encoding="utf-8")
+    output_file = sys.stdout if arguments.output == "-" else open(arguments.output, "w", encoding="utf-8")
+    try:
+        common_arguments = dict(
+            text_anonymizer=text_anonymizer,
+            lines=input_file,
+            language=arguments.language,
+            detect_language=arguments.detect_language,
+            fallback_language=arguments.fallback_language,
+            batch_size=arguments.batch_size,
+        )
+        if arguments.detect:
+            for record in detect_lines(**common_arguments):
+                output_file.write(json.dumps(record) + "\n")
+        else:
+            for line in anonymize_lines(
+                **common_arguments,
+                anonymize_complete_vin=arguments.anonymize_complete_vin,
+                technique=arguments.technique,
+            ):
+                output_file.write(line)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+
+if __name__ == "__main__":
+    main()
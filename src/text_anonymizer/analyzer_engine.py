@@ -0,0 +1,115 @@
+import json
+from typing import List, Optional
+
+import regex as re
+from presidio_analyzer import AnalyzerEngine, EntityRecognizer, RecognizerResult
+from presidio_analyzer.nlp_engine import NlpArtifacts
+
+from text_anonymizer.intervals import remove_duplicates
+from text_anonymizer.trigger_word_index import trigger_word_index_scope
+
+
+class CustomAnalyzerEngine(AnalyzerEngine):
+    """AnalyzerEngine of this library. Extends Presidio´s AnalyzerEngine by the removal of duplicate results in
+    O(n log n) instead of O(n²), which matters for texts with thousands of entities, and by sharing the trigger word
+    indexes of the text between the recognizers of one analysis."""
+
+    def analyze(
+        self,
+        text: str,
+        language: str,
+        entities: Optional[List[str]] = None,
+        correlation_id: Optional[str] = None,
+        score_threshold: Optional[float] = None,
+        return_decision_process: Optional[bool] = False,
+        ad_hoc_recognizers: Optional[List[EntityRecognizer]] = None,
+        context: Optional[List[str]] = None,
+        allow_list: Optional[List[str]] = None,
+        allow_list_match: Optional[str] = "exact",
+        regex_flags: Optional[int] = re.DOTALL | re.MULTILINE | re.IGNORECASE,
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> List[RecognizerResult]:
+        """
+        This is a hard copy of the analyze method of presidio's AnalyzerEngine.
+        The only changes are the removal of duplicates with intervals.remove_duplicates and the
+        trigger_word_index_scope around the calls of the recognizers.
+
+        Find PII entities in text using different PII recognizers for a given language.
+
+        :param text: the text to analyze
+        :param language: the language of the text
+        :param entities: List of PII entities that should be looked for in the text.
+        If entities=None then all entities are looked for.
+        :param correlation_id: cross call ID for this request
+        :param score_threshold: A minimum value for which
+        to return an identified entity
+        :param return_decision_process: Whether the analysis decision process steps
+        returned in the response.
+        :param ad_hoc_recognizers: List of recognizers which will be used only
+        for this specific request.
+        :param context: List of context words to enhance confidence score if matched
+        with the recognized entity's recognizer context
+        :param allow_list: List of words that the user defines as being allowed to keep
+        in the text
+        :param allow_list_match: How the allow_list should be interpreted; either as "exact" or as "regex".
+        :param regex_flags: regex flags to be used for when allow_list_match is "regex"
+        :param nlp_artifacts: precomputed NlpArtifacts
+        :return: an array of the found entities in the text
+        """
+        all_fields = not entities
+
+        recognizers = self.registry.get_recognizers(
+            language=language,
+            entities=entities,
+            all_fields=all_fields,
+            ad_hoc_recognizers=ad_hoc_recognizers,
+        )
+
+        if all_fields:
+            # Since all_fields=True, list all entities by iterating
+            # over all recognizers
+            entities = self.get_supported_entities(language=language)
+
+        # run the nlp pipeline over the given text, store the results in
+        # a NlpArtifacts instance
+        if not nlp_artifacts:
+            nlp_artifacts = self.nlp_engine.process_text(text, language)
+
+        if self.log_decision_process:
+            self.app_tracer.trace(correlation_id, "nlp artifacts:" + nlp_artifacts.to_json())
+
+        results = []
+        with trigger_word_index_scope():
+            for recognizer in recognizers:
+                # Lazy loading of the relevant recognizers
+                if not recognizer.is_loaded:
+                    recognizer.load()
+                    recognizer.is_loaded = True
+
+                # analyze using the current recognizer and append the results
+                current_results = recognizer.analyze(text=text, entities=entities, nlp_artifacts=nlp_artifacts)
+                if current_results:
+                    # add recognizer name to recognition metadata inside results
+                    # if not exists
+                    self._AnalyzerEngine__add_recognizer_id_if_not_exists(current_results, recognizer)
+                    results.extend(current_results)
+
+        results = self._enhance_using_context(text, results, nlp_artifacts, recognizers, context)
+
+        if self.log_decision_process:
+            self.app_tracer.trace(
+                correlation_id,
+                json.dumps([str(result.to_dict()) for result in results]),
+            )
+
+        # Remove duplicates or low score results
+        results = remove_duplicates(results)
+        results = self._AnalyzerEngine__remove_low_scores(results, score_threshold)
+
+        if allow_list:
+            results = self._remove_allow_list(results, allow_list, text, regex_flags, allow_list_match)
+
+        if not return_decision_process:
+            results = self._AnalyzerEngine__remove_decision_process(results)
+
+        return results
@@ -0,0 +1,44 @@
+from typing import List
+
+from presidio_anonymizer import AnonymizerEngine, ConflictResolutionStrategy
+from presidio_anonymizer.entities import RecognizerResult
+
+from text_anonymizer.intervals import group_intersecting
+
+
+class CustomAnonymizerEngine(AnonymizerEngine):
+    """AnonymizerEngine of this library. Extends Presidio´s AnonymizerEngine by resolving conflicts between results
+    only within groups of intersecting results, which matters for texts with thousands of entities."""
+
+    def _remove_conflicts_and_get_text_manipulation_data(
+        self,
+        analyzer_results: List[RecognizerResult],
+        conflict_resolution: ConflictResolutionStrategy,
+    ) -> List[RecognizerResult]:
+        """Resolve the conflicts between the given results like presidio's AnonymizerEngine.
+
+        Presidio compares every result with all other results. Since only intersecting results conflict, the results
+        are grouped by intersection with a sweep and presidio's conflict resolution is applied per group. The merged
+        results of a group stay inside the group, hence the outcome is the same as for all results at once.
+
+        Args:
+            analyzer_results (List[RecognizerResult]): The results to resolve the conflicts of.
+            conflict_resolution (ConflictResolutionStrategy): The strategy to resolve the conflicts.
+
+        Returns:
+            List[RecognizerResult]: The results without conflicts, in the same order as presidio returns them.
+        """
+        unique_results = []
+        for group in group_intersecting(analyzer_results):
+            unique_results.extend(
+                AnonymizerEngine._remove_conflicts_and_get_text_manipulation_data(
+                    self, [analyzer_results[i] for i in group], conflict_resolution
+                )
+            )
+
+        # Presidio sorts the results by start when removing intersections. The groups are already ordered by start.
+        if conflict_resolution == ConflictResolutionStrategy.REMOVE_INTERSECTIONS:
+            return unique_results
+        # Otherwise, presidio keeps the order of the given results.
+        unique_result_ids = {id(result) for result in unique_results}
+        return [result for result in analyzer_results if id(result) in unique_result_ids]
@@ -0,0 +1,245 @@
+import asyncio
+import functools
+import logging
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, List, Optional, Set, Tuple, Union
+
+from text_anonymizer import constants
+
+if TYPE_CHECKING:
+    from text_anonymizer.parallel import ParallelTextAnonymizer
+    from text_anonymizer.text_anonymizer import TextAnonymizer
+
+LOGGER = logging.getLogger(__name__)
+
+
+class _PendingBatch:
+    """Texts of concurrent requests with equal arguments, which are processed at once."""
+
+    def __init__(self, process_arguments: Dict):
+        self.process_arguments = process_arguments
+        self.texts: List[str] = []
+        self.futures: List[asyncio.Future] = []
+        self.flush_handle: Optional[asyncio.TimerHandle] = None
+
+
+class _LoopState:
+    """State of an AsyncTextAnonymizer that is bound to one event loop."""
+
+    def __init__(self, max_concurrency: int):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.pending_batches: Dict[Tuple, _PendingBatch] = {}
+        self.tasks: Set[asyncio.Task] = set()
+
+
+class AsyncTextAnonymizer:
+    """Process texts with a TextAnonymizer from asyncio code without blocking the event loop.
+
+    The processing is run on a thread pool. At most max_concurrency batches are processed at a time. Requests of the
+    process method that arrive within max_batch_delay seconds and have equal arguments are collected into one batch,
+    which runs the spaCy pipeline once for all texts. If a batch fails, its texts are processed one by one, so an error
+    only affects the request it belongs to.
+
+    Cancelling a request, which is still waiting for its batch to start, removes its text from the batch. Batches that
+    are processed already cannot be interrupted, their results are discarded.
+
+    In order to process texts on several processes, pass a ParallelTextAnonymizer and set max_concurrency to 1.
+    """
+
+    def __init__(
+        self,
+        text_anonymizer: Union["TextAnonymizer", "ParallelTextAnonymizer"],
+        max_concurrency: int = constants.DEFAULT_ASYNC_MAX_CONCURRENCY,
+        max_batch_size: int = constants.DEFAULT_BATCH_SIZE,
+        max_batch_delay: float = constants.DEFAULT_ASYNC_MAX_BATCH_DELAY,
+    ):
+        """Construct an asynchronous text anonymizer.
+
+        Args:
+            text_anonymizer (Union[TextAnonymizer, ParallelTextAnonymizer]): The text anonymizer used to process texts.
+            max_concurrency (int, optional): The maximum number of batches processed at a time. Equals the number of
+                threads used. Defaults to constants.DEFAULT_ASYNC_MAX_CONCURRENCY.
+            max_batch_size (int, optional): The maximum number of requests of the process method collected into one
+                batch. If set to 1, requests are not collected. Defaults to constants.DEFAULT_BATCH_SIZE.
+            max_batch_delay (float, optional): The maximum number of seconds a request of the process method waits for
+                further requests to collect. Defaults to constants.DEFAULT_ASYNC_MAX_BATCH_DELAY.
+        """
+        if max_concurrency < 1:
+            raise ValueError("Argument max_concurrency must be greater than zero. Given: {}.".format(max_concurrency))
+        if max_batch_size < 1:
+            raise ValueError("Argument max_batch_size must be greater than zero. Given: {}.".format(max_batch_size))
+        if max_batch_delay < 0:
+            raise ValueError("Argument max_batch_delay must not be negative. Given: {}.".format(max_batch_delay))
+
+        self.max_concurrency = max_concurrency
+        self.max_batch_size = max_batch_size
+        self.max_batch_delay = max_batch_delay
+        self._text_anonymizer = text_anonymizer
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="text_anonymizer")
+        self._loop_states: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+    def close(self) -> None:
+        """Stop the threads after all batches are processed."""
+        self._executor.shutdown(wait=True)
+
+    async def process(
+        self,
+        text: str,
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+    ) -> Dict:
+        """Process a text. Coroutine version of the process method of TextAnonymizer.
+
+        Args:
+            See the process method of TextAnonymizer.
+
+        Returns:
+            Dict: The result of the processing. See the process method of TextAnonymizer.
+        """
+        process_arguments = dict(
+            language=language,
+            detect_language=detect_language,
+            entities=entities,
+            regions=regions,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+        )
+        # Requests with equal arguments are collected into one batch. Lists are converted, since they are not hashable.
+        key = tuple(tuple(value) if isinstance(value, list) else value for value in process_arguments.values())
+
+        loop = asyncio.get_running_loop()
+        loop_state = self._get_loop_state(loop)
+        pending_batch = loop_state.pending_batches.get(key)
+        if pending_batch is None:
+            pending_batch = _PendingBatch(process_arguments)
+            loop_state.pending_batches[key] = pending_batch
+            pending_batch.flush_handle = loop.call_later(self.max_batch_delay, self._flush, loop_state, key)
+
+        future = loop.create_future()
+        pending_batch.texts.append(text)
+        pending_batch.futures.append(future)
+        if len(pending_batch.texts) >= self.max_batch_size:
+            self._flush(loop_state, key)
+
+        return await future
+
+    async def process_batch(
+        self,
+        texts: List[str],
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> List[Dict]:
+        """Process a batch of texts. Coroutine version of the process_batch method of TextAnonymizer.
+
+        Args:
+            See the process_batch method of TextAnonymizer.
+
+        Returns:
+            List[Dict]: The results of the processing in the order of the given texts.
+        """
+        loop = asyncio.get_running_loop()
+        async with self._get_loop_state(loop).semaphore:
+            return await loop.run_in_executor(
+                self._executor,
+                functools.partial(
+                    self._text_anonymizer.process_batch,
+                    texts=texts,
+                    language=language,
+                    detect_language=detect_language,
+                    entities=entities,
+                    regions=regions,
+                    anonymize=anonymize,
+                    anonymize_complete_vin=anonymize_complete_vin,
+                    technique=technique,
+                    detect=detect,
+                    batch_size=batch_size,
+                ),
+            )
+
+    def _get_loop_state(self, loop: asyncio.AbstractEventLoop) -> _LoopState:
+        # asyncio primitives like semaphores are bound to one event loop, hence the state is kept per event loop.
+        loop_state = self._loop_states.get(loop)
+        if loop_state is None:
+            loop_state = _LoopState(self.max_concurrency)
+            self._loop_states[loop] = loop_state
+        return loop_state
+
+    def _flush(self, loop_state: _LoopState, key: Tuple) -> None:
+        """Start processing the pending batch of the given key."""
+        pending_batch = loop_state.pending_batches.pop(key, None)
+        if pending_batch is None:
+            return
+        pending_batch.flush_handle.cancel()  # type: ignore
+
+        task = asyncio.ensure_future(self._process_pending_batch(loop_state, pending_batch))
+        # Keep a reference to the task until it is done, otherwise it might be garbage collected.
+        loop_state.tasks.add(task)
+        task.add_done_callback(loop_state.tasks.discard)
+
+    async def _process_pending_batch(self, loop_state: _LoopState, pending_batch: _PendingBatch) -> None:
+        async with loop_state.semaphore:
+            # Skip texts of cancelled requests.
+            requests = [
+                (text, future) for text, future in zip(pending_batch.texts, pending_batch.futures) if not future.done()
+            ]
+            if not requests:
+                return
+            texts = [text for text, _ in requests]
+            futures = [future for _, future in requests]
+
+            LOGGER.debug("Process batch of %s collected requests", len(texts))
+            loop = asyncio.get_running_loop()
+            try:
+                results = await loop.run_in_executor(
+                    self._executor,
+                    functools.partial(
+                        self._text_anonymizer.process_batch, texts=texts, **pending_batch.process_arguments
+                    ),
+                )
+            except Exception as error:
+                if len(texts) == 1:
+                    self._set_exception(futures[0], error)
+                    return
+                # Process the texts one by one, so only the requests causing the error fail.
+                for text, future in requests:
+                    try:
+                        result = await loop.run_in_executor(
+                            self._executor,
+                            functools.partial(
+                                self._text_anonymizer.process_batch, texts=[text], **pending_batch.process_arguments
+                            ),
+                        )
+                    except Exception as text_error:
+                        self._set_exception(future, text_error)
+                    else:
+                        self._set_result(future, result[0])
+                return
+
+            for future, result in zip(futures, results):
+                self._set_result(future, result)
+
+    @staticmethod
+    def _set_result(future: asyncio.Future, result: Dict) -> None:
+        if not future.done():
+            future.set_result(result)
+
+    @staticmethod
+    def _set_exception(future: asyncio.Future, error: Exception) -> None:
+        if not future.done():
+            future.set_exception(error)
@@ -0,0 +1,258 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import sys
+import threading
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Tuple
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _create_digest(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", errors="surrogatepass"), digest_size=16).digest()
+
+
+class ResultCache:
+    """Thread-safe least recently used (LRU) cache for the results of the process method of TextAnonymizer.
+
+    Results are stored under a digest of the text and the processing configuration. The texts themselves are not
+    stored. If the maximum number of entries or the maximum memory is exceeded, the least recently used results are
+    removed. The memory of a result is estimated with sys.getsizeof.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_memory: Optional[int] = None,
+        persistent_cache: Optional["PersistentResultCache"] = None,
+    ):
+        """Construct a result cache.
+
+        Args:
+            max_entries (int): The maximum number of cached results. Must be greater than zero.
+            max_memory (Optional[int], optional): The maximum estimated memory of all cached results in bytes. If set to
+                'None' only the number of entries is limited. Defaults to None.
+            persistent_cache (Optional[PersistentResultCache], optional): A persistent cache, which is looked up for
+                results missing in memory and which all results are written to as well. Defaults to None.
+        """
+        if max_entries < 1:
+            raise ValueError("Argument max_entries must be greater than zero. Given: {}.".format(max_entries))
+        if max_memory is not None and max_memory < 1:
+            raise ValueError("Argument max_memory must be greater than zero. Given: {}.".format(max_memory))
+
+        self.max_entries = max_entries
+        self.max_memory = max_memory
+        self.persistent_cache = persistent_cache
+        self._entries: OrderedDict[Tuple, Tuple[Dict, int]] = OrderedDict()
+        self._memory = 0
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def create_key(text: str, configuration: Tuple[Hashable, ...]) -> Tuple:
+        """Create the key of a text and the configuration it is processed with."""
+        return _create_digest(text), configuration
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """Returns a copy of the result cached under the given key or None, if there is none."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._hits += 1
+        if entry is not None:
+            return self.copy_result(entry[0])
+
+        result = self.persistent_cache.get(key) if self.persistent_cache is not None else None
+        with self._lock:
+            if result is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        self._put_in_memory(key, result)
+        return result
+
+    def put(self, key: Tuple, result: Dict) -> None:
+        """Cache a copy of the given result under the given key."""
+        self._put_in_memory(key, result)
+        if self.persistent_cache is not None:
+            self.persistent_cache.put(key, result)
+
+    def _put_in_memory(self, key: Tuple, result: Dict) -> None:
+        size = self._estimate_size(result)
+        if self.max_memory is not None and size > self.max_memory:
+            return
+
+        result = self.copy_result(result)
+        with self._lock:
+            previous_entry = self._entries.pop(key, None)
+            if previous_entry is not None:
+                self._memory -= previous_entry[1]
+            self._entries[key] = (result, size)
+            self._memory += size
+
+            while len(self._entries) > self.max_entries or (
+                self.max_memory is not None and self._memory > self.max_memory
+            ):
+                _, (_, removed_size) = self._entries.popitem(last=False)
+                self._memory -= removed_size
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the counters."""
+        if self.persistent_cache is not None:
+            self.persistent_cache.clear()
+        with self._lock:
+            self._entries.clear()
+            self._memory = 0
+            self._hits = 0
+            self._misses = 0
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Returns the number of hits, misses and entries and the estimated memory of the cache in bytes."""
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "entries": len(self._entries),
+                "memory": self._memory,
+            }
+
+    @staticmethod
+    def copy_result(result: Dict) -> Dict:
+        """Returns a copy of a result. Callers may modify returned results, hence cached results are never handed
+        out."""
+        return {
+            key: [dict(entity) for entity in value] if isinstance(value, list) else value
+            for key, value in result.items()
+        }
+
+    @staticmethod
+    def _estimate_size(result: Dict) -> int:
+        size = sys.getsizeof(result)
+        for value in result.values():
+            size += sys.getsizeof(value)
+            if isinstance(value, list):
+                size += sum([sys.getsizeof(entity) for entity in value])
+        return size
+
+
+class PersistentResultCache:
+    """Result cache stored in a SQLite database file, which keeps results across processes and runs.
+
+    Results are stored as JSON under a digest of the text and the processing configuration together with a
+    fingerprint of the text anonymizer, e.g. its version, recognizers and spaCy models. Results of text anonymizers with
+    a different fingerprint are never returned. Results stored by other versions of the library are kept until they are
+    removed with the prune method, since installations of different versions may share the file. Several processes may
+    use the same file at once.
+    """
+
+    def __init__(self, path: str, fingerprint: str, version: str):
+        """Construct a persistent result cache.
+
+        Args:
+            path (str): The path of the SQLite database file. It is created if it does not exist.
+            fingerprint (str): The fingerprint of the configuration that determines the results.
+            version (str): The version of the library.
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+        self.version = version
+        self._hits = 0
+        self._misses = 0
+        self._lock = threading.Lock()
+        self._connection: Optional[sqlite3.Connection] = None
+        self._connection_pid: Optional[int] = None
+
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS results "
+                    "(version TEXT, fingerprint TEXT, key TEXT, result TEXT, PRIMARY KEY (fingerprint, key))"
+                )
+
+    @staticmethod
+    def create_key(text: str, configuration: Tuple[Hashable, ...]) -> Tuple:
+        """Create the key of a text and the configuration it is processed with."""
+        return ResultCache.create_key(text, configuration)
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """Returns the result stored under the given key or None, if there is none."""
+        with self._lock:
+            row = (
+                self._get_connection()
+                .execute(
+                    "SELECT result FROM results WHERE fingerprint = ? AND key = ?",
+                    (self.fingerprint, self._serialize_key(key)),
+                )
+                .fetchone()
+            )
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+        return json.loads(row[0])
+
+    def put(self, key: Tuple, result: Dict) -> None:
+        """Store the given result under the given key."""
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute(
+                    "INSERT OR REPLACE INTO results (version, fingerprint, key, result) VALUES (?, ?, ?, ?)",
+                    (self.version, self.fingerprint, self._serialize_key(key), json.dumps(result)),
+                )
+
+    def clear(self) -> None:
+        """Remove all results of the fingerprint and reset the counters."""
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                connection.execute("DELETE FROM results WHERE fingerprint = ?", (self.fingerprint,))
+            self._hits = 0
+            self._misses = 0
+
+    def prune(self) -> int:
+        """Remove all results stored by other versions of the library and return their number. Installations of other
+        versions sharing the file lose their results."""
+        with self._lock:
+            connection = self._get_connection()
+            with connection:
+                removed_rows = connection.execute("DELETE FROM results WHERE version != ?", (self.version,)).rowcount
+        LOGGER.info("Removed %s results of other versions from the persistent cache", removed_rows)
+        return removed_rows
+
+    def get_statistics(self) -> Dict[str, int]:
+        """Returns the number of hits, misses and entries of the fingerprint."""
+        with self._lock:
+            entries = (
+                self._get_connection()
+                .execute("SELECT COUNT(*) FROM results WHERE fingerprint = ?", (self.fingerprint,))
+                .fetchone()[0]
+            )
+            return {"hits": self._hits, "misses": self._misses, "entries": entries}
+
+    def close(self) -> None:
+        """Close the connection to the database. It is opened again on next use."""
+        with self._lock:
+            if self._connection is not None and self._connection_pid == os.getpid():
+                self._connection.close()
+            self._connection = None
+
+    def _get_connection(self) -> sqlite3.Connection:
+        # SQLite connections must not be used after a fork, hence forked processes open their own connection.
+        if self._connection is None or self._connection_pid != os.getpid():
+            self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection_pid = os.getpid()
+        return self._connection
+
+    @staticmethod
+    def _serialize_key(key: Tuple) -> str:
+        digest, configuration = key
+        return "{}:{}".format(digest.hex(), _create_digest(repr(configuration)).hex())
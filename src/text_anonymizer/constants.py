@@ -1,7 +1,6 @@
 from typing import Any
 
 from lingua import Language
-from presidio_anonymizer.entities import OperatorConfig
 
 #################
 # language codes (ISO_639-1)
@@ -91,24 +90,50 @@ PERFORMANCE_IMPROVEMENT_LINGUA_LANGUAGES = (
     Language.SWEDISH,
 )
 LINGUA_LANGUAGES_FOR_DETECTION = SUPPORTED_LINGUA_LANGUAGES + PERFORMANCE_IMPROVEMENT_LINGUA_LANGUAGES
+# Minimum relative distance between the two most likely languages for a detection to be considered confident.
+LANGUAGE_DETECTION_PROBABILITY_DISTANCE = 0.2
 
 
 #################
 # presidio anonymizer operators
 #################
-PRESIDIO_ANONYMIZER_OPERATORS = {
-    TECHNIQUE_REDACT: {"DEFAULT": OperatorConfig(operator_name="redact")},
-    TECHNIQUE_REPLACE: {"DEFAULT": OperatorConfig(operator_name="replace")},
-}
+# PRESIDIO_ANONYMIZER_OPERATORS is created on first access by __getattr__ at the end of this module, since importing
+# presidio_anonymizer takes long.
 
 #################
 # nlp engine
 #################
-# TODO: Find more appropriate way to save nlp-config values than in constants.py
+# Presets of spaCy models that trade the accuracy of the NER based recognizers against speed.
+# Since there are no transformer pipelines with NER for German and Spanish, the accurate preset uses the large models.
+# A preset and single models can be chosen when constructing a TextAnonymizer instance.
+MODEL_PRESET_FAST = "fast"
+MODEL_PRESET_BALANCED = "balanced"
+MODEL_PRESET_ACCURATE = "accurate"
+
+NLP_MODEL_PRESETS = {
+    MODEL_PRESET_FAST: {
+        LANGUAGE_CODE_DE: "de_core_news_sm",
+        LANGUAGE_CODE_EN: "en_core_web_sm",
+        LANGUAGE_CODE_ES: "es_core_news_sm",
+    },
+    MODEL_PRESET_BALANCED: {
+        LANGUAGE_CODE_DE: "de_core_news_lg",
+        LANGUAGE_CODE_EN: "en_core_web_lg",
+        LANGUAGE_CODE_ES: "es_core_news_lg",
+    },
+    MODEL_PRESET_ACCURATE: {
+        LANGUAGE_CODE_DE: "de_core_news_lg",
+        LANGUAGE_CODE_EN: "en_core_web_trf",
+        LANGUAGE_CODE_ES: "es_core_news_lg",
+    },
+}
+AVAILABLE_MODEL_PRESETS = list(NLP_MODEL_PRESETS.keys())
+
+# Models used if neither a preset nor single models are chosen.
+DEFAULT_MODEL_PRESET = MODEL_PRESET_ACCURATE
 NLP_MODELS_CONFIGS = [
-    {"lang_code": "de", "model_name": "de_core_news_lg"},
-    {"lang_code": "en", "model_name": "en_core_web_trf"},
-    {"lang_code": "es", "model_name": "es_core_news_lg"},
+    {"lang_code": lang_code, "model_name": model_name}
+    for lang_code, model_name in NLP_MODEL_PRESETS[DEFAULT_MODEL_PRESET].items()
 ]
 
 NER_MODEL_CONFIGURATION = {
@@ -134,9 +159,65 @@ NLP_ENGINE_CONFIGURATION: dict[str, str | list[dict[str, str]] | dict[str, Any]]
     "ner_model_configuration": NER_MODEL_CONFIGURATION,
 }
 
+# Attributes of spaCy tokens and docs that recognizers can require.
+SPACY_ATTRIBUTE_DEP = "DEP"
+SPACY_ATTRIBUTE_ENT = "ENT"
+SPACY_ATTRIBUTE_LEMMA = "LEMMA"
+SPACY_ATTRIBUTE_POS = "POS"
+SPACY_ATTRIBUTE_SENT = "SENT"
+
+# Components of the spaCy pipelines that set the attributes above. Components that are not required by any of the
+# recognizers are excluded when loading a model. Components not listed here, e.g. the shared tok2vec or transformer
+# layers, are always loaded.
+SPACY_COMPONENTS_BY_ATTRIBUTE = {
+    SPACY_ATTRIBUTE_DEP: ["parser"],
+    SPACY_ATTRIBUTE_ENT: ["ner", "entity_ruler"],
+    SPACY_ATTRIBUTE_LEMMA: ["tagger", "morphologizer", "attribute_ruler", "lemmatizer"],
+    SPACY_ATTRIBUTE_POS: ["tagger", "morphologizer", "attribute_ruler"],
+    SPACY_ATTRIBUTE_SENT: ["parser", "senter", "sentencizer"],
+}
+
+# Number of texts the nlp engine processes at once during batch processing.
+DEFAULT_BATCH_SIZE = 64
+
+# Maximum number of batches an AsyncTextAnonymizer processes at a time.
+DEFAULT_ASYNC_MAX_CONCURRENCY = 4
+# Maximum number of seconds a request of an AsyncTextAnonymizer waits for further requests to process them at once.
+DEFAULT_ASYNC_MAX_BATCH_DELAY = 0.005
+
+# Number of times the worker processes of a ParallelTextAnonymizer are started again during one call, if a worker dies.
+DEFAULT_MAX_WORKER_RESTARTS = 3
+
+# Number of characters consecutive chunks of a long text share. Entities up to this length are found completely in at
+# least one chunk.
+DEFAULT_CHUNK_OVERLAP = 200
+# Separators at which long texts are split into chunks, in the order of preference: lines, sentences and words.
+CHUNK_SEPARATORS = [["\n"], [". ", "! ", "? "], [" ", "\t"]]
+
+# Number of characters an address is assumed to have at most. Address recognizers only search for addresses in windows
+# of this size around their anchors.
+ADDRESS_MAX_MATCH_LENGTH = 200
+# Number of characters a person found by the patterns of the pattern based person recognizer is assumed to have at most.
+PERSON_MAX_MATCH_LENGTH = 200
+
+# Name of the distribution of this library. Its version is part of the fingerprint of persistent result caches.
+DISTRIBUTION_NAME = "i3-anonymate"
 #################
 # recognizer
 #################
 DEFAULT_RECOGNIZER_RESULT_SCORE = 0.5
 # Set POSSIBLE_REGIONS to this value if the entities the recognizer supports are valid globally and a regional distinction is not desired.
 VALID_GLOBALLY = "VALID_GLOBALLY"
+
+
+def __getattr__(name: str) -> Any:
+    """Creates the constants that require slow imports on first access (PEP 562)."""
+    if name == "PRESIDIO_ANONYMIZER_OPERATORS":
+        from presidio_anonymizer.entities import OperatorConfig
+
+        globals()[name] = {
+            TECHNIQUE_REDACT: {"DEFAULT": OperatorConfig(operator_name="redact")},
+            TECHNIQUE_REPLACE: {"DEFAULT": OperatorConfig(operator_name="replace")},
+        }
+        return globals()[name]
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
@@ -1,8 +1,11 @@
+import functools
 import logging.config
 import os
 from pathlib import Path
+from typing import Any
 
-import yaml
+# File listing the recognizers to log debugging texts for. It is read on first use instead of at import.
+SPECIFIC_RECOGNIZERS_PATH = Path(__file__).parent.resolve() / "recognizers" / "specific_recognizer_logging.yaml"
 
 
 def setup_logging():
@@ -13,12 +16,22 @@ def setup_logging():
 
 
 def load_specific_recognizers_set(file_path: str | Path) -> set[str]:
+    import yaml
+
     with open(file_path, "r") as file:
         specific_recognizers = yaml.safe_load(file)["specific_recognizers"] or []
         specific_recognizers = set(specific_recognizers)
     return specific_recognizers
 
 
-SPECIFIC_RECOGNIZERS = load_specific_recognizers_set(
-    Path(__file__).parent.resolve() / "recognizers" / "specific_recognizer_logging.yaml"
-)
+@functools.lru_cache(maxsize=None)
+def get_specific_recognizers() -> set[str]:
+    """Returns the recognizers listed in the file SPECIFIC_RECOGNIZERS_PATH. The file is read on the first call."""
+    return load_specific_recognizers_set(SPECIFIC_RECOGNIZERS_PATH)
+
+
+def __getattr__(name: str) -> Any:
+    """Reads SPECIFIC_RECOGNIZERS on first access instead of at import (PEP 562)."""
+    if name == "SPECIFIC_RECOGNIZERS":
+        return get_specific_recognizers()
+    raise AttributeError("module {!r} has no attribute {!r}".format(__name__, name))
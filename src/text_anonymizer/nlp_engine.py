@@ -0,0 +1,172 @@
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+import spacy
+from presidio_analyzer.nlp_engine import (
+    NerModelConfiguration,
+    NlpArtifacts,
+    SpacyNlpEngine,
+)
+from spacy.language import Language
+from spacy.tokenizer import Tokenizer
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CustomSpacyNlpEngine(SpacyNlpEngine):
+    """SpacyNlpEngine of this library. Extends Presidio´s SpacyNlpEngine by batch processing on multiple processes,
+    by lazy loading of the spaCy models and by tokenization without running the spaCy pipeline.
+
+    Components listed in excluded_components are not loaded, if a model contains them.
+
+    If lazy_loading is set to True, the load method does not load any spaCy model. Instead, the model of a language is
+    loaded the first time the language is requested, e.g. by process_text. Use load_language to load a model in
+    advance.
+    """
+
+    def __init__(
+        self,
+        models: Optional[List[Dict[str, str]]] = None,
+        ner_model_configuration: Optional[NerModelConfiguration] = None,
+        lazy_loading: bool = False,
+        excluded_components: Optional[List[str]] = None,
+    ):
+        SpacyNlpEngine.__init__(self, models=models, ner_model_configuration=ner_model_configuration)
+        self.lazy_loading = lazy_loading
+        self.excluded_components = excluded_components if excluded_components is not None else []
+        self._load_lock = threading.Lock()
+        self._tokenizers: Dict[str, Tokenizer] = {}
+
+    def load(self) -> None:
+        """Load the spaCy models of all configured languages. If lazy_loading is set to True, no model is loaded."""
+        self.nlp = {}
+        if self.lazy_loading:
+            LOGGER.info("Lazy loading of spaCy models enabled. Configured models: %s", self.models)
+            return
+
+        for model in self.models:
+            self.load_language(model["lang_code"])
+
+    def load_language(self, language: str) -> None:
+        """Load the spaCy model of the given language, if it is not loaded yet.
+
+        Args:
+            language (str): The language whose model should be loaded.
+
+        Raises:
+            ValueError: If no model is configured for the language.
+        """
+        if self.nlp is None:
+            raise ValueError("NLP engine is not loaded. Consider calling .load()")
+        if language in self.nlp:
+            return
+
+        with self._load_lock:
+            if language in self.nlp:
+                return
+
+            model = self._get_model_configuration(language)
+            self._validate_model_params(model)
+            self._download_spacy_model_if_needed(model["model_name"])
+            LOGGER.info(
+                "Loading spaCy model '%s' for language '%s' without components %s",
+                model["model_name"],
+                language,
+                self.excluded_components,
+            )
+            nlp = spacy.load(model["model_name"], exclude=self.excluded_components)
+
+            # Replace the dictionary instead of updating it, so concurrent readers never see a partial update.
+            self.nlp = {**self.nlp, language: nlp}
+
+    def _get_model_configuration(self, language: str) -> Dict[str, str]:
+        for model in self.models:
+            if model.get("lang_code") == language:
+                return model
+        raise ValueError(
+            "No spaCy model is configured for language '{}'. Configured models: {}".format(language, self.models)
+        )
+
+    def get_nlp(self, language: str) -> Language:
+        """Return the spaCy model of the given language. Loads the model, if it is not loaded yet."""
+        self.load_language(language)
+        return self.nlp[language]  # type: ignore
+
+    def get_supported_languages(self) -> List[str]:
+        """Return the languages of all configured models, regardless of whether they are loaded yet."""
+        if self.nlp is None:
+            raise ValueError("NLP engine is not loaded. Consider calling .load()")
+        return [model["lang_code"] for model in self.models]
+
+    def process_text(self, text: str, language: str) -> NlpArtifacts:
+        """Execute the spaCy pipeline on the given text and language."""
+        doc = self.get_nlp(language)(text)
+        return self._doc_to_nlp_artifact(doc, language)
+
+    def tokenize_text(self, text: str, language: str) -> NlpArtifacts:
+        """Tokenize the given text without running the spaCy pipeline.
+
+        A blank spaCy pipeline of the language is used for tokenization. Hence, no model needs to be loaded and the
+        resulting NlpArtifacts contain tokens only, i.e. no entities and no lemmas. Use it for recognizers that do not
+        rely on the output of the spaCy pipeline.
+        """
+        doc = self._get_tokenizer(language)(text)
+        # Keywords are not extracted, since this requires the vocabulary of the spaCy model and lemmas are empty anyway.
+        nlp_artifacts = NlpArtifacts(
+            entities=[],
+            tokens=doc,
+            tokens_indices=[token.idx for token in doc],
+            lemmas=[token.lemma_ for token in doc],
+            nlp_engine=None,
+            language=language,
+        )
+        nlp_artifacts.nlp_engine = self
+        return nlp_artifacts
+
+    def _get_tokenizer(self, language: str) -> Tokenizer:
+        tokenizer = self._tokenizers.get(language)
+        if tokenizer is None:
+            with self._load_lock:
+                tokenizer = self._tokenizers.get(language)
+                if tokenizer is None:
+                    tokenizer = spacy.blank(language).tokenizer
+                    self._tokenizers = {**self._tokenizers, language: tokenizer}
+        return tokenizer
+
+    def process_batch(
+        self,
+        texts: Iterable[str],
+        language: str,
+        batch_size: Optional[int] = None,
+        as_tuples: bool = False,
+        n_process: int = 1,
+    ) -> Iterator[Tuple[str, NlpArtifacts]]:
+        """
+        This is a hard copy of the process_batch method of presidio's SpacyNlpEngine.
+        The only changes are the addition of the n_process argument, which is passed to spaCy's pipe method,
+        and the lazy loading of the spaCy model.
+
+        Execute the NLP pipeline on a batch of texts using spaCy's pipe method.
+
+        :param texts: A list of texts to process.
+        :param language: The language of the texts.
+        :param batch_size: The number of texts spaCy buffers per batch.
+        :param as_tuples: If set to True, inputs should be a sequence of (text, context) tuples.
+        :param n_process: The number of processes spaCy uses to process the texts.
+        :return: A generator of (text, NlpArtifacts) tuples in the order of the given texts.
+        """
+        nlp = self.get_nlp(language)
+
+        texts = (str(text) for text in texts)
+        docs = nlp.pipe(texts, as_tuples=as_tuples, batch_size=batch_size, n_process=n_process)
+        for doc in docs:
+            yield doc.text, self._doc_to_nlp_artifact(doc, language)
+
+    def is_stopword(self, word: str, language: str) -> bool:
+        """Return true if the given word is a stop word within the given language."""
+        return self.get_nlp(language).vocab[word].is_stop
+
+    def is_punct(self, word: str, language: str) -> bool:
+        """Return true if the given word is a punctuation word within the given language."""
+        return self.get_nlp(language).vocab[word].is_punct
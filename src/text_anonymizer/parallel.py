@@ -0,0 +1,210 @@
+import logging
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import TYPE_CHECKING, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from text_anonymizer import constants
+from text_anonymizer.utils import chunk_iterable
+
+if TYPE_CHECKING:
+    from text_anonymizer.text_anonymizer import TextAnonymizer
+
+LOGGER = logging.getLogger(__name__)
+
+# The text anonymizer of a worker process. It is inherited from the parent process when the worker is forked.
+_WORKER_TEXT_ANONYMIZER: Optional["TextAnonymizer"] = None
+
+
+def _initialize_worker(text_anonymizer: "TextAnonymizer") -> None:
+    global _WORKER_TEXT_ANONYMIZER
+    _WORKER_TEXT_ANONYMIZER = text_anonymizer
+
+
+def _process_chunk(texts: List[str], process_arguments: Dict) -> List[Dict]:
+    return _WORKER_TEXT_ANONYMIZER.process_batch(texts=texts, **process_arguments)  # type: ignore
+
+
+class ParallelTextAnonymizer:
+    """Process texts with a TextAnonymizer on several worker processes.
+
+    The worker processes are forked from the process the ParallelTextAnonymizer is created in. Hence, the text
+    anonymizer, including its spaCy models and recognizers, is built once and shared copy-on-write by all workers
+    instead of being loaded once per worker. Texts are handed out to the workers in chunks of batch_size texts and the
+    results are returned in the order of the texts. If a worker process dies, e.g. because it was killed for using too
+    much memory, the workers are started again and the unfinished chunks are processed again.
+
+    Since the workers are forked, this class is only available on platforms supporting the 'fork' start method of
+    multiprocessing, i.e. not on Windows. An instance should be used by one thread at a time. Call close or use the
+    instance as a context manager to stop the workers.
+    """
+
+    def __init__(
+        self,
+        text_anonymizer: "TextAnonymizer",
+        n_workers: Optional[int] = None,
+        preload_models: bool = True,
+        max_restarts: int = constants.DEFAULT_MAX_WORKER_RESTARTS,
+    ):
+        """Construct a parallel text anonymizer.
+
+        Args:
+            text_anonymizer (TextAnonymizer): The text anonymizer used by the workers.
+            n_workers (Optional[int], optional): The number of worker processes. If set to 'None' one worker per CPU
+                is started. Defaults to None.
+            preload_models (bool, optional): Determines whether the spaCy models of all supported languages are loaded
+                before the workers are forked, so they are shared by all workers. If set to 'False' models that are not
+                loaded yet are loaded by each worker on first use. Defaults to True.
+            max_restarts (int, optional): The number of times the workers are started again during one call, if a
+                worker process dies. Defaults to constants.DEFAULT_MAX_WORKER_RESTARTS.
+        """
+        if "fork" not in multiprocessing.get_all_start_methods():
+            raise RuntimeError("A ParallelTextAnonymizer requires the 'fork' start method, which is not available.")
+        if n_workers is None:
+            n_workers = os.cpu_count() or 1
+        if n_workers < 1:
+            raise ValueError("Argument n_workers must be greater than zero. Given: {}.".format(n_workers))
+        if max_restarts < 0:
+            raise ValueError("Argument max_restarts must not be negative. Given: {}.".format(max_restarts))
+
+        if preload_models:
+            text_anonymizer.preload()
+
+        self.n_workers = n_workers
+        self.max_restarts = max_restarts
+        self._text_anonymizer = text_anonymizer
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> "ParallelTextAnonymizer":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Stop the worker processes. They are started again if texts are processed afterwards."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+
+    def process_batch(
+        self,
+        texts: List[str],
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> List[Dict]:
+        """Process a batch of texts on the worker processes.
+
+        Args:
+            See the process_batch method of TextAnonymizer. batch_size is also the number of texts handed out to a
+            worker at once.
+
+        Returns:
+            List[Dict]: The results of the processing in the order of the given texts.
+        """
+        return list(
+            self.process_iterator(
+                texts=texts,
+                language=language,
+                detect_language=detect_language,
+                entities=entities,
+                regions=regions,
+                anonymize=anonymize,
+                anonymize_complete_vin=anonymize_complete_vin,
+                technique=technique,
+                detect=detect,
+                batch_size=batch_size,
+            )
+        )
+
+    def process_iterator(
+        self,
+        texts: Iterable[str],
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> Iterator[Dict]:
+        """Lazily process an iterable of texts on the worker processes. Generator version of the process_batch method.
+
+        At most two chunks per worker are processed or waiting to be processed at a time. Hence, memory usage is
+        bounded, no matter how many texts are given.
+
+        Args:
+            See the process_batch method.
+
+        Returns:
+            Iterator[Dict]: The results of the processing in the order of the given texts.
+        """
+        process_arguments = dict(
+            language=language,
+            detect_language=detect_language,
+            entities=entities,
+            regions=regions,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+            batch_size=batch_size,
+        )
+        restarts = 0
+        pending_chunks: Deque[Tuple[List[str], Future]] = deque()
+
+        for chunk in chunk_iterable(texts, chunk_size=batch_size):
+            pending_chunks.append((chunk, self._submit(chunk, process_arguments)))
+            if len(pending_chunks) < 2 * self.n_workers:
+                continue
+            results, restarts = self._get_first_results(pending_chunks, process_arguments, restarts)
+            yield from results
+
+        while pending_chunks:
+            results, restarts = self._get_first_results(pending_chunks, process_arguments, restarts)
+            yield from results
+
+    def _submit(self, chunk: List[str], process_arguments: Dict) -> Future:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.n_workers,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_initialize_worker,
+                initargs=(self._text_anonymizer,),
+            )
+        return self._executor.submit(_process_chunk, chunk, process_arguments)
+
+    def _get_first_results(
+        self, pending_chunks: Deque[Tuple[List[str], Future]], process_arguments: Dict, restarts: int
+    ) -> Tuple[List[Dict], int]:
+        """Wait for the results of the first pending chunk. If a worker died, the workers are started again and all
+        pending chunks are submitted again."""
+        while True:
+            try:
+                results = pending_chunks[0][1].result()
+            except BrokenProcessPool:
+                if restarts >= self.max_restarts:
+                    LOGGER.error("A worker process died. Maximum number of %s restarts reached", self.max_restarts)
+                    self.close()
+                    raise
+                restarts += 1
+                LOGGER.warning("A worker process died. Restart workers (%s/%s)", restarts, self.max_restarts)
+                self._executor.shutdown(wait=True, cancel_futures=True)  # type: ignore
+                self._executor = None
+                for i, (chunk, _) in enumerate(pending_chunks):
+                    pending_chunks[i] = (chunk, self._submit(chunk, process_arguments))
+                continue
+
+            pending_chunks.popleft()
+            return results, restarts
@@ -1,11 +1,18 @@
 import logging
-from typing import List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 
 import regex as re
 from presidio_analyzer import EntityRecognizer, PatternRecognizer, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
-from text_anonymizer.utils import debug_logging
+from text_anonymizer import constants
+from text_anonymizer.intervals import remove_duplicates
+from text_anonymizer.trigger_word_index import (
+    ALL_TRIGGER_WORDS,
+    get_trigger_word_index,
+    trigger_word_index_scope,
+)
+from text_anonymizer.utils import compile_regex, debug_logging, is_debug_logging_enabled
 
 LOGGER = logging.getLogger(__name__)
 
@@ -31,12 +38,36 @@ class CustomRecognizerMixin:
     POSSIBLE_ENTITIES = []
     POSSIBLE_REGIONS = []
 
+    # Overwrite this class variable in a derived class, if the recognizer uses the output of the spaCy pipeline, e.g. the named entities, passed as nlp_artifacts to its analyze method.
+    # If none of the selected recognizers requires nlp_artifacts, the spaCy pipeline is skipped and the text is only tokenized.
+    REQUIRES_NLP_ARTIFACTS = False
+
+    # Overwrite this class variable in a derived class with the spaCy attributes (see constants.SPACY_ATTRIBUTE_*) the recognizer reads from the nlp_artifacts.
+    # Components of the spaCy pipelines that set none of the attributes required by the recognizers are not loaded.
+    REQUIRED_SPACY_ATTRIBUTES: List[str] = []
+
     def __init__(self, supported_regions: List[str]):
         self.supported_regions = supported_regions
 
     def get_supported_regions(self) -> List[str]:
         return self.supported_regions
 
+    def requires_nlp_artifacts(self) -> bool:
+        """
+        Returns True, when the recognizer uses the output of the spaCy pipeline.
+        This is the case if REQUIRES_NLP_ARTIFACTS is set or if the recognizer has context words, since Presidio´s context enhancement reads the lemmas of the text.
+        """
+        return self.REQUIRES_NLP_ARTIFACTS or bool(getattr(self, "context", None))
+
+    def get_required_spacy_attributes(self) -> List[str]:
+        """
+        Returns the spaCy attributes the recognizer reads from the nlp_artifacts.
+        Lemmas are added if the recognizer has context words, since Presidio´s context enhancement reads them.
+        """
+        if getattr(self, "context", None):
+            return self.REQUIRED_SPACY_ATTRIBUTES + [constants.SPACY_ATTRIBUTE_LEMMA]
+        return self.REQUIRED_SPACY_ATTRIBUTES
+
     @classmethod
     def get_possible_languages(cls) -> Union[List[str], None]:
         return cls.POSSIBLE_LANGUAGES
@@ -72,6 +103,27 @@ class CustomRecognizerMixin:
 class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
     """Base class for pattern recognizers of this library."""
 
+    # Number of characters before and after a match, in which one of the trigger words of the recognizer has to occur.
+    TRIGGER_WORD_WINDOW_CHARS_BEFORE = 100
+    TRIGGER_WORD_WINDOW_CHARS_AFTER = 50
+
+    # Overwrite this class variable in a derived class with trigger words or an anchor regex with the maximum number of
+    # characters a match of its patterns can have, to enable trigger-first or anchor-first matching.
+    # The trigger words are located first and the patterns are only evaluated in the windows around them. If the text
+    # contains no trigger words, the patterns are not evaluated at all.
+    MAX_MATCH_LENGTH: Optional[int] = None
+
+    # Overwrite this class variable in a derived class with a cheap regex, which matches at most MAX_MATCH_LENGTH
+    # characters before or after the start of every match of its patterns, e.g. inside the street of an address or at
+    # the greeting before a name, to enable anchor-first matching together with MAX_MATCH_LENGTH.
+    # The anchors are located first and the patterns are only evaluated in the windows around them. If the text
+    # contains no anchors, the patterns are not evaluated at all.
+    ANCHOR_REGEX: Optional[str] = None
+
+    # Overwrite this class variable in a derived class to use different anchors for some of its patterns. It maps the
+    # names of patterns to their anchor regexes. Patterns not contained use ANCHOR_REGEX.
+    PATTERN_ANCHOR_REGEXES: Dict[str, str] = {}
+
     def __init__(
         self,
         supported_language,
@@ -90,14 +142,17 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
         )
         CustomRecognizerMixin.__init__(self, supported_regions=supported_regions)
         self.words_to_remove_from_match = words_to_remove_from_match
+        # Regexes are compiled once per word and shared by all recognizers.
         self.words_to_remove_from_match_regexes = [
-            r"\b" + re.escape(word) + r"\b" for word in words_to_remove_from_match
-        ]
-        self.words_to_remove_from_match_regexes = [
-            r"\b" + re.escape(word) + r"\b" for word in words_to_remove_from_match
+            compile_regex(r"\b" + re.escape(word) + r"\b") for word in words_to_remove_from_match
         ]
         self.trigger_words = trigger_words
-        self.trigger_words_regexes = [r"\b" + re.escape(word) + r"\b" for word in trigger_words]
+        # Trigger words are looked up in an index of the text, which is shared by all recognizers whose trigger words are
+        # taken from module triggerwords.
+        self.trigger_words_set = frozenset(trigger_words)
+        self.indexed_trigger_words = (
+            ALL_TRIGGER_WORDS if self.trigger_words_set.issubset(ALL_TRIGGER_WORDS) else tuple(sorted(trigger_words))
+        )
         self.calling_recognizer = calling_recognizer
 
     def post_process_match(self, match_span, text) -> List[Tuple[int, int]]:
@@ -110,7 +165,7 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
         # Extract spans to be removed from text.
         spans_to_remove_raw: List = []
         for regex in self.words_to_remove_from_match_regexes:
-            for match in re.finditer(regex, matched_text):
+            for match in regex.finditer(matched_text):
                 m_start, m_end = match.span()
                 spans_to_remove_raw.append((match_span[0] + m_start, match_span[0] + m_end))
 
@@ -197,7 +252,8 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
     ) -> List[RecognizerResult]:
         """
         This is a hard copy of the analyze method of presidio's PatternRecognizer.
-        The only change is the addition of the call to the analyze_patterns method.
+        The only change is the addition of the call to the analyze_patterns method, which shares the trigger word
+        indexes of the text within the analysis.
 
         Analyzes text to detect PII using regular expressions or deny-lists.
 
@@ -211,7 +267,8 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
         results = []
 
         if self.patterns:
-            pattern_result = self.analyze_patterns(text, regex_flags)  # type:ignore
+            with trigger_word_index_scope():
+                pattern_result = self.analyze_patterns(text, regex_flags)  # type:ignore
 
             if pattern_result and self.context:
                 # try to improve the results score using the surrounding
@@ -238,6 +295,8 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
         This is a hard copy of the __analyze_patterns method of presidio's PatternRecognizer.
         This was necessary to introduce a post-processing step after a pattern match is found,
         e.g. for removal of words form a denylist, and to add the check for trigger words.
+        Invalid matches are discarded before they are post-processed and debugging texts are only created if debug
+        logging is enabled.
 
         Evaluate all patterns in the provided text.
 
@@ -249,29 +308,41 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
         """
         flags = flags if flags else re.DOTALL | re.MULTILINE | re.VERBOSE
         results = []
+        # Debugging texts are only created if they are logged, since a pattern can match thousands of times in a text.
+        debug_logging_enabled = is_debug_logging_enabled(logger=LOGGER, calling_recognizer=self.calling_recognizer)
         for pattern in self.patterns:
-            matches = re.finditer(pattern.regex, text, flags=flags)
+            anchor_regex = self.PATTERN_ANCHOR_REGEXES.get(pattern.name, self.ANCHOR_REGEX)
+            scan_regions = self._get_scan_regions(text, flags, anchor_regex)
+            matches = self._find_matches(compile_regex(pattern.regex, flags), text, scan_regions)
             for match in matches:
-                debugging_text = "With '{}' pattern found matches: '{}'".format(pattern.name, match.group(0))
-                debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
                 m_start, m_end = match.span()
-                current_match = text[m_start:m_end]
 
                 # Skip empty results
-                if current_match == "":
-                    debug_logging(
-                        logger=LOGGER, log_message="Skipping empty results", calling_recognizer=self.calling_recognizer
-                    )
+                if m_start == m_end:
+                    if debug_logging_enabled:
+                        debug_logging(
+                            logger=LOGGER,
+                            log_message="Skipping empty results",
+                            calling_recognizer=self.calling_recognizer,
+                        )
                     continue
 
+                current_match = text[m_start:m_end]
+                if debug_logging_enabled:
+                    debugging_text = "With '{}' pattern found matches: '{}'".format(pattern.name, current_match)
+                    debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
+
                 # Check for triggerwords.
                 if self.trigger_words and not self.is_surrounded_by_triggerwords(match.span(), text):
-                    debugging_text = "Used recognizer: {}".format(self.calling_recognizer)
-                    debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
-                    debugging_text = (
-                        f"Matched '{text[match.start():match.end()]}' but was removed due to missing trigger word."
-                    )
-                    debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
+                    if debug_logging_enabled:
+                        debugging_text = "Used recognizer: {}".format(self.calling_recognizer)
+                        debug_logging(
+                            logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer
+                        )
+                        debugging_text = f"Matched '{current_match}' but was removed due to missing trigger word."
+                        debug_logging(
+                            logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer
+                        )
                     continue
 
                 score = pattern.score
@@ -280,6 +351,16 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
                 validation_result = self.validate_result(current_match)
                 invalidation_result = self.invalidate_result(current_match)
 
+                # The score is equal for all spans of a match. Hence, invalid matches are discarded before they are
+                # post-processed.
+                result_score = score
+                if validation_result is not None:
+                    result_score = EntityRecognizer.MAX_SCORE if validation_result else EntityRecognizer.MIN_SCORE
+                if invalidation_result is not None and invalidation_result:
+                    result_score = EntityRecognizer.MIN_SCORE
+                if result_score <= EntityRecognizer.MIN_SCORE:
+                    continue
+
                 # Post-process match and generate valid spans.
                 spans = self.post_process_match(match.span(), text)
                 for start, end in spans:
@@ -291,21 +372,9 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
                         validation_result,  # type:ignore
                         flags,
                     )
-                    pattern_result = RecognizerResult(self.supported_entities[0], start, end, score, description)
-
-                    if validation_result is not None:
-                        if validation_result:
-                            pattern_result.score = EntityRecognizer.MAX_SCORE
-                        else:
-                            pattern_result.score = EntityRecognizer.MIN_SCORE
-
-                    if invalidation_result is not None and invalidation_result:
-                        pattern_result.score = EntityRecognizer.MIN_SCORE
+                    results.append(RecognizerResult(self.supported_entities[0], start, end, result_score, description))
 
-                    if pattern_result.score > EntityRecognizer.MIN_SCORE:
-                        results.append(pattern_result)
-
-        results = EntityRecognizer.remove_duplicates(results)
+        results = remove_duplicates(results)
         if results:
             debugging_text = "Results of pattern analysis: {}".format(results)
             debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
@@ -317,19 +386,87 @@ class CustomPatternRecognizer(PatternRecognizer, CustomRecognizerMixin):
         Returns True, when the match is surrounded by a trigger word. Returns False otherwise.
         A text window is constructed around the match. If a trigger word is inside the window a match is said to be surrounded by the trigger word.
         The size of the window is measured in chars before and after the match.
+        The positions of the trigger words are indexed once per text, so each check is a binary search.
         """
-        chars_before = 100
-        chars_after = 50
+        chars_before = self.TRIGGER_WORD_WINDOW_CHARS_BEFORE
+        chars_after = self.TRIGGER_WORD_WINDOW_CHARS_AFTER
         start_idx = match_span[0] - chars_before if match_span[0] - chars_before > 0 else 0
         end_idx = match_span[1] + chars_after if match_span[1] + chars_after < len(text) else len(text)
-        text_window = text[start_idx:end_idx]
 
-        for trigger_word_regex in self.trigger_words_regexes:
-            if re.search(trigger_word_regex, text_window):
-                debugging_text = "Found trigger word regex '{}' in text_window '{}'".format(
-                    trigger_word_regex, text_window
-                )
-                debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
-                return True
+        trigger_word_index = get_trigger_word_index(text, self.indexed_trigger_words)
+        trigger_word = trigger_word_index.find(self.trigger_words_set, start_idx, end_idx)
+        if trigger_word is not None:
+            debugging_text = "Found trigger word '{}' in text_window '{}'".format(trigger_word, text[start_idx:end_idx])
+            debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
+            return True
 
         return False
+
+    def _get_scan_regions(
+        self, text: str, flags: int, anchor_regex: Optional[str]
+    ) -> Optional[List[Tuple[int, int, int]]]:
+        """
+        Returns the regions of the text the patterns have to be evaluated in for anchor-first or trigger-first matching
+        or None, if the whole text has to be scanned. Each region is given by the position the search starts at, the
+        last position a match may start at and the position the search ends at.
+        A match starts at most MAX_MATCH_LENGTH characters before or after the start of an anchor. A match of a
+        recognizer with trigger words is only kept if a trigger word occurs in the window around it, i.e. it starts at
+        most TRIGGER_WORD_WINDOW_CHARS_BEFORE characters before the trigger word and ends at most
+        TRIGGER_WORD_WINDOW_CHARS_AFTER characters after it. The search starts MAX_MATCH_LENGTH characters before the
+        earliest possible start of a match and ends MAX_MATCH_LENGTH characters after the latest possible end of a
+        match, so lookarounds see the same text and the search finds the same matches as a search of the whole text.
+        """
+        if self.MAX_MATCH_LENGTH is None:
+            return None
+
+        if anchor_regex is not None:
+            # Overlapping anchors are found, since a match may belong to an anchor starting inside of another one.
+            regions: List[Tuple[int, int]] = [
+                (max(0, match.start() - 2 * self.MAX_MATCH_LENGTH), match.start() + self.MAX_MATCH_LENGTH)
+                for match in compile_regex(anchor_regex, flags).finditer(text, overlapped=True)
+            ]
+        elif self.trigger_words:
+            trigger_word_index = get_trigger_word_index(text, self.indexed_trigger_words)
+            regions = sorted(
+                (
+                    max(0, trigger_word_end - self.TRIGGER_WORD_WINDOW_CHARS_AFTER - 2 * self.MAX_MATCH_LENGTH),
+                    trigger_word_start + self.TRIGGER_WORD_WINDOW_CHARS_BEFORE,
+                )
+                for trigger_word_start, trigger_word_end in trigger_word_index.get_spans(self.trigger_words_set)
+            )
+        else:
+            return None
+
+        # Merge overlapping regions, so no text is searched twice.
+        scan_regions: List[Tuple[int, int, int]] = []
+        for search_start, last_match_start in regions:
+            search_end = min(len(text), last_match_start + 2 * self.MAX_MATCH_LENGTH)
+            if scan_regions and search_start <= scan_regions[-1][2]:
+                previous_search_start, previous_last_match_start, previous_search_end = scan_regions[-1]
+                scan_regions[-1] = (
+                    previous_search_start,
+                    max(previous_last_match_start, last_match_start),
+                    max(previous_search_end, search_end),
+                )
+            else:
+                scan_regions.append((search_start, last_match_start, search_end))
+
+        return scan_regions
+
+    @staticmethod
+    def _find_matches(
+        compiled_regex: re.Pattern, text: str, scan_regions: Optional[List[Tuple[int, int, int]]]
+    ) -> Iterator[re.Match]:
+        """Returns the matches of the regex in the whole text or in the given scan regions."""
+        if scan_regions is None:
+            yield from compiled_regex.finditer(text)
+            return
+
+        # Like a search of the whole text, the search continues after the end of the previous match.
+        previous_match_end = 0
+        for search_start, last_match_start, search_end in scan_regions:
+            for match in compiled_regex.finditer(text, max(search_start, previous_match_end), search_end):
+                if match.start() > last_match_start:
+                    break
+                previous_match_end = match.end()
+                yield match
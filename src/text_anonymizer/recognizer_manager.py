@@ -1,9 +1,14 @@
 import logging
+from importlib import import_module
 from types import ModuleType
-from typing import List, Optional
+from typing import Dict, FrozenSet, List, Optional, Set, Tuple, Type, Union
 
 from text_anonymizer import constants, recognizers, utils
 from text_anonymizer.recognizer_base import CustomRecognizerMixin
+from text_anonymizer.recognizer_registry import (
+    RECOGNIZER_REGISTRY,
+    RecognizerRegistryEntry,
+)
 from text_anonymizer.utils import debug_logging, log_and_reraise_exceptions
 
 LOGGER = logging.getLogger(__name__)
@@ -25,15 +30,23 @@ class RecognizerManager:
             languages=languages, entities=entities, regions=regions
         )
 
-        # Load recognizer modules.
-        utils.load_modules_from_package(package=recognizer_package)
-
         # Create recognizers.
-        self.recognizers = self._create_recognizers(languages=languages, entities=entities, regions=regions)
+        self.recognizers = self._create_recognizers(
+            languages=languages, entities=entities, regions=regions, recognizer_package=recognizer_package
+        )
         LOGGER.info("Created %s recognizers", len(self.recognizers))
         debugging_text = "Recognizers created: {}".format([recognizer.name for recognizer in self.recognizers])
         debug_logging(logger=LOGGER, log_message=debugging_text)
 
+        # Index recognizers by language, entity and region. Selections are memoized per key of the select_recognizers
+        # method, since the recognizers are never changed after their creation.
+        (
+            self._positions_by_language,
+            self._positions_by_entity,
+            self._positions_by_region,
+        ) = self._create_recognizer_index(self.recognizers)
+        self._selections: Dict[Tuple[str, FrozenSet[str], FrozenSet[str]], Tuple[CustomRecognizerMixin, ...]] = {}
+
         # Set remaining instance variables.
         self.languages = languages
         self.entities = entities
@@ -41,50 +54,40 @@ class RecognizerManager:
 
     @log_and_reraise_exceptions(LOGGER)
     def _create_recognizers(
-        self, languages: List[str], entities: List[str], regions: List[str]
+        self, languages: List[str], entities: List[str], regions: List[str], recognizer_package: ModuleType
     ) -> List[CustomRecognizerMixin]:
 
         if not (languages and entities and regions):
             raise ValueError("Lists for languages, entities and regions cannot be empty.")
 
-        # Get all recognizer classes.
-        all_custom_recognizer_classes = utils.get_all_subclasses(CustomRecognizerMixin)
-        recognizers = []
+        if recognizer_package is recognizers:
+            # Get the matching recognizer classes of this library from the static registry. Only their modules are
+            # imported.
+            recognizer_classes = self._get_registered_recognizer_classes(
+                languages=languages, entities=entities, regions=regions
+            )
+        else:
+            # Load recognizer modules and get all recognizer classes.
+            utils.load_modules_from_package(package=recognizer_package)
+            recognizer_classes = utils.get_all_subclasses(CustomRecognizerMixin)
+        recognizer_instances = []
 
         # Select and create matching recognizers.
-        for cls in all_custom_recognizer_classes:
-            valid_languages = []
-            valid_entities = []
-            valid_regions = []
-
-            if cls.get_possible_languages() is None:
-                valid_languages = languages
-            else:
-                for language in cls.get_possible_languages():
-                    if language in languages:
-                        valid_languages.append(language)
-
-            if cls.get_possible_entities() is None:
-                valid_entities = entities
-            else:
-                for entity in cls.get_possible_entities():
-                    if entity in entities:
-                        valid_entities.append(entity)
-
-            if cls.get_possible_regions() is None:
-                valid_regions = regions
-            elif cls.get_possible_regions() == constants.VALID_GLOBALLY:
-                valid_regions = [constants.VALID_GLOBALLY]
-            else:
-                for region in cls.get_possible_regions():
-                    if region in regions:
-                        valid_regions.append(region)
+        for cls in recognizer_classes:
+            valid_languages, valid_entities, valid_regions = self._get_valid_arguments(
+                cls.get_possible_languages(),
+                cls.get_possible_entities(),
+                cls.get_possible_regions(),
+                languages=languages,
+                entities=entities,
+                regions=regions,
+            )
 
             if valid_languages and valid_entities and valid_regions:
                 for language in valid_languages:
                     # Instantiate one recognizer per region. This is crucial to be able to limit anonymization to specific regions. Presidio´s analyze methods do not offer regional support.
                     for region in valid_regions:
-                        recognizers.append(
+                        recognizer_instances.append(
                             cls(
                                 supported_language=language,
                                 supported_entities=valid_entities,
@@ -92,29 +95,131 @@ class RecognizerManager:
                             )
                         )
 
-        return recognizers
+        return recognizer_instances
+
+    @staticmethod
+    def _get_valid_arguments(
+        possible_languages: Union[List[str], None],
+        possible_entities: Union[List[str], None],
+        possible_regions: Union[List[str], str, None],
+        languages: List[str],
+        entities: List[str],
+        regions: List[str],
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """Returns the languages, entities and regions a recognizer class can be instantiated with, given the values it
+        can possibly support (see CustomRecognizerMixin) and the requested languages, entities and regions."""
+        if possible_languages is None:
+            valid_languages = languages
+        else:
+            valid_languages = [language for language in possible_languages if language in languages]
+
+        if possible_entities is None:
+            valid_entities = entities
+        else:
+            valid_entities = [entity for entity in possible_entities if entity in entities]
+
+        if possible_regions is None:
+            valid_regions = regions
+        elif possible_regions == constants.VALID_GLOBALLY:
+            valid_regions = [constants.VALID_GLOBALLY]
+        else:
+            valid_regions = [region for region in possible_regions if region in regions]
+
+        return valid_languages, valid_entities, valid_regions
+
+    @staticmethod
+    def _get_registered_recognizer_classes(
+        languages: List[str], entities: List[str], regions: List[str]
+    ) -> List[Type[CustomRecognizerMixin]]:
+        """Returns the recognizer classes of the static registry, which can be instantiated with one of the given
+        languages, entities and regions. Only the modules of these classes are imported."""
+        recognizer_classes = []
+        for module_name, class_name, possible_languages, possible_entities, possible_regions in RECOGNIZER_REGISTRY:
+            if all(
+                RecognizerManager._get_valid_arguments(
+                    possible_languages,
+                    possible_entities,
+                    possible_regions,
+                    languages=languages,
+                    entities=entities,
+                    regions=regions,
+                )
+            ):
+                recognizer_classes.append(getattr(import_module(module_name), class_name))
+        return recognizer_classes
+
+    @staticmethod
+    def _create_recognizer_index(
+        recognizers: List[CustomRecognizerMixin],
+    ) -> Tuple[Dict[str, Set[int]], Dict[str, Set[int]], Dict[str, Set[int]]]:
+        """Returns the positions of the given recognizers in the list per supported language, entity and region.
+
+        Recognizers valid globally are indexed under the region constants.VALID_GLOBALLY.
+        """
+        positions_by_language: Dict[str, Set[int]] = {}
+        positions_by_entity: Dict[str, Set[int]] = {}
+        positions_by_region: Dict[str, Set[int]] = {}
+        for position, recognizer in enumerate(recognizers):
+            positions_by_language.setdefault(recognizer.get_supported_language(), set()).add(position)  # type: ignore
+            for entity in recognizer.get_supported_entities():  # type: ignore
+                positions_by_entity.setdefault(entity, set()).add(position)
+            for region in recognizer.get_supported_regions():
+                positions_by_region.setdefault(region, set()).add(position)
+        return positions_by_language, positions_by_entity, positions_by_region
 
-    def _is_language_supported_by_recognizer(self, recognizer: CustomRecognizerMixin, language) -> bool:
-        is_supported = recognizer.get_supported_language() == language  # type: ignore
-        return is_supported
+    def select_recognizers(self, language: str, entities: List[str], regions: List[str]) -> List[CustomRecognizerMixin]:
+        """Returns the recognizers supporting the given language, one of the given entities and one of the given
+        regions. Recognizers valid globally support every region.
 
-    def _is_entities_supported_by_recognizer(self, recognizer: CustomRecognizerMixin, entities) -> bool:
-        is_supported = any([entity in entities for entity in recognizer.get_supported_entities()])  # type: ignore
-        return is_supported
+        The selection is looked up in the index built at construction and memoized per language, set of entities and
+        set of regions.
 
-    def _is_regions_supported_by_recognizer(self, recognizer: CustomRecognizerMixin, regions) -> bool:
-        is_supported = any(
-            [region in regions or region == constants.VALID_GLOBALLY for region in recognizer.get_supported_regions()]
-        )
-        return is_supported
+        Args:
+            language (str): The language the recognizers must support.
+            entities (List[str]): The entities of which the recognizers must support at least one.
+            regions (List[str]): The regions of which the recognizers must support at least one.
 
-    def select_recognizers(self, language: str, entities: List[str], regions: List[str]) -> List[CustomRecognizerMixin]:
+        Returns:
+            List[CustomRecognizerMixin]: The selected recognizers in the order of the recognizers attribute.
+        """
         # Alternative: here we could filter for region only since Presidio´s analyze function filters for language and entity anyway.
-        selected_recognizers = [
-            recognizer
-            for recognizer in self.recognizers
-            if self._is_language_supported_by_recognizer(recognizer, language)
-            and self._is_entities_supported_by_recognizer(recognizer, entities)
-            and self._is_regions_supported_by_recognizer(recognizer, regions)
-        ]
-        return selected_recognizers
+        selection_key = (language, frozenset(entities), frozenset(regions))
+        selected_recognizers = self._selections.get(selection_key)
+        if selected_recognizers is None:
+            positions = set(self._positions_by_language.get(language, ()))
+            positions &= set().union(*[self._positions_by_entity.get(entity, ()) for entity in selection_key[1]])
+            positions &= set().union(
+                *[self._positions_by_region.get(region, ()) for region in selection_key[2] | {constants.VALID_GLOBALLY}]
+            )
+            selected_recognizers = tuple(self.recognizers[position] for position in sorted(positions))
+            self._selections[selection_key] = selected_recognizers
+        # Return a new list, since callers like Presidio´s RecognizerRegistry may extend it.
+        return list(selected_recognizers)
+
+
+def get_recognizer_registry_entries(recognizer_package: ModuleType = recognizers) -> List[RecognizerRegistryEntry]:
+    """Returns the entries of the static registry for the recognizer classes defined in the given package.
+
+    All modules of the package are imported. The entries are written to module recognizer_registry by the script
+    scripts/generate_recognizer_registry.py.
+
+    Args:
+        recognizer_package (ModuleType, optional): The package to search for recognizer classes. Defaults to the
+            recognizers package of this library.
+
+    Returns:
+        List[RecognizerRegistryEntry]: The module name, class name, possible languages, possible entities and possible
+            regions of every recognizer class, sorted by module name and class name.
+    """
+    utils.load_modules_from_package(package=recognizer_package)
+    return sorted(
+        (
+            cls.__module__,
+            cls.__name__,
+            cls.get_possible_languages(),
+            cls.get_possible_entities(),
+            cls.get_possible_regions(),
+        )
+        for cls in utils.get_all_subclasses(CustomRecognizerMixin)
+        if cls.__module__.startswith(recognizer_package.__name__ + ".")
+    )
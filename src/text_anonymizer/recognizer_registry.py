@@ -0,0 +1,106 @@
+"""Static registry of the recognizer classes of package text_anonymizer.recognizers.
+
+The RecognizerManager looks up the recognizer classes matching its languages, entities and regions in this registry
+and imports only their modules. This module is generated by scripts/generate_recognizer_registry.py. Do not edit it
+manually.
+"""
+
+from typing import List, Optional, Tuple, Union
+
+# Module name, class name, possible languages, possible entities and possible regions of a recognizer class.
+RecognizerRegistryEntry = Tuple[str, str, Optional[List[str]], Optional[List[str]], Union[List[str], str, None]]
+
+RECOGNIZER_REGISTRY: List[RecognizerRegistryEntry] = [
+    ("text_anonymizer.recognizers.address.address_recognizer", "CustomAddressRecognizer_AT", None, ["ADDRESS"], ["AT"]),
+    ("text_anonymizer.recognizers.address.address_recognizer", "CustomAddressRecognizer_CH", None, ["ADDRESS"], ["CH"]),
+    ("text_anonymizer.recognizers.address.address_recognizer", "CustomAddressRecognizer_DE", None, ["ADDRESS"], ["DE"]),
+    ("text_anonymizer.recognizers.address.address_recognizer", "CustomAddressRecognizer_ES", None, ["ADDRESS"], ["ES"]),
+    ("text_anonymizer.recognizers.address.address_recognizer", "CustomAddressRecognizer_GB", None, ["ADDRESS"], ["GB"]),
+    ("text_anonymizer.recognizers.address.address_recognizer", "CustomAddressRecognizer_US", None, ["ADDRESS"], ["US"]),
+    ("text_anonymizer.recognizers.credit_card", "CustomCreditCardRecognizer", None, ["CREDIT_CARD"], "VALID_GLOBALLY"),
+    (
+        "text_anonymizer.recognizers.driver_license",
+        "CustomDriverLicenseRecognizer_AT",
+        None,
+        ["DRIVER_LICENSE"],
+        ["AT"],
+    ),
+    (
+        "text_anonymizer.recognizers.driver_license",
+        "CustomDriverLicenseRecognizer_CH",
+        None,
+        ["DRIVER_LICENSE"],
+        ["CH"],
+    ),
+    (
+        "text_anonymizer.recognizers.driver_license",
+        "CustomDriverLicenseRecognizer_DE",
+        None,
+        ["DRIVER_LICENSE"],
+        ["DE"],
+    ),
+    (
+        "text_anonymizer.recognizers.driver_license",
+        "CustomDriverLicenseRecognizer_GB",
+        None,
+        ["DRIVER_LICENSE"],
+        ["GB"],
+    ),
+    (
+        "text_anonymizer.recognizers.driver_license",
+        "CustomDriverLicenseRecognizer_US",
+        None,
+        ["DRIVER_LICENSE"],
+        ["US"],
+    ),
+    (
+        "text_anonymizer.recognizers.email_address",
+        "CustomEmailAddressRecognizer",
+        None,
+        ["EMAIL_ADDRESS"],
+        "VALID_GLOBALLY",
+    ),
+    ("text_anonymizer.recognizers.iban_code", "CustomIbanCodeRecognizer", None, ["IBAN_CODE"], "VALID_GLOBALLY"),
+    ("text_anonymizer.recognizers.identity_card", "CustomIdentityCardRecognizer_CH", None, ["IDENTITY_CARD"], ["CH"]),
+    ("text_anonymizer.recognizers.identity_card", "CustomIdentityCardRecognizer_DE", None, ["IDENTITY_CARD"], ["DE"]),
+    ("text_anonymizer.recognizers.identity_card", "CustomIdentityCardRecognizer_ES", None, ["IDENTITY_CARD"], ["ES"]),
+    ("text_anonymizer.recognizers.identity_card", "CustomIdentityCardRecognizer_US", None, ["IDENTITY_CARD"], ["US"]),
+    ("text_anonymizer.recognizers.imei", "CustomImeiRecognizer", None, ["IMEI"], "VALID_GLOBALLY"),
+    ("text_anonymizer.recognizers.ip_address", "CustomIpAddressRecognizer", None, ["IP_ADDRESS"], "VALID_GLOBALLY"),
+    ("text_anonymizer.recognizers.license_plate", "CustomLicensePlateRecognizer_AT", None, ["LICENSE_PLATE"], ["AT"]),
+    ("text_anonymizer.recognizers.license_plate", "CustomLicensePlateRecognizer_CH", None, ["LICENSE_PLATE"], ["CH"]),
+    ("text_anonymizer.recognizers.license_plate", "CustomLicensePlateRecognizer_DE", None, ["LICENSE_PLATE"], ["DE"]),
+    ("text_anonymizer.recognizers.license_plate", "CustomLicensePlateRecognizer_ES", None, ["LICENSE_PLATE"], ["ES"]),
+    ("text_anonymizer.recognizers.license_plate", "CustomLicensePlateRecognizer_GB", None, ["LICENSE_PLATE"], ["GB"]),
+    ("text_anonymizer.recognizers.mac_address", "CustomMacAddressRecognizer", None, ["MAC_ADDRESS"], "VALID_GLOBALLY"),
+    ("text_anonymizer.recognizers.mb_user_id", "CustomMbUserIdRecognizer_PatternBased", [], [], []),
+    ("text_anonymizer.recognizers.mb_user_id", "CustomMbUserIdRecognizer_RuleBased", [], [], []),
+    ("text_anonymizer.recognizers.passport", "CustomPassportRecognizer_AT", None, ["PASSPORT"], ["AT"]),
+    ("text_anonymizer.recognizers.passport", "CustomPassportRecognizer_CH", None, ["PASSPORT"], ["CH"]),
+    ("text_anonymizer.recognizers.passport", "CustomPassportRecognizer_DE", None, ["PASSPORT"], ["DE"]),
+    ("text_anonymizer.recognizers.passport", "CustomPassportRecognizer_ES", None, ["PASSPORT"], ["ES"]),
+    ("text_anonymizer.recognizers.passport", "CustomPassportRecognizer_GB", None, ["PASSPORT"], ["GB"]),
+    ("text_anonymizer.recognizers.passport", "CustomPassportRecognizer_US", None, ["PASSPORT"], ["US"]),
+    (
+        "text_anonymizer.recognizers.person.person_recognizer",
+        "CustomPersonRecognizer_PatternBased",
+        None,
+        ["PERSON"],
+        "VALID_GLOBALLY",
+    ),
+    (
+        "text_anonymizer.recognizers.person.person_recognizer",
+        "CustomPersonRecognizer_RuleEnhancedNER",
+        None,
+        ["PERSON"],
+        "VALID_GLOBALLY",
+    ),
+    (
+        "text_anonymizer.recognizers.phone_number",
+        "CustomPhoneNumberRecognizer",
+        None,
+        ["PHONE_NUMBER"],
+        ["AT", "DE", "GB", "ES", "CH", "US"],
+    ),
+    ("text_anonymizer.recognizers.vin", "CustomVinRecognizer", None, ["VIN"], "VALID_GLOBALLY"),
+]
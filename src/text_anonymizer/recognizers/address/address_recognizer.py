@@ -25,6 +25,10 @@ class CustomAddressRecognizer_AT(CustomPatternRecognizer):
 
     PATTERNS = [Pattern(name="address_AT", regex=address_regex_at.REGEX_AT_ADDRESS, score=SCORE)]
 
+    # Addresses are only searched around street numbers following a street.
+    ANCHOR_REGEX = address_regex_at.REGEX_AT_ADDRESS_ANCHOR
+    MAX_MATCH_LENGTH = constants.ADDRESS_MAX_MATCH_LENGTH
+
     WORDS_TO_REMOVE_FROM_MATCH = words_to_remove.WORDS_TO_REMOVE_ADDRESS_DE_AT
 
     def __init__(
@@ -57,6 +61,10 @@ class CustomAddressRecognizer_CH(CustomPatternRecognizer):
 
     PATTERNS = [Pattern(name="address_CH", regex=address_regex_ch.REGEX_CH_ADDRESS, score=SCORE)]
 
+    # Addresses are only searched around street numbers following a street.
+    ANCHOR_REGEX = address_regex_ch.REGEX_CH_ADDRESS_ANCHOR
+    MAX_MATCH_LENGTH = constants.ADDRESS_MAX_MATCH_LENGTH
+
     # List of words to remove from pattern matches.
     WORDS_TO_REMOVE_FROM_MATCH = words_to_remove.WORDS_TO_REMOVE_ADDRESS_DE_CH
 
@@ -90,6 +98,10 @@ class CustomAddressRecognizer_DE(CustomPatternRecognizer):
 
     PATTERNS = [Pattern(name="address_DE", regex=address_regex_de.REGEX_DE_ADDRESS, score=SCORE)]
 
+    # Addresses are only searched around street numbers following a street.
+    ANCHOR_REGEX = address_regex_de.REGEX_DE_ADDRESS_ANCHOR
+    MAX_MATCH_LENGTH = constants.ADDRESS_MAX_MATCH_LENGTH
+
     # List of words to remove from pattern matches.
     WORDS_TO_REMOVE_FROM_MATCH = words_to_remove.WORDS_TO_REMOVE_ADDRESS_DE_DE
 
@@ -123,6 +135,10 @@ class CustomAddressRecognizer_ES(CustomPatternRecognizer):
 
     PATTERNS = [Pattern(name="address_ES", regex=address_regex_es.REGEX_ES_ADDRESS, score=SCORE)]
 
+    # Addresses are only searched around streets.
+    ANCHOR_REGEX = address_regex_es.REGEX_ES_ADDRESS_ANCHOR
+    MAX_MATCH_LENGTH = constants.ADDRESS_MAX_MATCH_LENGTH
+
     # List of words to remove from pattern matches.
     WORDS_TO_REMOVE_FROM_MATCH = words_to_remove.WORDS_TO_REMOVE_ADDRESS_ES_ES
 
@@ -156,6 +172,10 @@ class CustomAddressRecognizer_GB(CustomPatternRecognizer):
 
     PATTERNS = [Pattern(name="address_GB", regex=address_regex_gb.REGEX_GB_ADDRESS, score=SCORE)]
 
+    # Addresses are only searched around street types.
+    ANCHOR_REGEX = address_regex_gb.REGEX_GB_ADDRESS_ANCHOR
+    MAX_MATCH_LENGTH = constants.ADDRESS_MAX_MATCH_LENGTH
+
     # List of words to remove from pattern matches.
     WORDS_TO_REMOVE_FROM_MATCH = words_to_remove.WORDS_TO_REMOVE_ADDRESS_EN_GB
 
@@ -189,6 +209,10 @@ class CustomAddressRecognizer_US(CustomPatternRecognizer):
 
     PATTERNS = [Pattern(name="address_US", regex=address_regex_us.REGEX_US_ADDRESS, score=SCORE)]
 
+    # Addresses are only searched around states.
+    ANCHOR_REGEX = address_regex_us.REGEX_US_ADDRESS_ANCHOR
+    MAX_MATCH_LENGTH = constants.ADDRESS_MAX_MATCH_LENGTH
+
     def __init__(
         self,
         supported_language,
@@ -183,3 +183,19 @@ REGEX_AT_ADDRESS = r"""
     city=REGEX_AT_CITY,
     region=REGEX_AT_REGION,
 )
+
+"""
+Every address contains a street followed by a street number. Addresses are only searched around the first digits of
+street numbers following a street. The street is checked with a lookbehind, so the regex engine only tries to match
+at digits.
+"""
+REGEX_AT_ADDRESS_ANCHOR = r"""
+(?x)
+(?<=
+    {street}
+    [ ]{{1,5}}
+)
+\d
+""".format(
+    street=REGEX_AT_STREET,
+)
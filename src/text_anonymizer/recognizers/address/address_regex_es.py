@@ -178,3 +178,13 @@ REGEX_ES_ADDRESS = r"""
     city=REGEX_ES_CITY,
     region=REGEX_ES_REGION,
 )
+
+"""
+Every address contains a street. Addresses are only searched around the positions this anchor matches at.
+"""
+REGEX_ES_ADDRESS_ANCHOR = r"""
+(?x)
+{street}
+""".format(
+    street=REGEX_ES_STREET,
+)
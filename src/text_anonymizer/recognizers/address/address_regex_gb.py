@@ -515,3 +515,14 @@ REGEX_GB_ADDRESS = r"""
 """.format(
     address_standard=REGEX_GB_ADDRESS_STANDARD, address_form=REGEX_GB_ADDRESS_FORM
 )
+
+"""
+Every address contains a street type, the form of an address as well. Addresses are only searched around the positions
+this anchor matches at.
+"""
+REGEX_GB_ADDRESS_ANCHOR = r"""
+(?x)
+{street_type}
+""".format(
+    street_type=REGEX_GB_STREET_TYPE,
+)
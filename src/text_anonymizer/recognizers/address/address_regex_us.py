@@ -915,3 +915,13 @@ REGEX_US_ADDRESS = r"""
     country=country,
     postal_code=postal_code,
 )
+
+"""
+Every address contains a state. Addresses are only searched around the positions this anchor matches at.
+"""
+REGEX_US_ADDRESS_ANCHOR = r"""
+(?x)
+{region1}
+""".format(
+    region1=region1,
+)
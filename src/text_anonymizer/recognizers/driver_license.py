@@ -23,6 +23,7 @@ class CustomDriverLicenseRecognizer_AT(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_DRIVER_LICENSE_AT]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_DRIVER_LICENSE_DE_AT
+    MAX_MATCH_LENGTH = 8
 
     def __init__(
         self,
@@ -58,6 +59,7 @@ class CustomDriverLicenseRecognizer_CH(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_DRIVER_LICENSE_CH]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_DRIVER_LICENSE_DE_CH
+    MAX_MATCH_LENGTH = 12
 
     def __init__(
         self,
@@ -210,6 +212,7 @@ class CustomDriverLicenseRecognizer_US(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_DRIVER_LICENSE_US]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_DRIVER_LICENSE_EN_US
+    MAX_MATCH_LENGTH = 17
 
     def __init__(
         self,
@@ -24,6 +24,7 @@ class CustomIdentityCardRecognizer_CH(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_IDENTITY_CARD_CH]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_IDENTITY_CARD_DE_CH
+    MAX_MATCH_LENGTH = 9
 
     def __init__(
         self,
@@ -60,6 +61,7 @@ class CustomIdentityCardRecognizer_DE(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_IDENTITY_CARD_DE]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_IDENTITY_CARD_DE_DE
+    MAX_MATCH_LENGTH = 9
 
     def __init__(
         self,
@@ -196,6 +198,7 @@ class CustomIdentityCardRecognizer_US(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_IDENTITY_CARD_US]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_IDENTITY_CARD_EN_US
+    MAX_MATCH_LENGTH = 11
 
     def __init__(
         self,
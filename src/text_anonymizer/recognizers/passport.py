@@ -22,6 +22,7 @@ class CustomPassportRecognizer_AT(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_PASSPORT_AT]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_PASSPORT_DE_AT
+    MAX_MATCH_LENGTH = 8
 
     def __init__(
         self,
@@ -58,6 +59,7 @@ class CustomPassportRecognizer_CH(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_PASSPORT_CH]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_PASSPORT_DE_CH
+    MAX_MATCH_LENGTH = 8
 
     def __init__(
         self,
@@ -94,6 +96,7 @@ class CustomPassportRecognizer_DE(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_PASSPORT_DE]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_PASSPORT_DE_DE
+    MAX_MATCH_LENGTH = 9
 
     def __init__(
         self,
@@ -130,6 +133,7 @@ class CustomPassportRecognizer_ES(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_PASSPORT_ES]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_PASSPORT_ES_ES
+    MAX_MATCH_LENGTH = 9
 
     def __init__(
         self,
@@ -165,6 +169,7 @@ class CustomPassportRecognizer_GB(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_PASSPORT_IDENTITY_CARD_GB]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_PASSPORT_EN_GB
+    MAX_MATCH_LENGTH = 9
 
     def __init__(
         self,
@@ -203,6 +208,7 @@ class CustomPassportRecognizer_US(CustomPatternRecognizer):
     )
     PATTERNS = [PATTERN_PASSPORT_IDENTITY_CARD_US]
     TRIGGER_WORDS = triggerwords.TRIGGERWORDS_PASSPORT_EN_US
+    MAX_MATCH_LENGTH = 9
 
     def __init__(
         self,
@@ -1,6 +1,7 @@
 import logging
-from typing import List, Set, Tuple
+from typing import List, Optional, Set, Tuple
 
+import numpy as np
 import regex as re
 from presidio_analyzer import (
     AnalysisExplanation,
@@ -8,7 +9,10 @@ from presidio_analyzer import (
     Pattern,
     RecognizerResult,
 )
-from spacy.tokens import Doc, Span
+from spacy.attrs import IS_SPACE, IS_STOP, LOWER, POS
+from spacy.strings import hash_string
+from spacy.symbols import NOUN, PROPN
+from spacy.tokens import Doc, Span, Token
 
 from text_anonymizer import constants, words_to_remove
 from text_anonymizer.recognizer_base import (
@@ -17,6 +21,7 @@ from text_anonymizer.recognizer_base import (
     debug_logging,
 )
 from text_anonymizer.recognizers.person import person_denylist, person_regex
+from text_anonymizer.utils import compile_regex
 
 LOGGER = logging.getLogger(__name__)
 
@@ -34,6 +39,9 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
     POSSIBLE_ENTITIES = [constants.ENTITY_PERSON]
     POSSIBLE_REGIONS = constants.VALID_GLOBALLY
 
+    REQUIRES_NLP_ARTIFACTS = True
+    REQUIRED_SPACY_ATTRIBUTES = [constants.SPACY_ATTRIBUTE_ENT, constants.SPACY_ATTRIBUTE_POS]
+
     SCORE = constants.DEFAULT_RECOGNIZER_RESULT_SCORE - 0.1
 
     # Tuples containing own entity names and spaCy entity names,
@@ -46,6 +54,10 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
     PERSON_FORBIDDEN_CHARS_TOKEN = r"[^a-zA-ZäöüÄÖÜß\.\-\–]"  # regex
     # Set maximum number of tokens for a person span
     PERSON_MAX_TOKENS = 5
+    # POS tags of valid PERSON tokens.
+    PERSON_POS_TAGS = {"NOUN", "PROPN"}
+    # IDs of the POS tags of valid PERSON tokens, as returned by Doc.to_array.
+    PERSON_POS_IDS = np.array([NOUN, PROPN], dtype=np.uint64)
 
     # Denylist of lower-case words that will be excluded from NER result.
     # example of usage:
@@ -66,6 +78,10 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
         )
         CustomRecognizerMixin.__init__(self, supported_regions=supported_regions)
         self.calling_recognizer = type(self).__name__
+        denylist = self.PERSON_DENYLISTS[self.supported_language]
+        self.person_denylist = frozenset(denylist)
+        # Hashes of the denylisted words, which equal the LOWER attributes of the tokens of these words.
+        self.person_denylist_hashes = np.array(sorted({hash_string(word) for word in denylist}), dtype=np.uint64)
 
     def load(self) -> None:
         pass
@@ -80,6 +96,7 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
         debugging_text = "keywords nlp_artifacts for Person Recognizer: {}".format(nlp_artifacts.keywords)
         debug_logging(logger=LOGGER, log_message=debugging_text, calling_recognizer=self.calling_recognizer)
 
+        is_person_token = None
         for entity in entities:
             if entity not in self.supported_entities:
                 continue
@@ -91,8 +108,14 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
                 if not self._is_match_with_entity(entity, ent.label_, self.PRESIDIO_TO_SPACY_MAPPINGS):
                     continue
 
+                # Evaluate the token rules of PERSON spans once for all tokens of the doc.
+                if entity == constants.ENTITY_PERSON and is_person_token is None:
+                    is_person_token = self._get_is_person_token(nlp_artifacts.tokens)
+
                 # Create RecognizerResults.
-                some_results = self._create_results_from_entity_span(entity=entity, span=ent, doc=nlp_artifacts.tokens)
+                some_results = self._create_results_from_entity_span(
+                    entity=entity, span=ent, doc=nlp_artifacts.tokens, is_person_token=is_person_token
+                )
 
                 if some_results:
                     debug_logging(
@@ -103,10 +126,12 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
 
         return results
 
-    def _create_results_from_entity_span(self, entity: str, span: Span, doc: Doc) -> List[RecognizerResult]:
+    def _create_results_from_entity_span(
+        self, entity: str, span: Span, doc: Doc, is_person_token: Optional[np.ndarray] = None
+    ) -> List[RecognizerResult]:
         results = []
 
-        spans = self._clean_entity_span(entity, span, doc)
+        spans = self._clean_entity_span(entity, span, doc, is_person_token)
         for span in spans:
             # Create RecognizerResult.
             textual_explanation = "Identified as {} by {}.".format(entity, self.__class__.__name__)
@@ -118,19 +143,61 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
 
         return results
 
-    def _clean_entity_span(self, entity: str, span: Span, doc: Doc) -> List[Span]:
+    def _clean_entity_span(
+        self, entity: str, span: Span, doc: Doc, is_person_token: Optional[np.ndarray] = None
+    ) -> List[Span]:
         spans = [span]
 
         if entity == constants.ENTITY_PERSON:
-            return self._clean_person_span(span, doc)
+            return self._clean_person_span(span, doc, is_person_token)
 
         return spans
 
-    def _clean_person_span(self, span: Span, doc: Doc) -> List[Span]:
+    def _get_is_person_token(self, doc: Doc) -> Optional[np.ndarray]:
+        """Evaluates the token rules of PERSON spans for all tokens of the doc at once.
+
+        The POS tags, stop word flags, whitespace flags and hashes of the lower-case texts of the tokens are read with
+        a single call of Doc.to_array. A token contains a forbidden character of PERSON_FORBIDDEN_CHARS_TOKEN but none of
+        PERSON_FORBIDDEN_CHARS_SPAN only if it contains whitespace. Since the tokenizer of spaCy never mixes whitespace
+        with other characters in a token, this is the case exactly for the whitespace tokens. Hence, the rules only have
+        to be evaluated on the tokens of spans without forbidden characters, which are checked in _clean_person_span.
+
+        Args:
+            doc (Doc): The doc of the NER results.
+
+        Returns:
+            Optional[np.ndarray]: Whether each token of the doc may be part of a PERSON span, or None if doc is not a
+                spaCy Doc.
+        """
+        if not isinstance(doc, Doc):
+            return None
+        attributes = doc.to_array([POS, IS_STOP, IS_SPACE, LOWER])
+        return (
+            np.isin(attributes[:, 0], self.PERSON_POS_IDS)
+            & (attributes[:, 1] == 0)
+            & (attributes[:, 2] == 0)
+            & ~np.isin(attributes[:, 3], self.person_denylist_hashes)
+        )
+
+    def _is_person_token(self, token: Token) -> bool:
+        """Evaluates the token rules of PERSON spans for a single token, e.g. if no spaCy Doc is available."""
+        # Check for forbidden characters in token.
+        if compile_regex(self.PERSON_FORBIDDEN_CHARS_TOKEN).search(token.text):
+            return False
+        # Check for incorrect POS tag.
+        if token.pos_ not in self.PERSON_POS_TAGS:
+            return False
+        # Remove stop word tokens.
+        if token.is_stop:
+            return False
+        # Check for denylisted words.
+        return token.text.lower() not in self.person_denylist
+
+    def _clean_person_span(self, span: Span, doc: Doc, is_person_token: Optional[np.ndarray] = None) -> List[Span]:
         spans = []
 
         # Check for forbidden characters in span.
-        match = re.search(self.PERSON_FORBIDDEN_CHARS_SPAN, span.text)
+        match = compile_regex(self.PERSON_FORBIDDEN_CHARS_SPAN).search(span.text)
         if match:
             return spans
 
@@ -138,51 +205,20 @@ class CustomPersonRecognizer_RuleEnhancedNER(LocalRecognizer, CustomRecognizerMi
         if len(span) > self.PERSON_MAX_TOKENS:
             return spans
 
-        # Iterate over tokens of span.
-        remove_token_idxs = []
-        for i, token in enumerate(span):
-
-            # Check for forbidden characters in token.
-            match = re.search(self.PERSON_FORBIDDEN_CHARS_TOKEN, token.text)
-            if match:
-                remove_token_idxs.append(i)
-                continue
-
-            # Check for incorrect POS tag.
-            if token.pos_ not in ["NOUN", "PROPN"]:
-                remove_token_idxs.append(i)
-                continue
-
-            # Remove stop word tokens.
-            if token.is_stop:
-                remove_token_idxs.append(i)
-                continue
-
-            # Check for denylisted words.
-            if token.text.lower() in self.PERSON_DENYLISTS[self.supported_language]:
-                remove_token_idxs.append(i)
-                continue
-
-        # Create spans for approved tokens.
-        is_inside_span = False
-        add_span = False
-        for i, token in enumerate(span):
-            if i in remove_token_idxs:
-                if is_inside_span:
-                    is_inside_span = False
-                    span_end_idx = span.start + i
-                    add_span = True
-            else:
-                if not is_inside_span:
-                    is_inside_span = True
-                    span_start_idx = span.start + i
-                if i == len(span) - 1:
-                    span_end_idx = span.start + i + 1
-                    add_span = True
-
-            if add_span:
-                spans.append(doc[span_start_idx:span_end_idx])  # type: ignore
-                add_span = False
+        # Check the tokens of span, preferably with the results of _get_is_person_token for the whole doc.
+        if is_person_token is not None:
+            keep_tokens = is_person_token[span.start : span.start + len(span)].tolist()
+        else:
+            keep_tokens = [self._is_person_token(token) for token in span]
+
+        # Create spans for runs of approved tokens.
+        span_start_idx = None
+        for i, keep_token in enumerate(keep_tokens + [False]):
+            if keep_token and span_start_idx is None:
+                span_start_idx = span.start + i
+            elif not keep_token and span_start_idx is not None:
+                spans.append(doc[span_start_idx : span.start + i])  # type: ignore
+                span_start_idx = None
 
         return spans
 
@@ -317,6 +353,19 @@ class CustomPersonRecognizer_PatternBased(CustomPatternRecognizer):
         constants.LANGUAGE_CODE_ES: PATTERNS_ES,
     }
 
+    # Patterns matching persons after greetings, goodbyes and form fields are only evaluated after their keywords.
+    # Patterns of titled persons start with the title, so they need no anchors.
+    PATTERN_ANCHOR_REGEXES = {
+        PATTERN_DE_GREETING.name: person_regex.REGEX_DE_GREETING_KEYWORDS,
+        PATTERN_DE_GOODBYE.name: person_regex.REGEX_DE_GOODBYE_KEYWORDS,
+        PATTERN_DE_FORM_EMAIL.name: person_regex.REGEX_DE_FORM_EMAIL_KEYWORDS,
+        PATTERN_DE_FORM_GENERAL.name: person_regex.REGEX_DE_FORM_GENERAL_KEYWORDS,
+        PATTERN_EN_GOODBYE.name: person_regex.REGEX_EN_GOODBYE_KEYWORDS,
+        PATTERN_ES_GREETING.name: person_regex.REGEX_ES_GREETING_KEYWORDS,
+        PATTERN_ES_GOODBYE.name: person_regex.REGEX_ES_GOODBYE_KEYWORDS,
+    }
+    MAX_MATCH_LENGTH = constants.PERSON_MAX_MATCH_LENGTH
+
     # List of words to remove from pattern matches.
     WORDS_TO_REMOVE_FROM_MATCH = words_to_remove.WORDS_TO_REMOVE_PERSON
 
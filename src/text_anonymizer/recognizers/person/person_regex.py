@@ -125,39 +125,47 @@ REGEX_DE_TITLED_PERSON = r"""
     full_name_w_uppercase=REGEX_FULL_NAME_W_UPPERCASE
 )
 
+REGEX_DE_GREETING_KEYWORDS = r"""
+(?:
+    # uncomment if needed
+    #(?:[Gg][Uu][Tt][Ee][Nn][ ][Tt][Aa][Gg])
+    (?:[Gg][Uu][Tt][Ee][Nn][ ][Mm][Oo][Rr][Gg][Ee][Nn])
+    |
+    (?:[Gg][Rr](ue|[Üü])(ß|[Ss]{1,2})[ ][Gg][Oo][Tt]{1,2})
+
+    # Uncomment if needed.
+    #|
+    #(?:[Hh][Aa][Ll]{1,2}[Oo])
+)
+"""
+
 REGEX_DE_GREETED_PERSON = r"""
 (?x)
 (?<=
-    (?:
-        # uncomment if needed
-        #(?:[Gg][Uu][Tt][Ee][Nn][ ][Tt][Aa][Gg])
-        (?:[Gg][Uu][Tt][Ee][Nn][ ][Mm][Oo][Rr][Gg][Ee][Nn])
-        |
-        (?:[Gg][Rr](ue|[Üü])(ß|[Ss]{{1,2}})[ ][Gg][Oo][Tt]{{1,2}})
-
-        # Uncomment if needed.
-        #|
-        #(?:[Hh][Aa][Ll]{{1,2}}[Oo])
-    )
+    {greeting_keywords}
     (?:[ ] {{1,5}} )
 )
 {full_name}
 """.format(
-    full_name=REGEX_FULL_NAME
+    greeting_keywords=REGEX_DE_GREETING_KEYWORDS, full_name=REGEX_FULL_NAME
 )
 
 
+REGEX_DE_GOODBYE_KEYWORDS = r"""
+(?:
+    ([Gg][Rr]([UuÜü]|(ue))(ß|[Ss]{1,2})([Ee][Nn]?|[Tt])?)| # can't end with "Gott" (Grüß Gott)
+    [Mm]\.?[Ff]\.?[Gg]\.?|
+    [Rr][Ee][Gg][Aa][Rr][Dd][Ss]|
+    [VvBbLlFf][Gg]|
+    [Bb][Ee][Ss][Tt][Ee][Nn] [ ] {1,5} [Dd][Aa][Nn][Kk]|
+    [Cc][Oo][Rr][Dd][Ii][Aa][Ll][Ee][Mm][Ee][Nn][Tt]
+)
+"""
+
 REGEX_DE_GOODBYE_PERSON = r"""
 (?x)
 (?<=
-    (?:
-        ([Gg][Rr]([UuÜü]|(ue))(ß|[Ss]{{1,2}})([Ee][Nn]?|[Tt])?)| # can't end with "Gott" (Grüß Gott)
-        [Mm]\.?[Ff]\.?[Gg]\.?|
-        [Rr][Ee][Gg][Aa][Rr][Dd][Ss]|
-        [VvBbLlFf][Gg]|
-        [Bb][Ee][Ss][Tt][Ee][Nn] [ ] {{1,5}} [Dd][Aa][Nn][Kk]|
-        [Cc][Oo][Rr][Dd][Ii][Aa][Ll][Ee][Mm][Ee][Nn][Tt]
-    )
+    {goodbye_keywords}
     (?:[,])?
     (?: ( [^\S\n\r] {{1,5}} ) | ( [ ] {{0,5}} (\r\n|\r|\n) ) )
     # [^\S\n\r] -> a single whitespace but a line break
@@ -165,9 +173,20 @@ REGEX_DE_GOODBYE_PERSON = r"""
 )
 {full_name_w_uppercase}
 """.format(
-    full_name_w_uppercase=REGEX_FULL_NAME_W_UPPERCASE
+    goodbye_keywords=REGEX_DE_GOODBYE_KEYWORDS, full_name_w_uppercase=REGEX_FULL_NAME_W_UPPERCASE
 )
 
+REGEX_DE_FORM_EMAIL_KEYWORDS = r"""
+(?:
+    [Vv][Oo][Nn]:|
+    From:|
+    To:|
+    An:|
+    Cc:|
+    Bcc:
+)
+"""
+
 # Regex that matches the first person after a person indicator in an email form.
 # Multiple succeeding persons are not matched (as you would expect in emails (Cc: person1 .. person2 .. ..).
 # An attempt to match multiple succeeding persons was made but commented below.
@@ -175,14 +194,7 @@ REGEX_DE_GOODBYE_PERSON = r"""
 REGEX_DE_FORM_EMAIL_PERSON = r"""
 (?x)
 (?<=
-    (?:
-        [Vv][Oo][Nn]:|
-        From:|
-        To:|
-        An:|
-        Cc:|
-        Bcc:
-    )
+    {form_email_keywords}
     (?: ( [^\d\n\r] {{0,5}} (\r\n|\r|\n)? )? )
 )
 (
@@ -199,22 +211,28 @@ REGEX_DE_FORM_EMAIL_PERSON = r"""
 #    )
 #){{0,5}}
 """.format(
-    comma_separated_name=REGEX_COMMA_SEPARATED_NAME, full_name=REGEX_FULL_NAME
+    form_email_keywords=REGEX_DE_FORM_EMAIL_KEYWORDS,
+    comma_separated_name=REGEX_COMMA_SEPARATED_NAME,
+    full_name=REGEX_FULL_NAME,
+)
+
+REGEX_DE_FORM_GENERAL_KEYWORDS = r"""
+(?:
+    firstname:|
+    lastname:|
+    z.H.|z.H|zH|
+    i.A.|
+    Ansprechpartner:|
+    Geschäftsführer:|
+    Bearbeiter:
 )
+"""
 
 # Regex that matches persons after a person indicator in a form.
 REGEX_DE_FORM_GENERAL_PERSON = r"""
 (?x)
 (?<=
-    (?:
-        firstname:|
-        lastname:|
-        z.H.|z.H|zH|
-        i.A.|
-        Ansprechpartner:|
-        Geschäftsführer:|
-        Bearbeiter:
-    )
+    {form_general_keywords}
     (?: ( [^\d\n\r] {{0,5}} (\r\n|\r|\n)? )? )
 )
 (
@@ -227,21 +245,25 @@ REGEX_DE_FORM_GENERAL_PERSON = r"""
     )
 ){{0,3}}
 """.format(
-    full_name_w_uppercase=REGEX_FULL_NAME_W_UPPERCASE
+    form_general_keywords=REGEX_DE_FORM_GENERAL_KEYWORDS, full_name_w_uppercase=REGEX_FULL_NAME_W_UPPERCASE
 )
 
 #################
 # LANGUAGE_CODE_EN
 #################
 
+REGEX_EN_GOODBYE_KEYWORDS = r"""
+(?:
+    [Tt][Hh][Aa][Nn][Kk][Ss]|
+    [Rr][Ee][Gg][Aa][Rr][Dd][Ss]|
+    [Cc][Hh][Ee][Ee][Rr][Ss]
+)
+"""
+
 REGEX_EN_GOODBYE_PERSON = r"""
 (?x)
 (?<=
-    (?:
-        [Tt][Hh][Aa][Nn][Kk][Ss]|
-        [Rr][Ee][Gg][Aa][Rr][Dd][Ss]|
-        [Cc][Hh][Ee][Ee][Rr][Ss]
-    )
+    {goodbye_keywords}
     (?:[,])?
     (?: ( [^\S\n\r] {{1,5}} ) | ( [ ] {{0,5}} (\r\n|\r|\n) ) )
     # [^\S\n\r] -> a single whitespace but a line break
@@ -252,7 +274,9 @@ REGEX_EN_GOODBYE_PERSON = r"""
     {name_word_w_lowercase}
 )
 """.format(
-    full_name=REGEX_FULL_NAME, name_word_w_lowercase=REGEX_NAME_WORD_W_LOWERCASE
+    goodbye_keywords=REGEX_EN_GOODBYE_KEYWORDS,
+    full_name=REGEX_FULL_NAME,
+    name_word_w_lowercase=REGEX_NAME_WORD_W_LOWERCASE,
 )
 
 REGEX_EN_TITLED_PERSON = r"""
@@ -280,36 +304,44 @@ REGEX_EN_TITLED_PERSON = r"""
 # LANGUAGE_CODE_ES
 #################
 
+REGEX_ES_GREETING_KEYWORDS = r"""
+(?:
+    (?:
+        [D][i][s][t][i][n][g][u][i][d][o]|
+        [D][i][s][t][i][n][g][u][i][d][a]|
+        [H][o][l][a]|
+        [E][s][t][i][m][a][d][o]|
+        [E][s][t][i][m][a][d][a]
+    )
+)
+"""
+
 REGEX_ES_GREETED_PERSON = r"""
 (?x)
 (?<=
-    (?:
-        (?:
-            [D][i][s][t][i][n][g][u][i][d][o]|
-            [D][i][s][t][i][n][g][u][i][d][a]|
-            [H][o][l][a]|
-            [E][s][t][i][m][a][d][o]|
-            [E][s][t][i][m][a][d][a]
-        )
-    )
+    {greeting_keywords}
     (?:[ ]) {{1,5}}
 )
 {full_name}
 """.format(
-    full_name=REGEX_FULL_NAME
+    greeting_keywords=REGEX_ES_GREETING_KEYWORDS, full_name=REGEX_FULL_NAME
 )
 
+REGEX_ES_GOODBYE_KEYWORDS = r"""
+(?:
+    [A][t][e][n][t][a][m][e][n][t][e]|
+    [Cc][o][r][d][i][a][l][e][s]|
+    [C][o][r][d][i][a][l][m][e][n][t][e]|
+    [Rr][Ee][Cc][Uu][Er][Rr][Dd][Oo][Ss]|
+    [Rr][Ee][Gg][Aa][Rr][Dd][Ss]|
+    [Ss][Aa][Ll][Uu][Dd][Oo]([Ss])?
+)
+"""
+
 REGEX_ES_GOODBYE_PERSON = r"""
 (?x)
 (?<=
-    (?:
-        [A][t][e][n][t][a][m][e][n][t][e]|
-        [Cc][o][r][d][i][a][l][e][s]|
-        [C][o][r][d][i][a][l][m][e][n][t][e]|
-        [Rr][Ee][Cc][Uu][Er][Rr][Dd][Oo][Ss]|
-        [Rr][Ee][Gg][Aa][Rr][Dd][Ss]|
-        [Ss][Aa][Ll][Uu][Dd][Oo]([Ss])?
-    )
+    {goodbye_keywords}
     (?:[,])?
     (?: ( [^\S\n\r] {{1,5}} ) | ( [ ] {{0,5}} (\r\n|\r|\n) ) )
     # [^\S\n\r] -> a single whitespace but a line break
@@ -317,7 +349,7 @@ REGEX_ES_GOODBYE_PERSON = r"""
 )
 {full_name_w_uppercase}
 """.format(
-    full_name_w_uppercase=REGEX_FULL_NAME_W_UPPERCASE
+    goodbye_keywords=REGEX_ES_GOODBYE_KEYWORDS, full_name_w_uppercase=REGEX_FULL_NAME_W_UPPERCASE
 )
 
 REGEX_ES_TITLED_PERSON = r"""
@@ -1,20 +1,98 @@
+import bisect
 import logging
-from typing import List, Optional, Union
-
-import phonenumbers
-from phonenumbers import COUNTRY_CODE_TO_REGION_CODE, SUPPORTED_REGIONS, Leniency
-from phonenumbers.geocoder import country_name_for_number
+from typing import Dict, List, Optional, Tuple, Union
+
+from phonenumbers import (
+    COUNTRY_CODE_TO_REGION_CODE,
+    SUPPORTED_REGIONS,
+    Leniency,
+    PhoneNumberMatch,
+    PhoneNumberMatcher,
+)
+from phonenumbers.phonenumbermatcher import _PATTERN, _SECOND_NUMBER_START_PATTERN
 from presidio_analyzer import AnalysisExplanation, LocalRecognizer, RecognizerResult
 from presidio_analyzer.nlp_engine import NlpArtifacts
 
 from text_anonymizer import antipatterns, constants
-from text_anonymizer.logging_config import SPECIFIC_RECOGNIZERS
+from text_anonymizer.intervals import IntervalIndex
 from text_anonymizer.recognizer_base import CustomRecognizerMixin
-from text_anonymizer.utils import debug_logging
+from text_anonymizer.utils import debug_logging, is_debug_logging_enabled
 
 LOGGER = logging.getLogger(__name__)
 
 
+class _PhoneNumberCandidates:
+    """
+    Candidates of phone numbers in a text, which are shared by the phone number matchers of all regions.
+
+    The candidates are searched only once per text. A search for the next candidate starting at an index is answered by
+    an earlier search, if the earlier search started before the index and found a candidate starting at or after it.
+    Matches of candidates with a leading + are shared as well, since their parsing does not depend on the region.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._search_indexes: List[int] = []
+        self._search_results: List[Optional[Tuple[int, int]]] = []
+        self.international_matches: Dict[Tuple[str, int, int], Optional[PhoneNumberMatch]] = {}
+
+    def search(self, index: int) -> Optional[Tuple[int, int]]:
+        """Returns the start and end position of the next candidate starting at or after index or None, if there is
+        none."""
+        i = bisect.bisect_right(self._search_indexes, index) - 1
+        if i >= 0:
+            span = self._search_results[i]
+            if span is None or index <= span[0]:
+                return span
+        match = _PATTERN.search(self.text, index)
+        span = match.span() if match else None
+        self._search_indexes.insert(i + 1, index)
+        self._search_results.insert(i + 1, span)
+        return span
+
+
+class CustomPhoneNumberMatcher(PhoneNumberMatcher):
+    """
+    PhoneNumberMatcher of the phonenumbers library, which shares the search for candidates and the matches of
+    international candidates with the matchers of the other regions.
+    """
+
+    def __init__(self, candidates: _PhoneNumberCandidates, region: Optional[str], leniency: int):
+        PhoneNumberMatcher.__init__(self, text=candidates.text, region=region, leniency=leniency)
+        self._candidates = candidates
+
+    def _find(self, index):
+        """
+        This is a hard copy of the _find method of the phonenumbers library's PhoneNumberMatcher.
+        The only change is that the candidates are looked up in the shared candidates.
+        """
+        span = self._candidates.search(index)
+        while self._max_tries > 0 and span is not None:
+            start, end = span
+            candidate = self.text[start:end]
+
+            # Check for extra numbers at the end.
+            candidate = self._trim_after_first_match(_SECOND_NUMBER_START_PATTERN, candidate)
+
+            match = self._extract_match(candidate, start)
+            if match is not None:
+                return match
+            # Move along
+            index = start + len(candidate)
+            self._max_tries -= 1
+            span = self._candidates.search(index)
+        return None
+
+    def _parse_and_verify(self, candidate, offset):
+        if not candidate.startswith("+"):
+            return PhoneNumberMatcher._parse_and_verify(self, candidate, offset)
+        key = (candidate, offset, self.leniency)
+        international_matches = self._candidates.international_matches
+        if key not in international_matches:
+            international_matches[key] = PhoneNumberMatcher._parse_and_verify(self, candidate, offset)
+        return international_matches[key]
+
+
 class CustomPhoneNumberRecognizer(LocalRecognizer, CustomRecognizerMixin):
     """
     Recognize phone numbers using the phonenumbers library. Inspired by Presidio´s pre-defined PhoneRecognizer class.
@@ -72,6 +150,9 @@ class CustomPhoneNumberRecognizer(LocalRecognizer, CustomRecognizerMixin):
         nlp_artifacts: NlpArtifacts = None,  # type: ignore
     ) -> List[RecognizerResult]:
         results = []
+        # The results are also kept in a set, since checking whether a result was already found in a list is slow.
+        known_results = set()
+        candidates = _PhoneNumberCandidates(text)
         for entity in entities:
             if entity != self.get_supported_entities()[0]:
                 continue
@@ -80,19 +161,20 @@ class CustomPhoneNumberRecognizer(LocalRecognizer, CustomRecognizerMixin):
             # But only international ones, otherwise many numeric codes will be matched.
             # Leniency.VALID => phone numbers without regional code are rejected.
             # Leniency.POSSIBLE => Validates lenght and accepts numbers without regional code. Accepts two-digit numbers as German phone numbers.
-            for match in phonenumbers.PhoneNumberMatcher(text=text, region=None, leniency=Leniency.POSSIBLE):
+            for match in CustomPhoneNumberMatcher(candidates=candidates, region=None, leniency=Leniency.POSSIBLE):
                 if self._matches_supported_region(match):
                     result = self._get_international_recognizer_result(match)
                     debug_logging(logger=LOGGER, calling_recognizer=type(self).__name__, matches=[match], text=text)
                     results.append(result)
+                    known_results.add(result)
 
             for region in self.get_supported_regions():
                 region = self._align_between_libraries(region)
                 if region:
                     # Match phone numbers for considered region with low leniency/more strict (leniency=Leniency.STRICT_GROUPING).
                     # Details: https://github.com/daviddrysdale/python-phonenumbers/blob/dev/python/phonenumbers/phonenumbermatcher.py
-                    for match in phonenumbers.PhoneNumberMatcher(
-                        text=text, region=region, leniency=Leniency.STRICT_GROUPING
+                    for match in CustomPhoneNumberMatcher(
+                        candidates=candidates, region=region, leniency=Leniency.STRICT_GROUPING
                     ):
                         if self._matches_supported_region(match):
                             international_phone_prefix = match.raw_string.startswith("+")  # type: ignore
@@ -100,9 +182,10 @@ class CustomPhoneNumberRecognizer(LocalRecognizer, CustomRecognizerMixin):
                                 result = self._get_international_recognizer_result(match)
                             else:
                                 result = self._get_regional_recognizer_result(match, text, nlp_artifacts)
-                            if result not in results:
+                            if result not in known_results:
                                 results.append(result)
-                                if SPECIFIC_RECOGNIZERS and type(self).__name__ not in SPECIFIC_RECOGNIZERS:
+                                known_results.add(result)
+                                if not is_debug_logging_enabled(LOGGER, calling_recognizer=type(self).__name__):
                                     continue
                                 LOGGER.debug("Used recognizer: %s", type(self).__name__)
                                 LOGGER.debug(
@@ -126,6 +209,9 @@ class CustomPhoneNumberRecognizer(LocalRecognizer, CustomRecognizerMixin):
         return main_region_code in self.supported_regions
 
     def _get_regional_recognizer_result(self, match, text, nlp_artifacts):
+        # The geocoder is imported on first use, since importing its data takes long.
+        from phonenumbers.geocoder import country_name_for_number
+
         number = match.number
         main_region_code = COUNTRY_CODE_TO_REGION_CODE.get(number.country_code)[0]  # type: ignore
         result = RecognizerResult(
@@ -159,10 +245,7 @@ class CustomPhoneNumberRecognizer(LocalRecognizer, CustomRecognizerMixin):
     @staticmethod
     def _filter_out_li_numbers(results: list[RecognizerResult], text: str) -> list[RecognizerResult]:
         """Removes falsely as phone numbers detected li numbers from results"""
-        li_matches = [match for match in antipatterns.PATTERN_LI_NUMBER.finditer(text)]
-        for result in results:
-            for li_match in li_matches:
-                li_match_start, li_match_end = li_match.span()
-                if antipatterns.span_intersect(li_match_start, li_match_end, result.start, result.end):
-                    results.remove(result)
-        return results
+        li_matches = IntervalIndex(match.span() for match in antipatterns.PATTERN_LI_NUMBER.finditer(text))
+        if not li_matches:
+            return results
+        return [result for result in results if not li_matches.has_boundary_inside(result.start, result.end)]
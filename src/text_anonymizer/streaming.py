@@ -0,0 +1,168 @@
+import logging
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from text_anonymizer import constants
+from text_anonymizer.exceptions import LanguageDetectionError
+from text_anonymizer.text_anonymizer import TextAnonymizer
+from text_anonymizer.utils import chunk_iterable
+
+LOGGER = logging.getLogger(__name__)
+
+
+def anonymize_lines(
+    text_anonymizer: TextAnonymizer,
+    lines: Iterable[str],
+    language: Optional[str] = None,
+    detect_language: bool = False,
+    fallback_language: Optional[str] = None,
+    entities: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    anonymize_complete_vin: bool = False,
+    technique: str = constants.TECHNIQUE_REPLACE,
+    batch_size: int = constants.DEFAULT_BATCH_SIZE,
+) -> Iterator[str]:
+    """Lazily anonymize lines, e.g. of an open log file or of sys.stdin.
+
+    The lines are consumed in batches of batch_size lines, which are processed at once with the process_batch method
+    of the text anonymizer. Hence, memory usage is bounded, no matter how many lines are given, and anonymized lines
+    are yielded as soon as their batch is processed.
+
+    Args:
+        text_anonymizer (TextAnonymizer): The text anonymizer used to process the lines.
+        lines (Iterable[str]): The lines to anonymize. Line endings are kept.
+        language (Optional[str], optional): The language of the lines. See the process method of TextAnonymizer.
+            Defaults to None.
+        detect_language (bool, optional): Determines whether the language should be detected. Since single lines are
+            often too short for a reliable detection, the language is detected once per batch of lines. Can only be set
+            to True if language is None, otherwise a ValueError is raised. Defaults to False.
+        fallback_language (Optional[str], optional): The language of a batch whose language cannot be detected. If set
+            to 'None' a LanguageDetectionError is raised instead. Defaults to None.
+        entities, regions, anonymize_complete_vin, technique: See the process method of TextAnonymizer.
+        batch_size (int, optional): The number of lines processed at once. Defaults to constants.DEFAULT_BATCH_SIZE.
+
+    Returns:
+        Iterator[str]: The anonymized lines in the order of the given lines.
+    """
+    for _, line_ending, result in _process_lines(
+        text_anonymizer=text_anonymizer,
+        lines=lines,
+        language=language,
+        detect_language=detect_language,
+        fallback_language=fallback_language,
+        entities=entities,
+        regions=regions,
+        anonymize=True,
+        anonymize_complete_vin=anonymize_complete_vin,
+        technique=technique,
+        detect=False,
+        batch_size=batch_size,
+    ):
+        yield result["text"] + line_ending
+
+
+def detect_lines(
+    text_anonymizer: TextAnonymizer,
+    lines: Iterable[str],
+    language: Optional[str] = None,
+    detect_language: bool = False,
+    fallback_language: Optional[str] = None,
+    entities: Optional[List[str]] = None,
+    regions: Optional[List[str]] = None,
+    batch_size: int = constants.DEFAULT_BATCH_SIZE,
+) -> Iterator[Dict]:
+    """Lazily find entities in lines, e.g. of an open log file or of sys.stdin.
+
+    Args:
+        See the anonymize_lines function.
+
+    Returns:
+        Iterator[Dict]: One record per line containing entities, in the order of the given lines. Each record has the
+            following schema:
+                {
+                    'line': int,  # Number of the line, starting at 1.
+                    'entities': List[
+                        {
+                            start: int,  # Start position of the entity in the line.
+                            end: int,  # End position of the entity in the line.
+                            type: str  # Type of the entity.
+                        }
+                    ]
+                }
+    """
+    for line_number, _, result in _process_lines(
+        text_anonymizer=text_anonymizer,
+        lines=lines,
+        language=language,
+        detect_language=detect_language,
+        fallback_language=fallback_language,
+        entities=entities,
+        regions=regions,
+        anonymize=False,
+        anonymize_complete_vin=False,
+        technique=constants.TECHNIQUE_REPLACE,
+        detect=True,
+        batch_size=batch_size,
+    ):
+        if result["entities"]:
+            yield {"line": line_number, "entities": result["entities"]}
+
+
+def _process_lines(
+    text_anonymizer: TextAnonymizer,
+    lines: Iterable[str],
+    language: Optional[str],
+    detect_language: bool,
+    fallback_language: Optional[str],
+    entities: Optional[List[str]],
+    regions: Optional[List[str]],
+    anonymize: bool,
+    anonymize_complete_vin: bool,
+    technique: str,
+    detect: bool,
+    batch_size: int,
+) -> Iterator[Tuple[int, str, Dict]]:
+    """Yields the line number, the line ending and the result of the process method for each line."""
+    if detect_language is True and language is not None:
+        raise ValueError(
+            f"When detect_language is set to True, language needs to be set to None. '{language}' was given"
+        )
+
+    line_number = 0
+    for batch in chunk_iterable(lines, chunk_size=batch_size):
+        texts, line_endings = zip(*[_split_line_ending(line) for line in batch])
+
+        batch_language = language
+        if detect_language:
+            batch_language = _detect_batch_language(text_anonymizer, texts, fallback_language)
+
+        results = text_anonymizer.process_batch(
+            texts=list(texts),
+            language=batch_language,
+            entities=entities,
+            regions=regions,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+            batch_size=batch_size,
+        )
+        for line_ending, result in zip(line_endings, results):
+            line_number += 1
+            yield line_number, line_ending, result
+
+
+def _split_line_ending(line: str) -> Tuple[str, str]:
+    text = line.rstrip("\r\n")
+    return text, line[len(text) :]
+
+
+def _detect_batch_language(
+    text_anonymizer: TextAnonymizer, texts: Tuple[str, ...], fallback_language: Optional[str]
+) -> str:
+    try:
+        return text_anonymizer.detect_language_of("\n".join(texts))
+    except LanguageDetectionError:
+        if fallback_language is None:
+            raise
+        LOGGER.warning("Language of batch could not be detected. Use fallback language '%s'", fallback_language)
+        return fallback_language
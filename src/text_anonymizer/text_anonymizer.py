@@ -1,21 +1,49 @@
+import hashlib
+import importlib.metadata
+import itertools
 import logging
-from typing import Dict, List, Optional
+import threading
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
 
 from lingua import Language, LanguageDetector, LanguageDetectorBuilder
-from presidio_analyzer import AnalyzerEngine
-from presidio_analyzer.nlp_engine import NlpEngineProvider
-from presidio_anonymizer import AnonymizerEngine
+from presidio_analyzer import AnalyzerEngine, RecognizerRegistry, RecognizerResult
+from presidio_analyzer.nlp_engine import NerModelConfiguration, NlpArtifacts
 
 from text_anonymizer import constants
+from text_anonymizer.analyzer_engine import CustomAnalyzerEngine
+from text_anonymizer.anonymizer_engine import CustomAnonymizerEngine
+from text_anonymizer.asynchronous import AsyncTextAnonymizer
+from text_anonymizer.cache import PersistentResultCache, ResultCache
 from text_anonymizer.exceptions import LanguageDetectionError
+from text_anonymizer.intervals import remove_duplicates
+from text_anonymizer.nlp_engine import CustomSpacyNlpEngine
+from text_anonymizer.recognizer_base import CustomRecognizerMixin
 from text_anonymizer.recognizer_manager import RecognizerManager
 from text_anonymizer.utils import (
+    chunk_iterable,
     debug_logging,
     deprecated_method,
+    get_library_version,
+    is_debug_logging_enabled,
     log_and_reraise_exceptions,
     process_key_arguments,
+    split_text_into_chunks,
+    validate_chunk_arguments,
 )
 
+if TYPE_CHECKING:
+    from text_anonymizer.parallel import ParallelTextAnonymizer
+
 LOGGER = logging.getLogger(__name__)
 
 
@@ -30,6 +58,13 @@ class TextAnonymizer:
         supported_languages: Optional[List[str]] = None,
         supported_entities: Optional[List[str]] = None,
         supported_regions: Optional[List[str]] = None,
+        preload_language_models: bool = False,
+        lazy_load_models: bool = False,
+        model_preset: Optional[str] = None,
+        language_models: Optional[Dict[str, str]] = None,
+        cache_size: int = 0,
+        cache_max_memory: Optional[int] = None,
+        cache_path: Optional[str] = None,
     ):
         """Construct a text anonymizer instance.
 
@@ -40,6 +75,33 @@ class TextAnonymizer:
                 If set to 'None' all available entities are supported. Defaults to None.
             supported_regions (Optional[List[str]], optional): The regions of origin of the entities the
                 text anonymizer should support. If set to 'None' all available regions are supported. Defaults to None.
+            preload_language_models (bool, optional): Determines whether the language models of the language detection
+                are loaded eagerly when constructing the instance instead of lazily on first use. This increases the
+                start-up time but avoids a slow first call to process with detect_language set to True.
+                Defaults to False.
+            lazy_load_models (bool, optional): Determines whether the spaCy models of the supported languages are loaded
+                lazily. If set to 'True' the model of a language is loaded the first time a text in this language is
+                processed, which reduces start-up time and memory usage if some languages are rarely processed. Use the
+                preload method to load models in advance. If set to 'False' all models are loaded when constructing the
+                instance. Defaults to False.
+            model_preset (Optional[str], optional): The preset of spaCy models to use. One of 'fast' (small models),
+                'balanced' (large models) and 'accurate' (transformer model for English, large models otherwise).
+                Faster presets increase the throughput at the cost of a lower recall of the NER based recognizers, e.g.
+                for persons. If set to 'None' the default models are used, which equal the 'accurate' preset.
+                Defaults to None.
+            language_models (Optional[Dict[str, str]], optional): The spaCy models to use for single languages, e.g.
+                {'en': 'en_core_web_md'}. Values can be names of installed or downloadable spaCy models or paths to
+                model directories. Overrides the models of the model_preset for the given languages. Defaults to None.
+            cache_size (int, optional): The maximum number of results kept in a least recently used cache. Texts that
+                are processed again with the same arguments are answered from the cache instead of being analyzed.
+                Only a digest of each text is kept, not the text itself. If set to 0 no results are cached.
+                Defaults to 0.
+            cache_max_memory (Optional[int], optional): The maximum estimated memory of the cached results in bytes.
+                If set to 'None' only the number of results is limited. Defaults to None.
+            cache_path (Optional[str], optional): The path of a SQLite database file, which keeps results across runs
+                and processes. Results are only reused by text anonymizers with the same library version, recognizers
+                and spaCy models. If cache_size is greater than 0, results are looked up in memory first. If set to
+                'None' no results are persisted. Defaults to None.
 
         In order to get an overview of the available languages, entities and regions you can call the
         text_anonymizer_info function or consult the README.
@@ -53,21 +115,6 @@ class TextAnonymizer:
             regions=supported_regions,
         )
 
-        # Create NlpEngine.
-        nlp_engine_configuration = self._update_nlp_configuration(supported_languages)
-        provider = NlpEngineProvider(nlp_configuration=nlp_engine_configuration)
-        nlp_engine = provider.create_engine()
-
-        # Create AnalyzerEngine.
-        self._presidio_analyzer = AnalyzerEngine(
-            registry=None,  # type: ignore
-            supported_languages=supported_languages,
-            nlp_engine=nlp_engine,
-        )
-
-        # Create AnonymizerEngine.
-        self._presidio_anonymizer = AnonymizerEngine()
-
         # Create recognizers.
         recognizer_manager = RecognizerManager(
             languages=supported_languages,
@@ -76,23 +123,227 @@ class TextAnonymizer:
         )
         self._recognizer_manager = recognizer_manager
 
+        # Create NlpEngine.
+        nlp_engine_configuration = self._update_nlp_configuration(
+            supported_languages, model_preset=model_preset, language_models=language_models
+        )
+        nlp_engine = CustomSpacyNlpEngine(
+            models=nlp_engine_configuration["models"],  # type: ignore
+            ner_model_configuration=NerModelConfiguration.from_dict(
+                nlp_engine_configuration["ner_model_configuration"]  # type: ignore
+            ),
+            lazy_loading=lazy_load_models,
+            excluded_components=self._get_excluded_spacy_components(recognizer_manager.recognizers),
+        )
+        nlp_engine.load()
+
+        # AnalyzerEngines are created per selection of recognizers on first use and never modified afterwards.
+        # This allows to use one instance in several threads at once.
+        self._presidio_analyzers: Dict[Tuple[str, FrozenSet[str], FrozenSet[str]], AnalyzerEngine] = {}
+        self._presidio_analyzers_lock = threading.Lock()
+
+        # Create AnonymizerEngine.
+        self._presidio_anonymizer = CustomAnonymizerEngine()
+
         # Set remaining instance variables.
         self._supported_languages = supported_languages
         self._supported_entities = supported_entities
         self._supported_regions = supported_regions
         self._nlp_engine = nlp_engine
 
+        # Language detectors are built once per minimum relative distance and reused.
+        self._language_detectors: Dict[float, LanguageDetector] = {}
+        self._language_detectors_lock = threading.Lock()
+        self._preload_language_models = preload_language_models
+        if preload_language_models:
+            self._get_language_detector(constants.LANGUAGE_DETECTION_PROBABILITY_DISTANCE)
+
+        # Results of the process methods, if caching is enabled.
+        if cache_size < 0:
+            raise ValueError("Argument cache_size must not be negative. Given: {}.".format(cache_size))
+        persistent_cache = None
+        if cache_path is not None:
+            persistent_cache = PersistentResultCache(
+                cache_path, fingerprint=self._create_cache_fingerprint(), version=get_library_version()
+            )
+        self._persistent_cache = persistent_cache
+        self._result_cache: Optional[Union[ResultCache, PersistentResultCache]] = persistent_cache
+        if cache_size:
+            self._result_cache = ResultCache(cache_size, max_memory=cache_max_memory, persistent_cache=persistent_cache)
+
+        # Used by the coroutines aprocess and aprocess_batch.
+        self._async_text_anonymizer = AsyncTextAnonymizer(text_anonymizer=self)
+
+    @log_and_reraise_exceptions(LOGGER)
+    def preload(self, languages: Optional[List[str]] = None) -> None:
+        """Load the spaCy models of the given languages, if they are not loaded yet.
+
+        This is only relevant for instances constructed with lazy_load_models set to True. Otherwise all models are
+        already loaded.
+
+        Args:
+            languages (Optional[List[str]], optional): The languages whose models should be loaded. If set to 'None'
+                the models of all supported languages are loaded. Defaults to None.
+        """
+        if languages is None:
+            languages = self._supported_languages
+
+        if any([language not in self._supported_languages for language in languages]):
+            raise ValueError(
+                "This anonymizer supports the following languages: {}. Given: {}.".format(
+                    self._supported_languages, languages
+                )
+            )
+
+        for language in languages:
+            self._nlp_engine.load_language(language)
+
+    def pool(
+        self,
+        n_workers: Optional[int] = None,
+        preload_models: bool = True,
+        max_restarts: int = constants.DEFAULT_MAX_WORKER_RESTARTS,
+    ) -> "ParallelTextAnonymizer":
+        """Create a ParallelTextAnonymizer, which processes texts with this instance on several worker processes.
+        The workers are forked from the current process and share the loaded models copy-on-write.
+
+        Args:
+            n_workers (Optional[int], optional): The number of worker processes. If set to 'None' one worker per CPU
+                is started. Defaults to None.
+            preload_models (bool, optional): Determines whether the spaCy models of all supported languages are loaded
+                before the workers are forked. Defaults to True.
+            max_restarts (int, optional): The number of times the workers are started again during one call, if a
+                worker process dies. Defaults to constants.DEFAULT_MAX_WORKER_RESTARTS.
+
+        Returns:
+            ParallelTextAnonymizer: The parallel text anonymizer. Use it as a context manager to stop the workers.
+        """
+        from text_anonymizer.parallel import ParallelTextAnonymizer
+
+        return ParallelTextAnonymizer(
+            text_anonymizer=self, n_workers=n_workers, preload_models=preload_models, max_restarts=max_restarts
+        )
+
+    def get_cache_statistics(self) -> Optional[Dict[str, int]]:
+        """Returns the number of hits, misses and entries and the estimated memory in bytes of the result cache or
+        None, if caching is disabled."""
+        return self._result_cache.get_statistics() if self._result_cache is not None else None
+
+    def clear_cache(self) -> None:
+        """Remove all results from the result cache and reset its statistics."""
+        if self._result_cache is not None:
+            self._result_cache.clear()
+
+    def prune_cache(self) -> int:
+        """Remove the results stored by other versions of this library from the persistent result cache.
+
+        Returns:
+            int: The number of removed results. 0, if no cache_path is set.
+        """
+        return self._persistent_cache.prune() if self._persistent_cache is not None else 0
+
+    def _create_cache_fingerprint(self) -> str:
+        """Returns a digest of everything besides the arguments of the process methods that determines the results,
+        i.e. the versions of this library and presidio, the recognizers and the spaCy models."""
+        recognizers = sorted(
+            (
+                type(recognizer).__module__,
+                type(recognizer).__qualname__,
+                recognizer.name,
+                recognizer.supported_language,
+                tuple(recognizer.supported_entities),
+            )
+            for recognizer in self._recognizer_manager.recognizers
+        )
+        models = sorted((model["lang_code"], model["model_name"]) for model in self._nlp_engine.models)
+        configuration = (
+            get_library_version(),
+            importlib.metadata.version("presidio-analyzer"),
+            recognizers,
+            models,
+            self._nlp_engine.excluded_components,
+        )
+        return hashlib.sha256(repr(configuration).encode("utf-8")).hexdigest()
+
+    def detect_language_of(self, text: str) -> str:
+        """Detect the language of a text the same way the process method does, if detect_language is set to True.
+
+        Args:
+            text (str): The text whose language should be detected.
+
+        Returns:
+            str: The ISO 639-1 code of the detected language.
+
+        Raises:
+            LanguageDetectionError: If no supported language can be detected with high confidence.
+        """
+        return self._apply_language_detection(text)
+
     @staticmethod
-    def _update_nlp_configuration(supported_languages: list[str]) -> dict[str, str | list[dict[str, str]]]:
-        """Returns nlp-configuration that only contains language models that align with supported languages"""
+    def _update_nlp_configuration(
+        supported_languages: list[str],
+        model_preset: Optional[str] = None,
+        language_models: Optional[Dict[str, str]] = None,
+    ) -> dict[str, str | list[dict[str, str]]]:
+        """Returns nlp-configuration that only contains language models that align with supported languages.
+        The models are taken from the given preset and single language models, if any, otherwise from the default configuration.
+        """
+        if model_preset is not None and model_preset not in constants.AVAILABLE_MODEL_PRESETS:
+            raise ValueError(
+                "The following model presets are available: {}. Given: {}".format(
+                    constants.AVAILABLE_MODEL_PRESETS, model_preset
+                )
+            )
+        if language_models is None:
+            language_models = {}
+        if any([language not in supported_languages for language in language_models]):
+            raise ValueError(
+                "Models can only be set for supported languages: {}. Given: {}".format(
+                    supported_languages, list(language_models.keys())
+                )
+            )
+
+        if model_preset is None:
+            models = [model_dict.copy() for model_dict in constants.NLP_MODELS_CONFIGS]
+        else:
+            models = [
+                {"lang_code": lang_code, "model_name": model_name}
+                for lang_code, model_name in constants.NLP_MODEL_PRESETS[model_preset].items()
+            ]
+        for model_dict in models:
+            model_dict["model_name"] = language_models.get(model_dict["lang_code"], model_dict["model_name"])
+
         nlp_engine_configuration = constants.NLP_ENGINE_CONFIGURATION.copy()
         nlp_engine_configuration["models"] = [
-            model_dict for model_dict in constants.NLP_MODELS_CONFIGS if model_dict["lang_code"] in supported_languages
+            model_dict for model_dict in models if model_dict["lang_code"] in supported_languages
         ]
         debugging_text = "Selected language models: {}".format(nlp_engine_configuration["models"])
         debug_logging(logger=LOGGER, log_message=debugging_text)
         return nlp_engine_configuration
 
+    @staticmethod
+    def _get_excluded_spacy_components(recognizers: List[CustomRecognizerMixin]) -> List[str]:
+        """Returns the components of the spaCy pipelines that set none of the attributes required by the given recognizers."""
+        required_attributes = {
+            attribute for recognizer in recognizers for attribute in recognizer.get_required_spacy_attributes()
+        }
+        required_components = {
+            component
+            for attribute in required_attributes
+            for component in constants.SPACY_COMPONENTS_BY_ATTRIBUTE[attribute]
+        }
+        excluded_components = sorted(
+            {
+                component
+                for components in constants.SPACY_COMPONENTS_BY_ATTRIBUTE.values()
+                for component in components
+                if component not in required_components
+            }
+        )
+        debugging_text = "Excluded spaCy components: {}".format(excluded_components)
+        debug_logging(logger=LOGGER, log_message=debugging_text)
+        return excluded_components
+
     def _validate_method_arguments(
         self,
         technique: str,
@@ -102,6 +353,8 @@ class TextAnonymizer:
         language: Optional[str] = None,
         entities: Optional[List[str]] = None,
         regions: Optional[List[str]] = None,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: int = constants.DEFAULT_CHUNK_OVERLAP,
     ):
         """Process and validate the arguments given to the self.process method and self.anonymize method.
 
@@ -115,6 +368,10 @@ class TextAnonymizer:
                 Defaults to None.
             regions (Optional[List[str]], optional): The regions argument given to the self.process method.
                 Defaults to None.
+            chunk_size (Optional[int], optional): The chunk_size argument given to the self.process method. Defaults
+                to None.
+            chunk_overlap (int, optional): The chunk_overlap argument given to the self.process method. Defaults to
+                constants.DEFAULT_CHUNK_OVERLAP.
 
         Returns:
             str, list[str], list[str], str: the valid language, entities, regions and technique
@@ -162,6 +419,10 @@ class TextAnonymizer:
         if not (anonymize or detect):
             raise ValueError(error_template_no_tasks.format(["anonymize", "detect"], [anonymize, detect]))
 
+        # Chunking arguments are checked independently of the length of the text.
+        if chunk_size is not None:
+            validate_chunk_arguments(chunk_size, chunk_overlap)
+
         return language, entities, regions, technique
 
     @log_and_reraise_exceptions(LOGGER)
@@ -176,6 +437,8 @@ class TextAnonymizer:
         anonymize_complete_vin: bool = False,
         technique: str = constants.TECHNIQUE_REPLACE,
         detect: bool = False,
+        chunk_size: Optional[int] = None,
+        chunk_overlap: int = constants.DEFAULT_CHUNK_OVERLAP,
     ) -> Dict:
         """Process a text. Main method for text anonymization tasks.
 
@@ -204,6 +467,16 @@ class TextAnonymizer:
                 found in the text. Each entity is a dict containing the following keys: start, end, type. 'start' and
                 'end' contain the start and end position of the entity. 'type' contains the type of the entity. If the
                 list is empty, the text does not contain entities. Defaults to False.
+            chunk_size (Optional[int], optional): The maximum number of characters analyzed at once. If set and the
+                text is longer, the text is split into chunks at line, sentence or word boundaries, which are analyzed
+                independently. This bounds the memory usage of the spaCy pipeline for very long texts. If
+                detect_language is set to True, the language is detected for each chunk. If set to 'None' the text is
+                analyzed at once. Defaults to None.
+            chunk_overlap (int, optional): The maximum number of characters consecutive chunks share. The next chunk
+                starts after the first line, sentence or word boundary inside this overlap, so the actual overlap can
+                be shorter by up to one word. Entities that are cut at the end of a chunk and fit into the actual
+                overlap are found in the next chunk. Entities found in two chunks are reported once. Must be smaller
+                than chunk_size. Defaults to constants.DEFAULT_CHUNK_OVERLAP.
 
         Returns:
             Dict: The result of the processing. The dictionary has the following schema and content,
@@ -233,21 +506,503 @@ class TextAnonymizer:
             language=language,
             entities=entities,
             regions=regions,
+            chunk_size=chunk_size,
+            chunk_overlap=chunk_overlap,
         )
         LOGGER.info("Pre processing text character count: %s", len(text))
 
+        process_in_chunks = chunk_size is not None and len(text) > chunk_size
+        cache_key = None
+        if self._result_cache is not None:
+            cache_key = self._result_cache.create_key(
+                text,
+                self._get_cache_configuration(
+                    language=language,
+                    detect_language=detect_language,
+                    entities=entities,
+                    regions=regions,
+                    anonymize=anonymize,
+                    anonymize_complete_vin=anonymize_complete_vin,
+                    technique=technique,
+                    detect=detect,
+                    chunking=(chunk_size, chunk_overlap) if process_in_chunks else None,
+                ),
+            )
+            result = self._result_cache.get(cache_key)
+            if result is not None:
+                return result
+
+        if process_in_chunks:
+            analyzer_result = self._analyze_in_chunks(
+                text=text,
+                language=language,
+                detect_language=detect_language,
+                entities=entities,
+                regions=regions,
+                chunk_size=chunk_size,  # type: ignore
+                chunk_overlap=chunk_overlap,
+            )
+        else:
+            if detect_language:
+                language = self._apply_language_detection(text)
+
+            # Analyze text.
+            analyzer_result = self._analyze(text=text, language=language, entities=entities, regions=regions)
+
+        result = self._create_result(
+            text=text,
+            analyzer_result=analyzer_result,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+        )
+        if cache_key is not None:
+            self._result_cache.put(cache_key, result)  # type: ignore
+        return result
+
+    async def aprocess(
+        self,
+        text: str,
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+    ) -> Dict:
+        """Process a text without blocking the event loop. Coroutine version of the process method.
+
+        The text is processed on a thread pool. Concurrent requests with equal arguments are collected and processed
+        at once like a batch of the process_batch method. Create an AsyncTextAnonymizer to configure the number of
+        threads and the collection of requests.
+
+        Args:
+            See the process method.
+
+        Returns:
+            Dict: The result of the processing. See the process method.
+        """
+        return await self._async_text_anonymizer.process(
+            text=text,
+            language=language,
+            detect_language=detect_language,
+            entities=entities,
+            regions=regions,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+        )
+
+    async def aprocess_batch(
+        self,
+        texts: List[str],
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+    ) -> List[Dict]:
+        """Process a batch of texts without blocking the event loop. Coroutine version of the process_batch method.
+
+        Args:
+            See the process_batch method.
+
+        Returns:
+            List[Dict]: The results of the processing in the order of the given texts.
+        """
+        return await self._async_text_anonymizer.process_batch(
+            texts=texts,
+            language=language,
+            detect_language=detect_language,
+            entities=entities,
+            regions=regions,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+            batch_size=batch_size,
+        )
+
+    @log_and_reraise_exceptions(LOGGER)
+    def process_batch(
+        self,
+        texts: List[str],
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> List[Dict]:
+        """Process a batch of texts. The texts are grouped by language and each group is run through the spaCy
+        pipeline at once, which is considerably faster than calling the process method for each text.
+
+        Args:
+            texts (List[str]): The texts that should be processed.
+            language, detect_language, entities, regions, anonymize, anonymize_complete_vin, technique, detect:
+                See the process method. The arguments apply to every text of the batch. If detect_language is set to
+                True, the language is detected for each text separately.
+            batch_size (int, optional): The number of texts spaCy buffers per batch. Defaults to
+                constants.DEFAULT_BATCH_SIZE.
+            n_process (int, optional): The number of processes spaCy uses to process the texts. Defaults to 1.
+
+        Returns:
+            List[Dict]: The results of the processing in the order of the given texts. Each result has the schema
+                described in the process method.
+        """
+        # Process and validate arguments.
+        language, entities, regions, technique = self._validate_method_arguments(
+            technique=technique,
+            anonymize=anonymize,
+            detect=detect,
+            detect_language=detect_language,
+            language=language,
+            entities=entities,
+            regions=regions,
+        )
+
+        return self._process_batch(
+            texts=list(texts),
+            language=language,
+            detect_language=detect_language,
+            entities=entities,
+            regions=regions,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+            batch_size=batch_size,
+            n_process=n_process,
+        )
+
+    def process_iterator(
+        self,
+        texts: Iterable[str],
+        language: Optional[str] = None,
+        detect_language: bool = False,
+        entities: Optional[List[str]] = None,
+        regions: Optional[List[str]] = None,
+        anonymize: bool = True,
+        anonymize_complete_vin: bool = False,
+        technique: str = constants.TECHNIQUE_REPLACE,
+        detect: bool = False,
+        batch_size: int = constants.DEFAULT_BATCH_SIZE,
+        n_process: int = 1,
+    ) -> Iterator[Dict]:
+        """Lazily process an iterable of texts. Generator version of the process_batch method.
+
+        The texts are consumed in chunks of batch_size * n_process texts, each chunk is processed like a batch of the
+        process_batch method and its results are yielded in the order of the given texts. Hence, only one chunk is
+        held in memory at a time.
+
+        Args:
+            See the process_batch method.
+
+        Returns:
+            Iterator[Dict]: The results of the processing in the order of the given texts.
+        """
+        # Process and validate arguments.
+        language, entities, regions, technique = self._validate_method_arguments(
+            technique=technique,
+            anonymize=anonymize,
+            detect=detect,
+            detect_language=detect_language,
+            language=language,
+            entities=entities,
+            regions=regions,
+        )
+
+        for chunk in chunk_iterable(texts, chunk_size=batch_size * n_process):
+            yield from self._process_batch(
+                texts=chunk,
+                language=language,
+                detect_language=detect_language,
+                entities=entities,
+                regions=regions,
+                anonymize=anonymize,
+                anonymize_complete_vin=anonymize_complete_vin,
+                technique=technique,
+                detect=detect,
+                batch_size=batch_size,
+                n_process=n_process,
+            )
+
+    def _process_batch(
+        self,
+        texts: List[str],
+        language: Optional[str],
+        detect_language: bool,
+        entities: List[str],
+        regions: List[str],
+        anonymize: bool,
+        anonymize_complete_vin: bool,
+        technique: str,
+        detect: bool,
+        batch_size: int,
+        n_process: int,
+    ) -> List[Dict]:
+        """Process a batch of texts with already validated arguments. See the process_batch method.
+
+        If caching is enabled, only texts without cached results are processed and each of them only once.
+        """
+        process_arguments = dict(
+            language=language,
+            detect_language=detect_language,
+            entities=entities,
+            regions=regions,
+            anonymize=anonymize,
+            anonymize_complete_vin=anonymize_complete_vin,
+            technique=technique,
+            detect=detect,
+        )
+        if self._result_cache is None:
+            return self._process_uncached_batch(
+                texts=texts, batch_size=batch_size, n_process=n_process, **process_arguments  # type: ignore
+            )
+
+        configuration = self._get_cache_configuration(chunking=None, **process_arguments)  # type: ignore
+        cache_keys = [self._result_cache.create_key(text, configuration) for text in texts]
+        results = [self._result_cache.get(cache_key) for cache_key in cache_keys]
+
+        # Identical texts share a key, hence each missing result is computed once.
+        missing_results = {
+            cache_key: i for i, (cache_key, result) in enumerate(zip(cache_keys, results)) if result is None
+        }
+        if missing_results:
+            computed_results = dict(
+                zip(
+                    missing_results,
+                    self._process_uncached_batch(
+                        texts=[texts[i] for i in missing_results.values()],
+                        batch_size=batch_size,
+                        n_process=n_process,
+                        **process_arguments,  # type: ignore
+                    ),
+                )
+            )
+            for cache_key, result in computed_results.items():
+                self._result_cache.put(cache_key, result)
+            results = [
+                ResultCache.copy_result(computed_results[cache_key]) if result is None else result
+                for cache_key, result in zip(cache_keys, results)
+            ]
+
+        return results  # type: ignore
+
+    def _process_uncached_batch(
+        self,
+        texts: List[str],
+        language: Optional[str],
+        detect_language: bool,
+        entities: List[str],
+        regions: List[str],
+        anonymize: bool,
+        anonymize_complete_vin: bool,
+        technique: str,
+        detect: bool,
+        batch_size: int,
+        n_process: int,
+    ) -> List[Dict]:
+        """Process a batch of texts without using the result cache. See the process_batch method."""
+        LOGGER.info("Pre processing batch of %s texts", len(texts))
+
         if detect_language:
-            language = self._apply_language_detection(text)
+            languages = [self._apply_language_detection(text) for text in texts]
+        else:
+            languages = [language] * len(texts)
 
-        # Select recognizers.
-        recognizers = self._recognizer_manager.select_recognizers(language=language, entities=entities, regions=regions)
+        # Run the nlp pipeline once per language and analyze the texts in the order of the batch.
+        results: List[Dict] = [{}] * len(texts)
+        for batch_language in dict.fromkeys(languages):
+            text_idxs = [i for i, text_language in enumerate(languages) if text_language == batch_language]
+            presidio_analyzer = self._get_presidio_analyzer(language=batch_language, entities=entities, regions=regions)
+            if self._requires_nlp_artifacts(presidio_analyzer):
+                nlp_artifacts_batch = (
+                    nlp_artifacts
+                    for _, nlp_artifacts in self._nlp_engine.process_batch(
+                        texts=[texts[i] for i in text_idxs],
+                        language=batch_language,
+                        batch_size=batch_size,
+                        n_process=n_process,
+                    )
+                )
+            else:
+                # The spaCy pipeline is skipped and the texts are tokenized one by one during analysis.
+                nlp_artifacts_batch = itertools.repeat(None)
 
-        # Update AnalyzerEngine.
-        self._presidio_analyzer.registry.recognizers = recognizers
+            for i, nlp_artifacts in zip(text_idxs, nlp_artifacts_batch):
+                analyzer_result = self._analyze(
+                    text=texts[i],
+                    language=batch_language,
+                    entities=entities,
+                    regions=regions,
+                    nlp_artifacts=nlp_artifacts,
+                )
+                results[i] = self._create_result(
+                    text=texts[i],
+                    analyzer_result=analyzer_result,
+                    anonymize=anonymize,
+                    anonymize_complete_vin=anonymize_complete_vin,
+                    technique=technique,
+                    detect=detect,
+                )
+
+        return results
+
+    def _analyze(
+        self,
+        text: str,
+        language: str,
+        entities: List[str],
+        regions: List[str],
+        nlp_artifacts: Optional[NlpArtifacts] = None,
+    ) -> List[RecognizerResult]:
+        """Analyze a text with the recognizers matching the given language, entities and regions.
+
+        Args:
+            text (str): The text that should be analyzed.
+            language (str): The language of the text.
+            entities (List[str]): The entities that should be found.
+            regions (List[str]): The regions of origin of the entities that should be found.
+            nlp_artifacts (Optional[NlpArtifacts], optional): Precomputed output of the nlp engine for the text. If
+                set to 'None' the nlp engine is run on the text. Defaults to None.
+
+        Returns:
+            List[RecognizerResult]: The entities found in the text.
+        """
+        # Get AnalyzerEngine for the selected recognizers.
+        presidio_analyzer = self._get_presidio_analyzer(language=language, entities=entities, regions=regions)
+
+        # Skip the spaCy pipeline, if none of the selected recognizers uses its output.
+        if nlp_artifacts is None and not self._requires_nlp_artifacts(presidio_analyzer):
+            nlp_artifacts = self._nlp_engine.tokenize_text(text=text, language=language)
 
         # Analyze text.
-        analyzer_result = self._presidio_analyzer.analyze(text=text, language=language, entities=entities)
+        analyzer_result = presidio_analyzer.analyze(
+            text=text, language=language, entities=entities, nlp_artifacts=nlp_artifacts
+        )
+        return analyzer_result
+
+    def _analyze_in_chunks(
+        self,
+        text: str,
+        language: Optional[str],
+        detect_language: bool,
+        entities: List[str],
+        regions: List[str],
+        chunk_size: int,
+        chunk_overlap: int,
+    ) -> List[RecognizerResult]:
+        """Analyze a long text chunk by chunk. The positions of the results are relative to the whole text and results
+        found in the overlap of two chunks are merged."""
+        chunks = split_text_into_chunks(text=text, chunk_size=chunk_size, chunk_overlap=chunk_overlap)
+        LOGGER.info("Split text into %s chunks", len(chunks))
+
+        analyzer_result = []
+        for offset, chunk in chunks:
+            chunk_language = self._apply_language_detection(chunk) if detect_language else language
+            chunk_result = self._analyze(text=chunk, language=chunk_language, entities=entities, regions=regions)
+            for result in chunk_result:
+                result.start += offset
+                result.end += offset
+            analyzer_result.extend(chunk_result)
+
+        # Remove results found in two chunks and results cut at the end of a chunk, which are contained in the complete
+        # result found in the next chunk.
+        return remove_duplicates(analyzer_result)
 
+    @staticmethod
+    def _get_cache_configuration(
+        language: Optional[str],
+        detect_language: bool,
+        entities: List[str],
+        regions: List[str],
+        anonymize: bool,
+        anonymize_complete_vin: bool,
+        technique: str,
+        detect: bool,
+        chunking: Optional[Tuple[int, int]],
+    ) -> Tuple:
+        """Returns the validated arguments of a process method, which determine its result, as hashable tuple."""
+        return (
+            language,
+            detect_language,
+            tuple(entities),
+            tuple(regions),
+            anonymize,
+            anonymize_complete_vin,
+            technique,
+            detect,
+            chunking,
+        )
+
+    @staticmethod
+    def _requires_nlp_artifacts(presidio_analyzer: AnalyzerEngine) -> bool:
+        """Returns True, when one of the recognizers of the given AnalyzerEngine uses the output of the spaCy pipeline."""
+        return any([recognizer.requires_nlp_artifacts() for recognizer in presidio_analyzer.registry.recognizers])
+
+    def _get_presidio_analyzer(self, language: str, entities: List[str], regions: List[str]) -> AnalyzerEngine:
+        """Return the AnalyzerEngine holding the recognizers matching the given language, entities and regions.
+
+        The AnalyzerEngine is created on first request and cached per selection. All AnalyzerEngines share the
+        nlp engine of this instance. Since a cached AnalyzerEngine is never modified, it can be used by several
+        threads at once.
+        """
+        selection_key = (language, frozenset(entities), frozenset(regions))
+        presidio_analyzer = self._presidio_analyzers.get(selection_key)
+        if presidio_analyzer is not None:
+            return presidio_analyzer
+
+        with self._presidio_analyzers_lock:
+            presidio_analyzer = self._presidio_analyzers.get(selection_key)
+            if presidio_analyzer is None:
+                # Select recognizers.
+                recognizers = self._recognizer_manager.select_recognizers(
+                    language=language, entities=entities, regions=regions
+                )
+
+                # Create AnalyzerEngine.
+                registry = RecognizerRegistry(recognizers=recognizers, supported_languages=self._supported_languages)
+                presidio_analyzer = CustomAnalyzerEngine(
+                    registry=registry,
+                    supported_languages=self._supported_languages,
+                    nlp_engine=self._nlp_engine,
+                )
+                # The AnalyzerEngine fills an empty registry with Presidio´s predefined recognizers. Undo this,
+                # since none of the recognizers of this library matches the selection.
+                if not recognizers:
+                    registry.recognizers = []
+
+                self._presidio_analyzers[selection_key] = presidio_analyzer
+                debugging_text = "Created AnalyzerEngine for selection {} with recognizers: {}".format(
+                    selection_key, [recognizer.name for recognizer in recognizers]
+                )
+                debug_logging(logger=LOGGER, log_message=debugging_text)
+
+        return presidio_analyzer
+
+    def _create_result(
+        self,
+        text: str,
+        analyzer_result: List[RecognizerResult],
+        anonymize: bool,
+        anonymize_complete_vin: bool,
+        technique: str,
+        detect: bool,
+    ) -> Dict:
+        """Create the result dictionary of the process method from the analyzer result of a text."""
         # Prepare result dictionary.
         result = {}
 
@@ -295,7 +1050,11 @@ class TextAnonymizer:
         return result
 
     @log_and_reraise_exceptions(LOGGER)
-    def _apply_language_detection(self, text: str, language_detection_probability_distance: float = 0.2) -> str:
+    def _apply_language_detection(
+        self,
+        text: str,
+        language_detection_probability_distance: float = constants.LANGUAGE_DETECTION_PROBABILITY_DISTANCE,
+    ) -> str:
         """
         Detects whether the given text is in a supported language and returns its ISO 639-1 code.
 
@@ -305,10 +1064,9 @@ class TextAnonymizer:
 
         Args:
             text (str): The text for which to detect the language.
-            calculate_confidence_values (bool, optional): If True, calculates and stores the confidence
-                values of detected languages. Default is False.
             language_detection_probability_distance (float, optional): The minimum relative distance
-                for language detection to be considered confident. Default is 0.2.
+                for language detection to be considered confident. Default is
+                constants.LANGUAGE_DETECTION_PROBABILITY_DISTANCE.
 
         Returns:
             str: The ISO 639-1 code of the detected language if it is among the supported languages.
@@ -316,17 +1074,15 @@ class TextAnonymizer:
         Raises:
             LanguageDetectionError: If the language cannot be detected or is not supported.
         """
-        language_detector = (
-            LanguageDetectorBuilder.from_languages(*constants.LINGUA_LANGUAGES_FOR_DETECTION)
-            .with_minimum_relative_distance(language_detection_probability_distance)
-            .build()
-        )
+        language_detector = self._get_language_detector(language_detection_probability_distance)
         detected_language_lingua = language_detector.detect_language_of(text)
 
-        debugging_text = "Confidence levels of language detection: {}".format(
-            self._create_confidence_values_dict(text, language_detector)
-        )
-        debug_logging(logger=LOGGER, log_message=debugging_text)
+        # Computing the confidence values is a second full detection pass, hence only do it for debugging.
+        if is_debug_logging_enabled(logger=LOGGER):
+            debugging_text = "Confidence levels of language detection: {}".format(
+                self._create_confidence_values_dict(text, language_detector)
+            )
+            debug_logging(logger=LOGGER, log_message=debugging_text)
 
         if detected_language_lingua is None:
             raise LanguageDetectionError(
@@ -348,6 +1104,28 @@ class TextAnonymizer:
                 f"supported_languages of TextAnonymizer. Supported languages: {constants.AVAILABLE_LANGUAGES}"
             )
 
+    def _get_language_detector(self, language_detection_probability_distance: float) -> LanguageDetector:
+        """Return the language detector for the given minimum relative distance.
+
+        The language detector is built on first request and cached per minimum relative distance.
+        """
+        language_detector = self._language_detectors.get(language_detection_probability_distance)
+        if language_detector is not None:
+            return language_detector
+
+        with self._language_detectors_lock:
+            language_detector = self._language_detectors.get(language_detection_probability_distance)
+            if language_detector is None:
+                language_detector_builder = LanguageDetectorBuilder.from_languages(
+                    *constants.LINGUA_LANGUAGES_FOR_DETECTION
+                ).with_minimum_relative_distance(language_detection_probability_distance)
+                if self._preload_language_models:
+                    language_detector_builder = language_detector_builder.with_preloaded_language_models()
+                language_detector = language_detector_builder.build()
+                self._language_detectors[language_detection_probability_distance] = language_detector
+
+        return language_detector
+
     @staticmethod
     def _create_confidence_values_dict(text: str, language_detector: LanguageDetector):
         detected_language_confidence_values = language_detector.compute_language_confidence_values(text)
@@ -393,14 +1171,8 @@ class TextAnonymizer:
             language=language, entities=entities, regions=regions, technique=technique
         )
 
-        # Select recognizers.
-        recognizers = self._recognizer_manager.select_recognizers(language=language, entities=entities, regions=regions)
-
-        # Update AnalyzerEngine.
-        self._presidio_analyzer.registry.recognizers = recognizers
-
         # Analyze text.
-        analyzer_result = self._presidio_analyzer.analyze(text=text, language=language, entities=entities)
+        analyzer_result = self._analyze(text=text, language=language, entities=entities, regions=regions)
 
         # Set anonymization technique.
         anonymizer_operators = constants.PRESIDIO_ANONYMIZER_OPERATORS[technique]
@@ -0,0 +1,116 @@
+import bisect
+import contextlib
+import contextvars
+import functools
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+import regex as re
+
+from text_anonymizer import triggerwords
+
+# All trigger words of the lists in module triggerwords. They are indexed in one pass per text, which is shared by all
+# recognizers using these lists.
+ALL_TRIGGER_WORDS = tuple(
+    sorted({word for name, words in vars(triggerwords).items() if name.startswith("TRIGGERWORDS_") for word in words})
+)
+
+# The indexes built in the current trigger_word_index_scope per tuple of indexed trigger words, together with the text
+# they were built for. Recognizers are called one after another with the same text object, hence the index is built
+# once per analysis. Outside of a scope, the variable is None and no index is kept.
+_scope_indexes: contextvars.ContextVar[Optional[Dict[Tuple[str, ...], Tuple[str, "TriggerWordIndex"]]]] = (
+    contextvars.ContextVar("trigger_word_indexes", default=None)
+)
+
+
+class TriggerWordIndex:
+    """Positions of the trigger words in a text.
+
+    A trigger word occurs at a position, if it matches the regex '\\b<trigger word>\\b' there. All trigger words are
+    searched with one combined regex in one pass over the text. Afterwards, checking whether a trigger word occurs in a
+    window of the text is a binary search.
+    """
+
+    def __init__(self, text: str, trigger_words: Tuple[str, ...]):
+        """Construct the index of the given trigger words in the given text.
+
+        Args:
+            text (str): The text to index.
+            trigger_words (Tuple[str, ...]): The trigger words to index.
+        """
+        combined_regex, prefix_words, word_regexes = _compile_trigger_words(trigger_words)
+
+        occurrences: List[Tuple[int, int, str]] = []
+        # Overlapping occurrences are found, since the search continues after the start of each match.
+        for match in combined_regex.finditer(text, overlapped=True):
+            start, end = match.span()
+            word = match.group()
+            occurrences.append((start, end, word))
+            # The combined regex only returns the longest trigger word starting at a position. Shorter trigger words
+            # starting at the same position are prefixes of it.
+            for prefix_word in prefix_words.get(word, ()):
+                prefix_match = word_regexes[prefix_word].match(text, start)
+                if prefix_match:
+                    occurrences.append((start, prefix_match.end(), prefix_word))
+
+        self._occurrences = occurrences
+        self._starts = [start for start, _, _ in occurrences]
+
+    def get_spans(self, trigger_words: FrozenSet[str]) -> List[Tuple[int, int]]:
+        """Returns the start and end positions of all occurrences of the given trigger words, ordered by start."""
+        return [(start, end) for start, end, word in self._occurrences if word in trigger_words]
+
+    def find(self, trigger_words: FrozenSet[str], start: int, end: int) -> Optional[str]:
+        """Returns one of the given trigger words that occurs completely inside text[start:end] or None, if there is
+        none."""
+        i = bisect.bisect_left(self._starts, start)
+        while i < len(self._occurrences) and self._occurrences[i][0] < end:
+            _, occurrence_end, word = self._occurrences[i]
+            if occurrence_end <= end and word in trigger_words:
+                return word
+            i += 1
+        return None
+
+
+@contextlib.contextmanager
+def trigger_word_index_scope() -> Iterator[None]:
+    """Shares the trigger word indexes built by get_trigger_word_index inside the with-block, e.g. between all
+    recognizers analyzing a text. The indexes and the references to the analyzed text are dropped on exit, so no
+    un-anonymized text is kept after the analysis. Nested scopes share the indexes of the outermost scope."""
+    if _scope_indexes.get() is not None:
+        yield
+        return
+    token = _scope_indexes.set({})
+    try:
+        yield
+    finally:
+        _scope_indexes.reset(token)
+
+
+def get_trigger_word_index(text: str, trigger_words: Tuple[str, ...]) -> TriggerWordIndex:
+    """Returns the index of the given trigger words in the given text. Inside of a trigger_word_index_scope, the index
+    is reused for further calls with the same text object."""
+    indexes = _scope_indexes.get()
+    if indexes is None:
+        return TriggerWordIndex(text, trigger_words)
+    indexed_text, index = indexes.get(trigger_words, (None, None))
+    if indexed_text is not text or index is None:
+        index = TriggerWordIndex(text, trigger_words)
+        indexes[trigger_words] = (text, index)
+    return index
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_trigger_words(
+    trigger_words: Tuple[str, ...]
+) -> Tuple[re.Pattern, Dict[str, List[str]], Dict[str, re.Pattern]]:
+    """Returns the combined regex of the given trigger words, the trigger words that are prefixes of each trigger word
+    and the regex of each trigger word."""
+    # Longer trigger words are tried first, so the combined regex returns the longest trigger word at a position.
+    ordered_words = sorted(set(trigger_words), key=lambda word: (-len(word), word))
+    combined_regex = re.compile(r"\b(?:" + "|".join(re.escape(word) for word in ordered_words) + r")\b")
+    prefix_words = {
+        word: [other_word for other_word in ordered_words if other_word != word and word.startswith(other_word)]
+        for word in ordered_words
+    }
+    word_regexes = {word: re.compile(r"\b" + re.escape(word) + r"\b") for word in ordered_words}
+    return combined_regex, prefix_words, word_regexes
@@ -1,17 +1,32 @@
 import functools
+import importlib.metadata
+import itertools
+import logging
 import os
 import warnings
 from importlib import import_module
 from os.path import join
 from pkgutil import walk_packages
 from types import ModuleType
-from typing import Callable, List, Optional, Type
-
-from phonenumbers import PhoneNumberMatch
-from presidio_analyzer import RecognizerResult
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+)
+
+import regex
 
 from text_anonymizer import constants
-from text_anonymizer.logging_config import SPECIFIC_RECOGNIZERS
+from text_anonymizer.logging_config import get_specific_recognizers
+
+if TYPE_CHECKING:
+    from phonenumbers import PhoneNumberMatch
+    from presidio_analyzer import RecognizerResult
 
 
 def text_anonymizer_info():
@@ -70,6 +85,111 @@ def process_key_arguments(
     return languages, entities, regions
 
 
+def chunk_iterable(iterable: Iterable, chunk_size: int) -> Iterator[List]:
+    """Split an iterable into consecutive lists of at most chunk_size elements.
+
+    Args:
+        iterable (Iterable): The iterable to split. It is consumed lazily.
+        chunk_size (int): The maximum number of elements per chunk. Must be greater than zero.
+
+    Returns:
+        Iterator[List]: The chunks in the order of the elements of the iterable.
+    """
+    if chunk_size < 1:
+        raise ValueError("Argument chunk_size must be greater than zero. Given: {}.".format(chunk_size))
+
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_chunk_arguments(chunk_size: int, chunk_overlap: int) -> None:
+    """Raises a ValueError, if chunk_size is not greater than zero or chunk_overlap is not between zero and
+    chunk_size - 1."""
+    if chunk_size < 1:
+        raise ValueError("Argument chunk_size must be greater than zero. Given: {}.".format(chunk_size))
+    if not 0 <= chunk_overlap < chunk_size:
+        raise ValueError(
+            "Argument chunk_overlap must be between zero and chunk_size - 1. Given: {}.".format(chunk_overlap)
+        )
+
+
+def split_text_into_chunks(text: str, chunk_size: int, chunk_overlap: int = 0) -> List[Tuple[int, str]]:
+    """Split a text into chunks of at most chunk_size characters. Consecutive chunks overlap by up to chunk_overlap
+    characters, so entities cut at the end of a chunk are fully contained in the next one, if they fit into the
+    overlap.
+
+    Chunks end preferably at line boundaries, then at sentence boundaries and then at whitespace. Chunks start after
+    the first separator inside the overlap zone, so words are not cut at the start of a chunk. If there is no such
+    boundary, the text is cut after exactly chunk_size characters.
+
+    Args:
+        text (str): The text to split.
+        chunk_size (int): The maximum number of characters per chunk. Must be greater than zero.
+        chunk_overlap (int, optional): The maximum number of characters consecutive chunks share. Must be smaller than
+            chunk_size. Defaults to 0.
+
+    Returns:
+        List[Tuple[int, str]]: Tuples of the start position of a chunk in the text and the chunk itself.
+    """
+    validate_chunk_arguments(chunk_size, chunk_overlap)
+
+    chunks = []
+    start = 0
+    while len(text) - start > chunk_size:
+        # Let the chunk end at the last boundary behind the overlap zone to guarantee progress.
+        end = _find_last_chunk_boundary(text, start + chunk_overlap + 1, start + chunk_size)
+        chunks.append((start, text[start:end]))
+
+        start = _find_first_chunk_boundary(text, end - chunk_overlap, end) if chunk_overlap else end
+
+    chunks.append((start, text[start:]))
+    return chunks
+
+
+def _find_last_chunk_boundary(text: str, lowest: int, highest: int) -> int:
+    """Returns the position after the last separator within text[lowest:highest] or highest, if there is none.
+    Groups of separators are tried in the order of constants.CHUNK_SEPARATORS."""
+    for separators in constants.CHUNK_SEPARATORS:
+        boundary = max([text.rfind(separator, lowest, highest) + len(separator) for separator in separators])
+        if boundary > lowest:
+            return boundary
+    return highest
+
+
+def _find_first_chunk_boundary(text: str, lowest: int, highest: int) -> int:
+    """Returns the position after the first separator within text[lowest:highest] or lowest, if there is none."""
+    boundaries = [
+        text.find(separator, lowest, highest) + len(separator)
+        for separators in constants.CHUNK_SEPARATORS
+        for separator in separators
+        if text.find(separator, lowest, highest) != -1
+    ]
+    return min(boundaries, default=lowest)
+
+
+def get_library_version() -> str:
+    """Returns the installed version of this library or 'unknown', if it is not installed, e.g. when run from source."""
+    try:
+        return importlib.metadata.version(constants.DISTRIBUTION_NAME)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+@functools.lru_cache(maxsize=None)
+def compile_regex(pattern: str, flags: int = 0) -> regex.Pattern:
+    """Returns the given pattern compiled with the regex module.
+
+    Compiled patterns are cached per pattern and flags without a size limit, since the patterns of the recognizers are
+    constants. Unlike the bounded internal cache of the regex module, this cache never evicts the large address and
+    person patterns, so they are parsed once per process.
+    """
+    return regex.compile(pattern, flags=flags)
+
+
 def get_all_subclasses(a_class: Type) -> List:
     all_sub_classes = set(a_class.__subclasses__()).union(
         [subsub for sub in a_class.__subclasses__() for subsub in get_all_subclasses(sub)]
@@ -130,11 +250,27 @@ def log_and_reraise_exceptions(logger, exception_type=Exception):
     return decorator
 
 
+def is_debug_logging_enabled(logger, calling_recognizer: str | None = None) -> bool:
+    """
+    Returns True, when debug_logging would log a message of the given calling_recognizer with the given logger.
+    Use it to skip the creation of debugging texts that are expensive to compute.
+
+    Args:
+        logger: The logger instance used for logging messages.
+        calling_recognizer (str | None): The name of the recognizer being called if log
+            is written within a recognizer class. Defaults to None.
+    """
+    specific_recognizers = get_specific_recognizers()
+    if specific_recognizers and (calling_recognizer not in specific_recognizers):
+        return False
+    return logger.isEnabledFor(logging.DEBUG)
+
+
 def debug_logging(
     logger,
     log_message: str | None = None,
     calling_recognizer: str | None = None,
-    matches: list[RecognizerResult] | list[PhoneNumberMatch] | None = None,
+    matches: "list[RecognizerResult] | list[PhoneNumberMatch] | None" = None,
     text: str | None = None,
 ) -> None:
     """
@@ -158,7 +294,8 @@ def debug_logging(
         text (str | None): The text being processed which may contain matched entities.
             Defaults to None.
     """
-    if SPECIFIC_RECOGNIZERS and (calling_recognizer not in SPECIFIC_RECOGNIZERS):
+    specific_recognizers = get_specific_recognizers()
+    if specific_recognizers and (calling_recognizer not in specific_recognizers):
         return None
 
     if matches:
@@ -0,0 +1,77 @@
+import asyncio
+
+import pytest
+
+from tests.resources.fake_piis import fake_vin
+from text_anonymizer import TextAnonymizer, constants
+from text_anonymizer.asynchronous import AsyncTextAnonymizer
+from text_anonymizer.exceptions import LanguageDetectionError
+
+
+@pytest.fixture(scope="module")
+def text_anonymizer_vin():
+    return TextAnonymizer(
+        supported_languages=[constants.LANGUAGE_CODE_DE, constants.LANGUAGE_CODE_EN],
+        supported_entities=[constants.ENTITY_VIN],
+        lazy_load_models=True,
+    )
+
+
+TEXTS = ["Text {} contains the VIN {}.".format(i, fake_vin) if i % 3 else "Text {}.".format(i) for i in range(10)]
+
+
+class TestAsynchronous:
+    """Tests for the asynchronous module."""
+
+    def test_aprocess(self, mocker, text_anonymizer_vin):
+        expected_results = [text_anonymizer_vin.process(text=text, language="en", detect=True) for text in TEXTS]
+        async_text_anonymizer = AsyncTextAnonymizer(text_anonymizer_vin, max_batch_size=4)
+        spy_process_batch = mocker.spy(text_anonymizer_vin, "process_batch")
+
+        async def process_concurrently():
+            return await asyncio.gather(
+                *[async_text_anonymizer.process(text=text, language="en", detect=True) for text in TEXTS]
+            )
+
+        # Test that concurrent requests are collected into batches of at most max_batch_size texts.
+        assert asyncio.run(process_concurrently()) == expected_results
+        assert [len(call.kwargs["texts"]) for call in spy_process_batch.call_args_list] == [4, 4, 2]
+
+        # Test the coroutines of TextAnonymizer.
+        assert asyncio.run(text_anonymizer_vin.aprocess(text=TEXTS[1], language="en", detect=True)) == (
+            expected_results[1]
+        )
+        assert asyncio.run(text_anonymizer_vin.aprocess_batch(texts=TEXTS, language="en", detect=True)) == (
+            expected_results
+        )
+
+    def test_aprocess_errors_and_cancellation(self, text_anonymizer_vin):
+        async_text_anonymizer = AsyncTextAnonymizer(text_anonymizer_vin, max_batch_delay=0.1)
+
+        async def process_with_error():
+            return await asyncio.gather(
+                async_text_anonymizer.process(
+                    text="The customer asked for the car with the VIN {}.".format(fake_vin), detect_language=True
+                ),
+                async_text_anonymizer.process(text="1234", detect_language=True),
+                return_exceptions=True,
+            )
+
+        # Test that an error only affects the request causing it.
+        result, error = asyncio.run(process_with_error())
+        assert fake_vin not in result["text"]
+        assert isinstance(error, LanguageDetectionError)
+
+        async def process_with_cancellation():
+            cancelled_task = asyncio.ensure_future(async_text_anonymizer.process(text=TEXTS[1], language="en"))
+            task = asyncio.ensure_future(async_text_anonymizer.process(text=TEXTS[2], language="en"))
+            await asyncio.sleep(0)
+            cancelled_task.cancel()
+            return await task, cancelled_task
+
+        result, cancelled_task = asyncio.run(process_with_cancellation())
+        assert fake_vin not in result["text"]
+        assert cancelled_task.cancelled()
+
+        with pytest.raises(ValueError):
+            AsyncTextAnonymizer(text_anonymizer_vin, max_concurrency=0)
@@ -0,0 +1,98 @@
+import pytest
+
+from text_anonymizer.cache import PersistentResultCache, ResultCache
+
+
+class TestCache:
+    """Tests for the cache module."""
+
+    def test_ResultCache(self):
+        cache = ResultCache(max_entries=2)
+        configuration = ("en", False)
+        key_1 = cache.create_key("Text 1", configuration)
+        key_2 = cache.create_key("Text 2", configuration)
+        key_3 = cache.create_key("Text 3", configuration)
+        result = {"entities": [{"start": 0, "end": 4, "type": "PERSON"}], "text": "<PERSON> 1"}
+
+        # Test that keys depend on the text and the configuration and do not contain the text.
+        assert key_1 == cache.create_key("Text 1", configuration)
+        assert key_1 != cache.create_key("Text 1", ("de", False))
+        assert "Text 1" not in key_1
+
+        assert cache.get(key_1) is None
+        cache.put(key_1, result)
+        cached_result = cache.get(key_1)
+        assert cached_result == result
+
+        # Test that modifying returned results does not modify the cached result.
+        cached_result["entities"][0]["type"] = "LOCATION"
+        assert cache.get(key_1) == result
+
+        # Test that the least recently used result is removed.
+        cache.put(key_2, result)
+        assert cache.get(key_1) is not None
+        cache.put(key_3, result)
+        assert cache.get(key_2) is None
+        assert cache.get(key_1) is not None and cache.get(key_3) is not None
+
+        statistics = cache.get_statistics()
+        assert statistics["hits"] == 5
+        assert statistics["misses"] == 2
+        assert statistics["entries"] == 2
+        assert statistics["memory"] > 0
+
+        cache.clear()
+        assert cache.get_statistics() == {"hits": 0, "misses": 0, "entries": 0, "memory": 0}
+
+    def test_ResultCache_max_memory(self):
+        result = {"entities": [], "text": "text"}
+        max_memory = 2 * ResultCache._estimate_size(result)
+        cache = ResultCache(max_entries=10, max_memory=max_memory)
+        for i in range(5):
+            cache.put(cache.create_key(str(i), ()), result)
+
+        assert cache.get_statistics()["entries"] == 2
+        assert cache.get_statistics()["memory"] <= max_memory
+
+        # Test that results larger than the maximum memory are not cached.
+        cache.put(cache.create_key("large", ()), {"entities": [], "text": "x" * max_memory})
+        assert cache.get(cache.create_key("large", ())) is None
+
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=0)
+        with pytest.raises(ValueError):
+            ResultCache(max_entries=1, max_memory=0)
+
+    def test_PersistentResultCache(self, tmp_path):
+        path = str(tmp_path / "cache.sqlite")
+        result = {"entities": [{"start": 0, "end": 4, "type": "PERSON"}], "text": "<PERSON> 1"}
+        cache = PersistentResultCache(path, fingerprint="fingerprint", version="1.0.0")
+        key = cache.create_key("Text 1", ("en", False))
+
+        assert cache.get(key) is None
+        cache.put(key, result)
+        assert cache.get(key) == result
+        cache.close()
+
+        # Test that results are kept across instances with the same fingerprint and version only.
+        assert PersistentResultCache(path, fingerprint="fingerprint", version="1.0.0").get(key) == result
+        assert PersistentResultCache(path, fingerprint="other fingerprint", version="1.0.0").get(key) is None
+        # Like the fingerprints of text anonymizers, the fingerprint differs for other versions.
+        other_version_cache = PersistentResultCache(path, fingerprint="fingerprint 1.1.0", version="1.1.0")
+        assert other_version_cache.get(key) is None
+
+        # Test that results of other versions are only removed when the cache is pruned.
+        assert PersistentResultCache(path, fingerprint="fingerprint", version="1.0.0").get(key) == result
+        assert other_version_cache.prune() == 1
+        assert PersistentResultCache(path, fingerprint="fingerprint", version="1.0.0").get(key) is None
+
+        # Test that results missing in memory are looked up in the persistent cache.
+        cache = ResultCache(max_entries=1, persistent_cache=PersistentResultCache(path, "fingerprint", "1.0.0"))
+        cache.put(key, result)
+        cache.put(cache.create_key("Text 2", ("en", False)), result)
+        assert cache.get(key) == result
+        assert cache.get_statistics()["hits"] == 1
+        assert cache.persistent_cache.get_statistics() == {"hits": 1, "misses": 0, "entries": 2}
+
+        cache.clear()
+        assert cache.persistent_cache.get_statistics()["entries"] == 0
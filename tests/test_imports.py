@@ -0,0 +1,26 @@
+import subprocess
+import sys
+
+# Modules that take long to import. Importing text_anonymizer must not import them, they are imported on first use.
+SLOW_MODULES = ["spacy", "presidio_analyzer", "presidio_anonymizer", "phonenumbers", "yaml"]
+
+
+class TestImports:
+    """Tests for the lazy imports of the text_anonymizer package."""
+
+    def _get_imported_modules(self, code: str):
+        """Runs the given code in a new interpreter and returns the slow modules it imported."""
+        code += "\nimport sys\nprint(' '.join(module for module in {} if module in sys.modules))".format(SLOW_MODULES)
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+        return output.splitlines()[-1].split()
+
+    def test_import_text_anonymizer(self):
+        code = "import text_anonymizer\nfrom text_anonymizer import constants\ntext_anonymizer.text_anonymizer_info()"
+
+        assert self._get_imported_modules(code) == []
+
+    def test_lazy_attributes(self):
+        code = "from text_anonymizer import TextAnonymizer, constants\nconstants.PRESIDIO_ANONYMIZER_OPERATORS"
+
+        # Test that the lazily imported attributes are available.
+        assert set(self._get_imported_modules(code)) >= {"spacy", "presidio_analyzer", "presidio_anonymizer"}
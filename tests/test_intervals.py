@@ -0,0 +1,82 @@
+import copy
+import random
+
+import pytest
+from presidio_analyzer import EntityRecognizer, RecognizerResult
+from presidio_anonymizer import AnonymizerEngine, ConflictResolutionStrategy
+
+from text_anonymizer.anonymizer_engine import CustomAnonymizerEngine
+from text_anonymizer.intervals import (
+    IntervalIndex,
+    group_intersecting,
+    remove_duplicates,
+)
+
+
+def _get_random_results(seed: int, count: int = 300):
+    rng = random.Random(seed)
+    results = []
+    for _ in range(count):
+        start = rng.randrange(0, 1000)
+        results.append(
+            RecognizerResult(
+                entity_type=rng.choice(["PERSON", "PHONE_NUMBER", "ADDRESS"]),
+                start=start,
+                end=start + rng.randrange(0, 30),
+                score=rng.choice([0.0, 0.5, 0.85, 1.0]),
+            )
+        )
+    return results
+
+
+def _to_tuples(results):
+    return [(result.entity_type, result.start, result.end, result.score) for result in results]
+
+
+class TestIntervals:
+    """Tests for the intervals module."""
+
+    def test_IntervalIndex(self):
+        index = IntervalIndex([(30, 40), (10, 20)])
+
+        assert len(index) == 2
+        assert index.has_boundary_inside(0, 10)
+        assert index.has_boundary_inside(15, 25)
+        assert index.has_boundary_inside(40, 50)
+        assert not index.has_boundary_inside(21, 29)
+        # Spans inside an interval contain none of its boundaries.
+        assert not index.has_boundary_inside(32, 38)
+        assert not IntervalIndex([]).has_boundary_inside(0, 100)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_remove_duplicates(self, seed):
+        results = _get_random_results(seed)
+
+        # Test that the results are the same as the ones of presidio, including their order.
+        assert _to_tuples(remove_duplicates(results)) == _to_tuples(EntityRecognizer.remove_duplicates(results))
+
+    def test_group_intersecting(self):
+        results = [
+            RecognizerResult("PERSON", 20, 30, 0.5),
+            RecognizerResult("PERSON", 0, 10, 0.5),
+            RecognizerResult("ADDRESS", 25, 40, 0.5),
+            RecognizerResult("PERSON", 10, 12, 0.5),
+            RecognizerResult("PERSON", 50, 60, 0.5),
+        ]
+
+        assert group_intersecting(results) == [[1, 3], [0, 2], [4]]
+        assert group_intersecting([]) == []
+
+    @pytest.mark.parametrize("conflict_resolution", list(ConflictResolutionStrategy))
+    @pytest.mark.parametrize("seed", range(5))
+    def test_CustomAnonymizerEngine(self, seed, conflict_resolution):
+        results = [result for result in _get_random_results(seed) if result.score > 0]
+        expected_results = AnonymizerEngine()._remove_conflicts_and_get_text_manipulation_data(
+            copy.deepcopy(results), conflict_resolution
+        )
+
+        # Test that the conflicts are resolved like presidio does, including the order of the results.
+        unique_results = CustomAnonymizerEngine()._remove_conflicts_and_get_text_manipulation_data(
+            copy.deepcopy(results), conflict_resolution
+        )
+        assert _to_tuples(unique_results) == _to_tuples(expected_results)
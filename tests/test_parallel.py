@@ -0,0 +1,72 @@
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from tests.resources.fake_piis import fake_vin
+from text_anonymizer import TextAnonymizer, constants
+from text_anonymizer.parallel import ParallelTextAnonymizer
+
+
+@pytest.fixture(scope="module")
+def text_anonymizer_vin():
+    return TextAnonymizer(
+        supported_languages=[constants.LANGUAGE_CODE_EN],
+        supported_entities=[constants.ENTITY_VIN],
+        lazy_load_models=True,
+    )
+
+
+TEXTS = ["Text {} contains the VIN {}.".format(i, fake_vin) if i % 3 else "Text {}.".format(i) for i in range(20)]
+
+
+class TestParallel:
+    """Tests for the parallel module."""
+
+    def test_ParallelTextAnonymizer_process_batch(self, text_anonymizer_vin):
+        expected_results = text_anonymizer_vin.process_batch(texts=TEXTS, detect=True)
+
+        with text_anonymizer_vin.pool(n_workers=2, preload_models=False) as parallel_text_anonymizer:
+            # Test that results keep the order of the texts.
+            assert parallel_text_anonymizer.process_batch(texts=TEXTS, detect=True, batch_size=3) == expected_results
+            assert list(parallel_text_anonymizer.process_iterator(texts=iter(TEXTS), detect=True, batch_size=1)) == (
+                expected_results
+            )
+
+            # Test that errors of the workers are raised.
+            with pytest.raises(ValueError):
+                parallel_text_anonymizer.process_batch(texts=TEXTS, technique="invalid")
+
+        with pytest.raises(ValueError):
+            ParallelTextAnonymizer(text_anonymizer_vin, n_workers=0)
+
+        # Test that the restart policy is passed on.
+        with text_anonymizer_vin.pool(n_workers=1, preload_models=False, max_restarts=0) as parallel_text_anonymizer:
+            assert parallel_text_anonymizer.max_restarts == 0
+
+    def test_ParallelTextAnonymizer_worker_restart(self, mocker, tmp_path, text_anonymizer_vin):
+        marker_path = tmp_path / "crashed"
+        process_batch = text_anonymizer_vin.process_batch
+
+        def process_batch_crashing_once(texts, **kwargs):
+            # Kill the worker process the first time the last text is processed.
+            if TEXTS[-1] in texts and not marker_path.exists():
+                marker_path.touch()
+                os._exit(1)
+            return process_batch(texts=texts, **kwargs)
+
+        # The workers are forked after patching, hence they inherit the patched method.
+        mocker.patch.object(text_anonymizer_vin, "process_batch", side_effect=process_batch_crashing_once)
+        expected_results = process_batch(texts=TEXTS, detect=True)
+
+        with ParallelTextAnonymizer(text_anonymizer_vin, n_workers=2, preload_models=False) as parallel_anonymizer:
+            assert parallel_anonymizer.process_batch(texts=TEXTS, detect=True, batch_size=4) == expected_results
+            assert marker_path.exists()
+
+        # Test that the error is raised, if the maximum number of restarts is reached.
+        marker_path.unlink()
+        with ParallelTextAnonymizer(
+            text_anonymizer_vin, n_workers=2, preload_models=False, max_restarts=0
+        ) as parallel_anonymizer:
+            with pytest.raises(BrokenProcessPool):
+                parallel_anonymizer.process_batch(texts=TEXTS, detect=True, batch_size=4)
@@ -1,7 +1,11 @@
 import pytest
 from tests.resources import recognizer_manager as recognizer_manager_resources
 from text_anonymizer import constants
-from text_anonymizer.recognizer_manager import RecognizerManager
+from text_anonymizer.recognizer_manager import (
+    RecognizerManager,
+    get_recognizer_registry_entries,
+)
+from text_anonymizer.recognizer_registry import RECOGNIZER_REGISTRY
 import os
 
 
@@ -70,3 +74,50 @@ class TestRecognizerManager:
         )
         assert len(selected_recognizers_2) == 2
         assert len(selected_recognizers_2) < len(manager.recognizers)
+
+    def test_RecognizerManager_select_recognizers_index(self):
+        manager = RecognizerManager(languages=self.LANGUAGES)
+
+        for language in self.LANGUAGES:
+            for entities in [self.ENTITIES, constants.AVAILABLE_ENTITIES, [constants.ENTITY_PHONE_NUMBER]]:
+                for regions in [self.REGIONS, constants.AVAILABLE_REGIONS, [constants.COUNTRY_CODE_SPAIN]]:
+                    selected_recognizers = manager.select_recognizers(
+                        language=language, entities=entities, regions=regions
+                    )
+
+                    # Test that the index selects the same recognizers in the same order as scanning all recognizers.
+                    expected_recognizers = [
+                        recognizer
+                        for recognizer in manager.recognizers
+                        if recognizer.get_supported_language() == language
+                        and any(entity in entities for entity in recognizer.get_supported_entities())
+                        and any(
+                            region in regions or region == constants.VALID_GLOBALLY
+                            for region in recognizer.get_supported_regions()
+                        )
+                    ]
+                    assert selected_recognizers == expected_recognizers
+
+                    # Test that the memoized selection is returned as a new list.
+                    reselected_recognizers = manager.select_recognizers(
+                        language=language, entities=list(reversed(entities)), regions=regions
+                    )
+                    assert reselected_recognizers == selected_recognizers
+                    assert reselected_recognizers is not selected_recognizers
+
+    def test_recognizer_registry_is_up_to_date(self):
+        # If this test fails, run 'python scripts/generate_recognizer_registry.py'.
+        assert RECOGNIZER_REGISTRY == get_recognizer_registry_entries()
+
+    def test_RecognizerManager_uses_recognizer_registry(self):
+        manager = RecognizerManager(
+            languages=[constants.LANGUAGE_CODE_EN],
+            entities=[constants.ENTITY_VIN, constants.ENTITY_PASSPORT],
+            regions=[constants.COUNTRY_CODE_GERMANY],
+        )
+
+        # Test that only the registered recognizer classes matching the arguments are instantiated.
+        assert sorted(type(recognizer).__name__ for recognizer in manager.recognizers) == [
+            "CustomPassportRecognizer_DE",
+            "CustomVinRecognizer",
+        ]
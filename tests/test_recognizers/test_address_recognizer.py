@@ -1,6 +1,9 @@
 import pytest
 
-from tests.utils import assert_recognizer_result
+from tests.utils import (
+    assert_recognizer_result,
+    assert_restricted_search_finds_all_matches,
+)
 from tests.entity_test_values import (
     address_at_test_cases,
     address_at_test_case_ids,
@@ -103,3 +106,26 @@ class TestAddressRecognizer:
         expected_end = self.expected_start + len(address_us)
         assert_recognizer_result(results[0], self.entity, self.expected_start, expected_end, self.expected_score)
 
+    @pytest.mark.parametrize(
+        "recognizer_class, addresses",
+        [
+            (CustomAddressRecognizer_AT, address_at_test_cases),
+            (CustomAddressRecognizer_CH, address_ch_test_cases),
+            (CustomAddressRecognizer_DE, address_de_test_cases),
+            (CustomAddressRecognizer_ES, address_es_test_cases),
+            (CustomAddressRecognizer_GB, address_uk_test_cases),
+            (CustomAddressRecognizer_US, address_us_test_cases),
+        ],
+    )
+    def test_address_anchor_first_matching(self, recognizer_class, addresses, mocker):
+        recognizer = recognizer_class(
+            supported_language=constants.LANGUAGE_CODE_EN,
+            supported_entities=[self.entity],
+            supported_regions=recognizer_class.POSSIBLE_REGIONS,
+        )
+        prose = "Der Kunde meldete 3 Schäden am Fahrzeug. The customer asked for a callback about 2 invoices. " * 5
+        text = prose + prose.join(addresses) + prose
+
+        # Test that the patterns are not evaluated in texts without anchors.
+        scan_regions = assert_restricted_search_finds_all_matches(mocker, recognizer, text, prose)
+        assert all(regions == [] for regions in scan_regions)
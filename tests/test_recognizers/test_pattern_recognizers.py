@@ -1,5 +1,9 @@
 import pytest
-from tests.utils import assert_recognizer_result
+from presidio_analyzer import RecognizerResult
+from tests.utils import (
+    assert_recognizer_result,
+    assert_restricted_search_finds_all_matches,
+)
 from tests.entity_test_values import (
     credit_card_test_case_ids,
     credit_card_test_cases,
@@ -470,15 +474,18 @@ class TestImeiRecognizer:
         assert_recognizer_result(results[0], self.entity, self.expected_start, expected_end, self.expected_score)
 
     @pytest.mark.parametrize("imei_invalid", invalid_imei_test_cases, ids=invalid_imei_test_cases_ids)
-    def test_imei_analyze_invalid(self, imei_invalid):
+    def test_imei_analyze_invalid(self, imei_invalid, mocker):
         imei_recognizer = CustomImeiRecognizer(
             supported_language=constants.LANGUAGE_CODE_EN,
             supported_entities=[self.entity],
             supported_regions=[constants.VALID_GLOBALLY],
         )
+        spy_post_process_match = mocker.spy(imei_recognizer, "post_process_match")
         results = imei_recognizer.analyze(imei_invalid, [self.entity])
 
         assert len(results) == 0, "Expecting no results for invalid imei numbers"
+        # Invalid matches are discarded before they are post-processed.
+        assert spy_post_process_match.call_count == 0
 
 class TestPhoneNumberRecognizer:
     entity = constants.ENTITY_PHONE_NUMBER
@@ -561,3 +568,70 @@ class TestPhoneNumberRecognizer:
         expected_end = self.expected_start + len(phonenumber)
         assert_recognizer_result(results[0], self.entity, self.expected_start, expected_end, self.expected_score)
 
+    def test_phone_all_regions(self):
+        phonenumber_recognizer = CustomPhoneNumberRecognizer(
+            supported_language=constants.LANGUAGE_CODE_EN,
+            supported_entities=[self.entity],
+            supported_regions=CustomPhoneNumberRecognizer.POSSIBLE_REGIONS,
+        )
+        phonenumbers = ["+49 170 1234567", "(212) 555-0147", "+44 20 7946 0958", "089 1234567"]
+        text = "Please call {} or {}, mobile {}. Tel. {} ".format(*phonenumbers) * 2
+        results = phonenumber_recognizer.analyze(text, [self.entity])
+
+        # Every phone number is found once, although the matchers of several regions find it.
+        assert len(results) == len(set(results))
+        assert sorted(text[result.start : result.end] for result in results) == sorted(phonenumbers * 2)
+
+    def test_filter_out_li_numbers(self):
+        text = "LI54.10-P-069698 LI54.10-P-069699 LI54.10-P-069700"
+        results = [
+            RecognizerResult(self.entity, text.index(number), text.index(number) + len(number), self.expected_score)
+            for number in ["069698", "069699", "069700"]
+        ]
+
+        # Test that all results are removed, including consecutive ones.
+        assert CustomPhoneNumberRecognizer._filter_out_li_numbers(results, text) == []
+
+
+class TestTriggerFirstMatching:
+    @pytest.mark.parametrize(
+        "recognizer_class",
+        [
+            CustomIdentityCardRecognizer_CH,
+            CustomIdentityCardRecognizer_DE,
+            CustomIdentityCardRecognizer_US,
+            CustomPassportRecognizer_AT,
+            CustomPassportRecognizer_CH,
+            CustomPassportRecognizer_DE,
+            CustomPassportRecognizer_ES,
+            CustomPassportRecognizer_GB,
+            CustomPassportRecognizer_US,
+            CustomDriverLicenseRecognizer_AT,
+            CustomDriverLicenseRecognizer_CH,
+            CustomDriverLicenseRecognizer_US,
+        ],
+    )
+    def test_trigger_first_matching(self, recognizer_class, mocker):
+        recognizer = recognizer_class(
+            supported_language=constants.LANGUAGE_CODE_DE,
+            supported_entities=recognizer_class.POSSIBLE_ENTITIES,
+            supported_regions=recognizer_class.POSSIBLE_REGIONS,
+        )
+        candidates = [
+            "12345678",
+            "123456789",
+            "123456789012",
+            "123-45-6789",
+            "ABC123456",
+            "C01X00T47",
+            "L01X00T47",
+            "P1234567",
+        ]
+        words = [candidate if i % 5 else "Nummer" for i, candidate in enumerate(candidates * 20)]
+        for i, trigger_word in enumerate(recognizer_class.TRIGGER_WORDS):
+            words.insert(i * 37 % len(words), trigger_word)
+        text = " ".join(words)
+
+        # Test that the patterns are not evaluated in texts without trigger words.
+        scan_regions = assert_restricted_search_finds_all_matches(mocker, recognizer, text, " ".join(candidates))
+        assert all(regions == [] for regions in scan_regions)
@@ -1,4 +1,5 @@
 import pytest
+import spacy
 from presidio_analyzer.recognizer_result import RecognizerResult
 
 from tests.conftest import (
@@ -8,8 +9,14 @@ from tests.conftest import (
     create_mock_span,
     create_mock_token,
 )
-from tests.utils import assert_recognizer_result
+from tests.utils import (
+    assert_recognizer_result,
+    assert_restricted_search_finds_all_matches,
+)
 from text_anonymizer import constants
+from text_anonymizer.recognizers.person.person_recognizer import (
+    CustomPersonRecognizer_PatternBased,
+)
 
 
 @pytest.fixture
@@ -181,3 +188,48 @@ class TestCustomPersonRecognizer_RuleEnhancedNER:
         results = initilized_person_recognizer._create_results_from_entity_span(constants.ENTITY_PERSON, span, doc)
         assert len(results) > 0
         assert isinstance(results[0], RecognizerResult)
+
+    def test_clean_person_span_with_doc_array(self, initilized_person_recognizer):
+        nlp = spacy.blank(constants.LANGUAGE_CODE_EN)
+        doc = nlp("Kind regards  John Smith and Mary O'Brien, Bob J0nes. Ms. Anna-Lena Doe\nWalker walking")
+        pos_tags = ["PROPN", "PROPN", "NOUN", "VERB"]
+        for i, token in enumerate(doc):
+            token.pos_ = "SPACE" if token.is_space else pos_tags[i % len(pos_tags)]
+        is_person_token = initilized_person_recognizer._get_is_person_token(doc)
+
+        # Test that the tokens checked with Doc.to_array result in the same spans as the tokens checked one by one.
+        for start in range(len(doc)):
+            for end in range(start + 1, min(start + 7, len(doc)) + 1):
+                span = doc[start:end]
+                expected_spans = initilized_person_recognizer._clean_person_span(span, doc)
+                spans = initilized_person_recognizer._clean_person_span(span, doc, is_person_token)
+                assert [(s.start, s.end) for s in spans] == [(s.start, s.end) for s in expected_spans]
+
+        assert initilized_person_recognizer._get_is_person_token("Not a doc") is None
+
+
+class TestCustomPersonRecognizer_PatternBased:
+    @pytest.mark.parametrize(
+        "language", [constants.LANGUAGE_CODE_DE, constants.LANGUAGE_CODE_EN, constants.LANGUAGE_CODE_ES]
+    )
+    def test_anchor_first_matching(self, language, mocker):
+        person_recognizer = CustomPersonRecognizer_PatternBased(
+            supported_language=language,
+            supported_entities=[constants.ENTITY_PERSON],
+            supported_regions=constants.VALID_GLOBALLY,
+        )
+        prose = "Der Kunde meldete 3 Schäden am Fahrzeug. The customer asked for a callback about 2 invoices. " * 5
+        persons = (
+            "Guten Morgen Max Mustermann,\nMit freundlichen Grüßen\nErika Musterfrau\nVon: Hans Meier\n"
+            "Regards, John Smith\nHola Juan Pérez, Saludos\nCarlos García\n"
+        )
+        text = prose + persons + prose + persons
+
+        # Test that the patterns with anchors are not evaluated in texts without their keywords.
+        scan_regions = assert_restricted_search_finds_all_matches(mocker, person_recognizer, text, prose)
+        anchored_patterns = [
+            pattern
+            for pattern in person_recognizer.patterns
+            if pattern.name in CustomPersonRecognizer_PatternBased.PATTERN_ANCHOR_REGEXES
+        ]
+        assert len([regions for regions in scan_regions if regions == []]) == len(anchored_patterns)
@@ -0,0 +1,138 @@
+import importlib.util
+import io
+import json
+import os
+
+import pytest
+
+from tests.resources.fake_piis import fake_vin
+from text_anonymizer import TextAnonymizer, constants
+from text_anonymizer.__main__ import main
+from text_anonymizer.exceptions import LanguageDetectionError
+from text_anonymizer.streaming import anonymize_lines, detect_lines
+
+
+@pytest.fixture(scope="module")
+def text_anonymizer_vin():
+    return TextAnonymizer(
+        supported_languages=[constants.LANGUAGE_CODE_DE, constants.LANGUAGE_CODE_EN],
+        supported_entities=[constants.ENTITY_VIN],
+        lazy_load_models=True,
+    )
+
+
+LINES = [
+    "The request of the customer was received.\n",
+    "The customer asked for the car with the VIN {}.\r\n".format(fake_vin),
+    "\n",
+    "The request was closed without an answer.",
+]
+
+
+class TestStreaming:
+    """Tests for the streaming module."""
+
+    def test_anonymize_lines(self, text_anonymizer_vin):
+        for batch_size in [1, 3, 10]:
+            anonymized_lines = list(
+                anonymize_lines(
+                    text_anonymizer_vin, lines=io.StringIO("".join(LINES)), language="en", batch_size=batch_size
+                )
+            )
+            # Lines and line endings are kept, only the VIN is anonymized.
+            assert len(anonymized_lines) == len(LINES)
+            assert anonymized_lines[0] == LINES[0]
+            assert anonymized_lines[1].endswith("<VIN>.\r\n")
+            assert fake_vin not in anonymized_lines[1]
+            assert anonymized_lines[2:] == LINES[2:]
+
+        # Test that the language is detected per batch.
+        anonymized_lines = list(anonymize_lines(text_anonymizer_vin, lines=LINES, detect_language=True))
+        assert fake_vin not in anonymized_lines[1]
+
+    def test_detect_lines(self, text_anonymizer_vin):
+        records = list(detect_lines(text_anonymizer_vin, lines=LINES, language="en", batch_size=2))
+        assert records == [
+            {
+                "line": 2,
+                "entities": [
+                    {
+                        "start": LINES[1].index(fake_vin),
+                        "end": LINES[1].index(fake_vin) + len(fake_vin),
+                        "type": constants.ENTITY_VIN,
+                    }
+                ],
+            }
+        ]
+
+        # Test the fallback language for batches whose language cannot be detected.
+        lines = ["1234", fake_vin]
+        with pytest.raises(LanguageDetectionError):
+            list(detect_lines(text_anonymizer_vin, lines=lines, detect_language=True))
+        records = list(detect_lines(text_anonymizer_vin, lines=lines, detect_language=True, fallback_language="en"))
+        assert [record["line"] for record in records] == [2]
+
+        # Test that an explicit language is not silently overwritten by the detected one.
+        for process_lines in [anonymize_lines, detect_lines]:
+            with pytest.raises(ValueError, match="language needs to be set to None"):
+                list(process_lines(text_anonymizer_vin, lines=lines, language="en", detect_language=True))
+
+    def test_main(self, mocker, tmp_path):
+        mocker.patch("text_anonymizer.__main__._configure_logging")
+        input_path = tmp_path / "application.log"
+        input_path.write_text("".join(LINES), encoding="utf-8")
+        output_path = tmp_path / "application_anonymized.log"
+        common_arguments = [str(input_path), "-o", str(output_path), "--language", "en", "--entities", "VIN"]
+
+        main(common_arguments)
+        anonymized_lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert len(anonymized_lines) == len(LINES)
+        assert fake_vin not in anonymized_lines[1]
+
+        main(common_arguments + ["--detect"])
+        records = [json.loads(line) for line in output_path.read_text(encoding="utf-8").splitlines()]
+        assert [record["line"] for record in records] == [2]
+
+    def test_main_without_language(self, mocker, tmp_path, capsys):
+        mocker.patch("text_anonymizer.__main__._configure_logging")
+        input_path = tmp_path / "application.log"
+        input_path.write_text("".join(LINES), encoding="utf-8")
+        output_path = tmp_path / "application_anonymized.log"
+        common_arguments = [str(input_path), "-o", str(output_path), "--entities", "VIN"]
+
+        # Test that a language is required, if more than one language is supported.
+        for arguments in [common_arguments, common_arguments + ["--languages", "de", "en"]]:
+            with pytest.raises(SystemExit) as exc_info:
+                main(arguments)
+            assert exc_info.value.code == 2
+            assert "--language --detect-language is required" in capsys.readouterr().err
+        assert not output_path.exists()
+
+        # Test that the language is optional, if exactly one language is supported.
+        main(common_arguments + ["--languages", "en"])
+        anonymized_lines = output_path.read_text(encoding="utf-8").splitlines()
+        assert fake_vin not in anonymized_lines[1]
+
+    def test_pii_check_script(self, mocker, tmp_path, text_anonymizer_vin):
+        script_path = os.path.join(os.path.dirname(__file__), "..", "scripts", "pii_check.py")
+        spec = importlib.util.spec_from_file_location("pii_check", script_path)
+        pii_check = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(pii_check)
+
+        # The last batch of the log consists of a timestamp only, whose language cannot be detected.
+        log_path = tmp_path / "application.log"
+        log_path.write_text("".join(LINES) + "\n2025-01-09 12:00:00\n", encoding="utf-8")
+        output_path = tmp_path / "pii_detection_result.txt"
+        mocker.patch.object(pii_check, "TextAnonymizer", return_value=text_anonymizer_vin)
+        mocker.patch.object(pii_check, "LOG_FILE", str(log_path))
+        mocker.patch.object(pii_check, "OUTPUT_FILE", str(output_path))
+        mocker.patch.object(pii_check, "BATCH_SIZE", len(LINES))
+
+        # Test that the report is written, although the language of a batch cannot be detected.
+        with pytest.raises(SystemExit):
+            pii_check.detect_pii()
+        vin_start = LINES[1].index(fake_vin)
+        assert output_path.read_text(encoding="utf-8").splitlines() == [
+            "Caution: PII detected in logs!",
+            "VIN found in line 2 at position {}-{}".format(vin_start, vin_start + len(fake_vin)),
+        ]
@@ -20,6 +20,115 @@ class TestTextAnonymizer:
         count_language_models = len(anonymizer_single_language._nlp_engine.models)
         assert len(selected_languages) == count_language_models
 
+    def test_TextAnonymizer_lazy_load_models(self):
+        anonymizer = TextAnonymizer(
+            supported_languages=[constants.LANGUAGE_CODE_DE, constants.LANGUAGE_CODE_EN], lazy_load_models=True
+        )
+        # No model is loaded when constructing the instance.
+        assert anonymizer._nlp_engine.nlp == {}
+        assert anonymizer._nlp_engine.get_supported_languages() == [
+            constants.LANGUAGE_CODE_DE,
+            constants.LANGUAGE_CODE_EN,
+        ]
+
+        # The model of a language is loaded when a text in this language is processed.
+        result = anonymizer.process(
+            text="Hallo mein Name ist Michael Schuhmacher.", language=constants.LANGUAGE_CODE_DE
+        )
+        assert "text" in result
+        assert list(anonymizer._nlp_engine.nlp.keys()) == [constants.LANGUAGE_CODE_DE]
+
+        # Models can be loaded in advance.
+        anonymizer.preload(languages=[constants.LANGUAGE_CODE_EN])
+        assert list(anonymizer._nlp_engine.nlp.keys()) == [constants.LANGUAGE_CODE_DE, constants.LANGUAGE_CODE_EN]
+
+        with pytest.raises(ValueError):
+            anonymizer.preload(languages=[constants.LANGUAGE_CODE_ES])
+
+    def test_TextAnonymizer_model_selection(self):
+        def get_model_names(anonymizer):
+            return {model["lang_code"]: model["model_name"] for model in anonymizer._nlp_engine.models}
+
+        # Test default models.
+        anonymizer = TextAnonymizer(lazy_load_models=True)
+        assert get_model_names(anonymizer) == {
+            model["lang_code"]: model["model_name"] for model in constants.NLP_MODELS_CONFIGS
+        }
+
+        # Test presets.
+        for model_preset in constants.AVAILABLE_MODEL_PRESETS:
+            anonymizer = TextAnonymizer(
+                supported_languages=[constants.LANGUAGE_CODE_EN], lazy_load_models=True, model_preset=model_preset
+            )
+            assert get_model_names(anonymizer) == {
+                constants.LANGUAGE_CODE_EN: constants.NLP_MODEL_PRESETS[model_preset][constants.LANGUAGE_CODE_EN]
+            }
+
+        # Test that single models override the models of the preset.
+        anonymizer = TextAnonymizer(
+            lazy_load_models=True,
+            model_preset=constants.MODEL_PRESET_FAST,
+            language_models={constants.LANGUAGE_CODE_DE: "de_core_news_md"},
+        )
+        assert get_model_names(anonymizer) == {
+            constants.LANGUAGE_CODE_DE: "de_core_news_md",
+            constants.LANGUAGE_CODE_EN: "en_core_web_sm",
+            constants.LANGUAGE_CODE_ES: "es_core_news_sm",
+        }
+
+        # Test invalid arguments.
+        with pytest.raises(ValueError):
+            TextAnonymizer(lazy_load_models=True, model_preset="fastest")
+        with pytest.raises(ValueError):
+            TextAnonymizer(
+                supported_languages=[constants.LANGUAGE_CODE_EN],
+                lazy_load_models=True,
+                language_models={constants.LANGUAGE_CODE_DE: "de_core_news_md"},
+            )
+
+    def test_TextAnonymizer_excluded_spacy_components(self, mocker):
+        # The person recognizer requires named entities and POS tags only.
+        anonymizer = TextAnonymizer(
+            supported_languages=[constants.LANGUAGE_CODE_EN],
+            supported_entities=[constants.ENTITY_PERSON],
+            lazy_load_models=True,
+        )
+        assert anonymizer._nlp_engine.excluded_components == [
+            "lemmatizer",
+            "parser",
+            "sentencizer",
+            "senter",
+        ]
+
+        # Recognizers with context words require lemmas.
+        anonymizer = TextAnonymizer(
+            supported_languages=[constants.LANGUAGE_CODE_EN],
+            supported_entities=[constants.ENTITY_EMAIL_ADDRESS],
+            lazy_load_models=True,
+        )
+        assert "lemmatizer" not in anonymizer._nlp_engine.excluded_components
+        assert "ner" in anonymizer._nlp_engine.excluded_components
+
+        # Without the person recognizer, no component setting one of the known attributes is required.
+        anonymizer = TextAnonymizer(
+            supported_languages=[constants.LANGUAGE_CODE_EN],
+            supported_entities=[constants.ENTITY_VIN],
+            lazy_load_models=True,
+        )
+        for component in ["attribute_ruler", "morphologizer", "ner", "parser", "tagger"]:
+            assert component in anonymizer._nlp_engine.excluded_components
+        assert "tok2vec" not in anonymizer._nlp_engine.excluded_components
+        assert "transformer" not in anonymizer._nlp_engine.excluded_components
+
+        # Test that excluded components are not loaded.
+        mocker.patch.object(anonymizer._nlp_engine, "_download_spacy_model_if_needed")
+        mock_load = mocker.patch("text_anonymizer.nlp_engine.spacy.load")
+        anonymizer.preload()
+        mock_load.assert_called_once_with(
+            anonymizer._nlp_engine.models[0]["model_name"],
+            exclude=anonymizer._nlp_engine.excluded_components,
+        )
+
     def test_TextAnonymizer_validate_method_arguments(self):
         anonymizer = TextAnonymizer(
             supported_languages=[constants.LANGUAGE_CODE_DE],
@@ -155,23 +264,40 @@ class TestTextAnonymizer:
                 text=slovenian_text, language_detection_probability_distance=0
             )
 
+    def test_language_detector_caching(self, mocker, text_anonymizer_default):
+        german_text = "Hallo Tobi, kannst du bitte Analyse B durchführen und mir den Bericht schicken. Danke Julia"
+
+        # Test that language detectors are built once per minimum relative distance.
+        language_detector = text_anonymizer_default._get_language_detector(0.2)
+        assert text_anonymizer_default._get_language_detector(0.2) is language_detector
+        assert text_anonymizer_default._get_language_detector(0.1) is not language_detector
+
+        # Test that confidence values are only computed when debug logging is enabled.
+        spy_confidence_values = mocker.spy(text_anonymizer_default, "_create_confidence_values_dict")
+        mocker.patch("text_anonymizer.text_anonymizer.is_debug_logging_enabled", return_value=False)
+        assert text_anonymizer_default._apply_language_detection(text=german_text) == constants.LANGUAGE_CODE_DE
+        spy_confidence_values.assert_not_called()
+
+        mocker.patch("text_anonymizer.text_anonymizer.is_debug_logging_enabled", return_value=True)
+        assert text_anonymizer_default._apply_language_detection(text=german_text) == constants.LANGUAGE_CODE_DE
+        spy_confidence_values.assert_called_once()
+
     def test_TextAnonymizer_process(self, text_anonymizer_default, text_anonymizer_en):
         from tests.resources.fake_piis import fake_vin
 
         text = "This is a VIN: {}.".format(fake_vin)
         language = "en"
 
-        # Test update mechanism for the recognizer registry.
-        number_recognizers_fresh = len(text_anonymizer_default._presidio_analyzer.registry.recognizers)  # type: ignore
-        # While initializing the pre-defined presidio recognizers are loaded.
-        assert number_recognizers_fresh > 0
-
+        # Test selection mechanism for the AnalyzerEngines.
         result = text_anonymizer_default.process(text=text, language=language, technique=constants.TECHNIQUE_REDACT)
-        number_recognizers_all = len(text_anonymizer_default._presidio_analyzer.registry.recognizers)  # type: ignore
+        analyzer_all = text_anonymizer_default._get_presidio_analyzer(
+            language=language,
+            entities=text_anonymizer_default._supported_entities,
+            regions=text_anonymizer_default._supported_regions,
+        )
+        number_recognizers_all = len(analyzer_all.registry.recognizers)
         assert number_recognizers_all > 0
-        # TODO: Following assertion depends on tests that were run before because of implicit import logic in
-        # RecognizerManager and fake recognizers in test resources
-        assert number_recognizers_all != number_recognizers_fresh
+        assert analyzer_all.nlp_engine is text_anonymizer_default._nlp_engine
 
         result = text_anonymizer_default.process(
             text=text,
@@ -179,14 +305,34 @@ class TestTextAnonymizer:
             technique=constants.TECHNIQUE_REDACT,
             regions=[constants.COUNTRY_CODE_GREAT_BRITAIN],
         )
-        number_recognizers_restricted = len(text_anonymizer_default._presidio_analyzer.registry.recognizers)  # type: ignore
+        analyzer_restricted = text_anonymizer_default._get_presidio_analyzer(
+            language=language,
+            entities=text_anonymizer_default._supported_entities,
+            regions=[constants.COUNTRY_CODE_GREAT_BRITAIN],
+        )
+        number_recognizers_restricted = len(analyzer_restricted.registry.recognizers)
         assert number_recognizers_restricted > 0
         assert number_recognizers_restricted < number_recognizers_all
-        assert number_recognizers_restricted != number_recognizers_fresh
+        assert analyzer_restricted.nlp_engine is analyzer_all.nlp_engine
 
+        # The AnalyzerEngine of a selection is cached and not modified by calls with other selections.
         result = text_anonymizer_default.process(text=text, language=language, technique=constants.TECHNIQUE_REDACT)
-        number_recognizers_all_2 = len(text_anonymizer_default._presidio_analyzer.registry.recognizers)  # type: ignore
-        assert number_recognizers_all_2 == number_recognizers_all
+        analyzer_all_2 = text_anonymizer_default._get_presidio_analyzer(
+            language=language,
+            entities=list(reversed(text_anonymizer_default._supported_entities)),
+            regions=text_anonymizer_default._supported_regions,
+        )
+        assert analyzer_all_2 is analyzer_all
+        assert len(analyzer_all_2.registry.recognizers) == number_recognizers_all
+
+        # A selection without matching recognizers does not fall back to Presidio´s predefined recognizers.
+        with pytest.raises(ValueError, match="No matching recognizers were found"):
+            text_anonymizer_default.process(
+                text=text,
+                language=language,
+                entities=[constants.ENTITY_IDENTITY_CARD],
+                regions=[constants.COUNTRY_CODE_AUSTRIA],
+            )
 
         # Test anonymized text with one anonymization technique.
         result = text_anonymizer_default.process(text=text, language=language, technique=constants.TECHNIQUE_REDACT)
@@ -225,17 +371,12 @@ class TestTextAnonymizer:
         text = "This is a VIN: {}.".format(fake_vin)
         language = "en"
 
-        # Test update mechanism for the recognizer registry.
-        number_recognizers_fresh = len(anonymizer._presidio_analyzer.registry.recognizers)  # type: ignore
-        # While initializing the pre-defined presidio recognizers are loaded.
-        assert number_recognizers_fresh > 0
-
+        # Test that the deprecated method uses the same AnalyzerEngines as the process method.
         anonymized_text = anonymizer.anonymize(text=text, language=language, technique=constants.TECHNIQUE_REDACT)
-        number_recognizers_all = len(anonymizer._presidio_analyzer.registry.recognizers)  # type: ignore
-        assert number_recognizers_all > 0
-        # TODO: Following assertion depends on tests that were run before because of implicit import logic in
-        # RecognizerManager and fake recognizers in test resources
-        assert number_recognizers_all != number_recognizers_fresh
+        analyzer_all = anonymizer._get_presidio_analyzer(
+            language=language, entities=anonymizer._supported_entities, regions=anonymizer._supported_regions
+        )
+        assert len(analyzer_all.registry.recognizers) > 0
 
         anonymized_text = anonymizer.anonymize(
             text=text,
@@ -243,14 +384,11 @@ class TestTextAnonymizer:
             technique=constants.TECHNIQUE_REDACT,
             regions=[constants.COUNTRY_CODE_GREAT_BRITAIN],
         )
-        number_recognizers_restricted = len(anonymizer._presidio_analyzer.registry.recognizers)  # type: ignore
-        assert number_recognizers_restricted > 0
-        assert number_recognizers_restricted < number_recognizers_all
-        assert number_recognizers_restricted != number_recognizers_fresh
-
-        anonymized_text = anonymizer.anonymize(text=text, language=language, technique=constants.TECHNIQUE_REDACT)
-        number_recognizers_all_2 = len(anonymizer._presidio_analyzer.registry.recognizers)  # type: ignore
-        assert number_recognizers_all_2 == number_recognizers_all
+        analyzer_restricted = anonymizer._get_presidio_analyzer(
+            language=language, entities=anonymizer._supported_entities, regions=[constants.COUNTRY_CODE_GREAT_BRITAIN]
+        )
+        assert 0 < len(analyzer_restricted.registry.recognizers) < len(analyzer_all.registry.recognizers)
+        assert len(anonymizer._presidio_analyzers) == 2
 
         # Test output with one anonymization technique.
         anonymized_text = anonymizer.anonymize(text=text, language=language, technique=constants.TECHNIQUE_REDACT)
@@ -261,3 +399,191 @@ class TestTextAnonymizer:
         anonymized_text = anonymizer.anonymize(text=text, language=language, technique=constants.TECHNIQUE_REPLACE)
         assert text != anonymized_text
         assert len(anonymized_text) < len(text)
+
+    def test_TextAnonymizer_process_thread_safety(self, text_anonymizer_default):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from tests.resources.fake_piis import fake_vin
+
+        text = "Hello Mark, call me at +49 176 31127019 and check the VIN {}. Thank you, Sarah".format(fake_vin)
+        arguments = [
+            {"regions": [constants.COUNTRY_CODE_GERMANY]},
+            {"regions": [constants.COUNTRY_CODE_GREAT_BRITAIN]},
+            {"entities": [constants.ENTITY_VIN]},
+            {"entities": [constants.ENTITY_PHONE_NUMBER, constants.ENTITY_PERSON]},
+        ] * 10
+
+        def process(kwargs):
+            return text_anonymizer_default.process(text=text, language="en", detect=True, **kwargs)
+
+        expected_results = [process(kwargs) for kwargs in arguments]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(process, arguments))
+        assert results == expected_results
+
+    def test_TextAnonymizer_process_batch(self, text_anonymizer_default):
+        from tests.resources.fake_piis import fake_vin
+
+        texts = [
+            "This is a VIN: {}.".format(fake_vin),
+            "Das ist eine FIN: {}.".format(fake_vin),
+            "This text contains no PII.",
+            "",
+        ]
+
+        # Test that batch results equal the results of processing each text separately.
+        batch_results = text_anonymizer_default.process_batch(texts=texts, language="en", detect=True)
+        assert len(batch_results) == len(texts)
+        for text, batch_result in zip(texts, batch_results):
+            assert batch_result == text_anonymizer_default.process(text=text, language="en", detect=True)
+
+        # Test generator version with a batch size smaller than the number of texts.
+        iterator_results = list(
+            text_anonymizer_default.process_iterator(texts=iter(texts), language="en", detect=True, batch_size=3)
+        )
+        assert iterator_results == batch_results
+
+        # Test that results keep the input order when texts of different languages are grouped.
+        texts_mixed_languages = [
+            "Hello Mark, please perform analysis B and send me the report afterwards. Thank you, Sarah",
+            "Hallo Tobi, kannst du bitte Analyse B durchführen und mir den Bericht schicken. Danke Julia",
+            "Hello Mark, please send me the report with VIN {} afterwards. Thank you, Sarah".format(fake_vin),
+        ]
+        batch_results = text_anonymizer_default.process_batch(texts=texts_mixed_languages, detect_language=True)
+        for text, batch_result in zip(texts_mixed_languages, batch_results):
+            assert batch_result == text_anonymizer_default.process(text=text, detect_language=True)
+
+        # Test with invalid arguments.
+        with pytest.raises(ValueError):
+            text_anonymizer_default.process_batch(texts=texts)
+        with pytest.raises(ValueError):
+            list(text_anonymizer_default.process_iterator(texts=texts, language="en", batch_size=0))
+
+    def test_TextAnonymizer_regex_only_fast_path(self, mocker):
+        from tests.resources.fake_piis import fake_vin
+
+        anonymizer = TextAnonymizer(
+            supported_languages=[constants.LANGUAGE_CODE_EN],
+            supported_entities=[constants.ENTITY_VIN, constants.ENTITY_PERSON],
+            lazy_load_models=True,
+        )
+        spy_process_text = mocker.spy(anonymizer._nlp_engine, "process_text")
+        spy_tokenize_text = mocker.spy(anonymizer._nlp_engine, "tokenize_text")
+        text = "This is a VIN: {}.".format(fake_vin)
+
+        # Without NER based recognizers, the text is only tokenized and no spaCy model is loaded.
+        result = anonymizer.process(text=text, language="en", entities=[constants.ENTITY_VIN], detect=True)
+        assert [entity["type"] for entity in result["entities"]] == [constants.ENTITY_VIN]
+        assert text[result["entities"][0]["start"] : result["entities"][0]["end"]] == fake_vin
+        batch_results = anonymizer.process_batch(
+            texts=[text, text], language="en", entities=[constants.ENTITY_VIN], detect=True
+        )
+        assert batch_results == [result, result]
+        assert anonymizer._nlp_engine.nlp == {}
+        assert spy_process_text.call_count == 0
+        assert spy_tokenize_text.call_count == 3
+
+        # NER based recognizers still require the spaCy pipeline.
+        presidio_analyzer = anonymizer._get_presidio_analyzer(
+            language="en", entities=[constants.ENTITY_PERSON], regions=constants.AVAILABLE_REGIONS
+        )
+        assert anonymizer._requires_nlp_artifacts(presidio_analyzer)
+
+    def test_TextAnonymizer_result_cache(self, mocker):
+        from tests.resources.fake_piis import fake_vin
+
+        anonymizer = TextAnonymizer(
+            supported_languages=[constants.LANGUAGE_CODE_EN],
+            supported_entities=[constants.ENTITY_VIN],
+            lazy_load_models=True,
+            cache_size=10,
+        )
+        spy_analyze = mocker.spy(anonymizer, "_analyze")
+        text = "This is a VIN: {}.".format(fake_vin)
+
+        result = anonymizer.process(text=text, detect=True)
+        assert anonymizer.process(text=text, detect=True) == result
+        assert spy_analyze.call_count == 1
+
+        # Test that results depend on the arguments and are shared with process_batch.
+        assert anonymizer.process(text=text, detect=True, anonymize_complete_vin=True) != result
+        assert spy_analyze.call_count == 2
+        other_text = "Another VIN: {}.".format(fake_vin)
+        assert anonymizer.process_batch(texts=[text, other_text, other_text], detect=True) == [
+            result,
+            anonymizer.process(text=other_text, detect=True),
+            anonymizer.process(text=other_text, detect=True),
+        ]
+        assert spy_analyze.call_count == 3
+        assert anonymizer.get_cache_statistics() == {
+            "hits": 4,
+            "misses": 4,
+            "entries": 3,
+            "memory": anonymizer.get_cache_statistics()["memory"],
+        }
+
+        anonymizer.clear_cache()
+        assert anonymizer.get_cache_statistics()["entries"] == 0
+        assert (
+            TextAnonymizer(supported_entities=[constants.ENTITY_VIN], lazy_load_models=True).get_cache_statistics()
+            is None
+        )
+
+    def test_TextAnonymizer_persistent_result_cache(self, mocker, tmp_path):
+        from tests.resources.fake_piis import fake_vin
+
+        def create_text_anonymizer(entities):
+            return TextAnonymizer(
+                supported_languages=[constants.LANGUAGE_CODE_EN],
+                supported_entities=entities,
+                lazy_load_models=True,
+                cache_path=str(tmp_path / "cache.sqlite"),
+            )
+
+        text = "This is a VIN: {}.".format(fake_vin)
+        result = create_text_anonymizer([constants.ENTITY_VIN]).process(text=text, detect=True)
+
+        # Test that results are reused by text anonymizers with the same recognizers only.
+        anonymizer = create_text_anonymizer([constants.ENTITY_VIN])
+        spy_analyze = mocker.spy(anonymizer, "_analyze")
+        assert anonymizer.process_batch(texts=[text], detect=True) == [result]
+        assert spy_analyze.call_count == 0
+
+        anonymizer = create_text_anonymizer([constants.ENTITY_VIN, constants.ENTITY_IMEI])
+        spy_analyze = mocker.spy(anonymizer, "_analyze")
+        assert anonymizer.process(text=text, detect=True) == result
+        assert spy_analyze.call_count == 1
+
+        # Test that results of the same version are kept when the cache is pruned.
+        assert anonymizer.prune_cache() == 0
+        assert anonymizer.get_cache_statistics()["entries"] == 1
+
+    def test_TextAnonymizer_process_in_chunks(self):
+        from tests.resources.fake_piis import fake_vin
+
+        anonymizer = TextAnonymizer(
+            supported_languages=[constants.LANGUAGE_CODE_EN],
+            supported_entities=[constants.ENTITY_VIN],
+            lazy_load_models=True,
+        )
+        text = "\n".join(["Line {} of the log contains the VIN {}.".format(i, fake_vin) for i in range(20)])
+        expected_result = anonymizer.process(text=text, language="en", detect=True)
+        assert len(expected_result["entities"]) == 20
+
+        # Test that results equal the results of processing the whole text, whether entities are cut or not.
+        for chunk_size, chunk_overlap in [(100, 0), (100, 30), (64, 40), (len(text), 0)]:
+            result = anonymizer.process(
+                text=text, language="en", detect=True, chunk_size=chunk_size, chunk_overlap=chunk_overlap
+            )
+            assert result["text"] == expected_result["text"]
+            assert sorted(result["entities"], key=lambda entity: entity["start"]) == sorted(
+                expected_result["entities"], key=lambda entity: entity["start"]
+            )
+
+        with pytest.raises(ValueError):
+            anonymizer.process(text=text, language="en", chunk_size=100, chunk_overlap=100)
+
+        # Test that invalid chunking arguments are rejected independently of the length of the text.
+        for chunk_size, chunk_overlap in [(5000, 99999), (100, -1), (0, 0)]:
+            with pytest.raises(ValueError, match="Argument chunk_"):
+                anonymizer.process(text="short text", language="en", chunk_size=chunk_size, chunk_overlap=chunk_overlap)
@@ -0,0 +1,44 @@
+from text_anonymizer.trigger_word_index import (
+    ALL_TRIGGER_WORDS,
+    TriggerWordIndex,
+    get_trigger_word_index,
+    trigger_word_index_scope,
+)
+
+
+class TestTriggerWordIndex:
+    """Tests for the trigger_word_index module."""
+
+    def test_TriggerWordIndex(self):
+        text = "Pass-Nr. L01X00T47, Reisepass-Nr 123, Passnummer: 456 und ID card"
+        index = TriggerWordIndex(text, ALL_TRIGGER_WORDS)
+
+        # Test that shorter trigger words starting at the same position are found. Like the regexes of the single
+        # trigger words, 'Pass-Nr.' requires a word boundary after the dot.
+        assert index.find(frozenset(["Pass-Nr."]), 0, 10) is None
+        assert index.find(frozenset(["Pass-Nr"]), 0, 10) == "Pass-Nr"
+        assert index.find(frozenset(["Pass"]), 0, 10) == "Pass"
+
+        # Test that trigger words must be inside the window and match at word boundaries.
+        assert index.find(frozenset(["Pass"]), 0, 3) is None
+        assert index.find(frozenset(["Pass"]), 1, 10) is None
+        assert index.find(frozenset(["Pass-Nr", "Passnummer"]), 10, 50) == "Passnummer"
+        assert index.find(frozenset(["Reisepass-Nr"]), 0, len(text)) == "Reisepass-Nr"
+        assert index.find(frozenset(["Pass"]), text.index("Reisepass"), text.index("Passnummer")) is None
+        assert index.find(frozenset(["ID card"]), 0, len(text)) == "ID card"
+
+    def test_get_trigger_word_index(self):
+        text = "Ausweisnummer L01X00T47"
+
+        # Test that the index is reused within a scope for the same text only.
+        with trigger_word_index_scope():
+            index = get_trigger_word_index(text, ALL_TRIGGER_WORDS)
+            assert get_trigger_word_index(text, ALL_TRIGGER_WORDS) is index
+            with trigger_word_index_scope():
+                assert get_trigger_word_index(text, ALL_TRIGGER_WORDS) is index
+            assert get_trigger_word_index("".join(["Ausweis", "nummer L01X00T47"]), ALL_TRIGGER_WORDS) is not index
+            assert get_trigger_word_index(text, ("Ausweisnummer",)).find(frozenset(["Ausweisnummer"]), 0, 23)
+
+        # Test that no index and hence no text is kept outside of a scope.
+        assert get_trigger_word_index(text, ALL_TRIGGER_WORDS) is not index
+        assert get_trigger_word_index(text, ALL_TRIGGER_WORDS) is not get_trigger_word_index(text, ALL_TRIGGER_WORDS)
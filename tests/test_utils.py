@@ -76,6 +76,64 @@ class TestUtils:
         for module_name in module_names:
             assert module_name in sys.modules
 
+    def test_chunk_iterable(self):
+        assert list(utils.chunk_iterable(range(5), chunk_size=2)) == [[0, 1], [2, 3], [4]]
+        assert list(utils.chunk_iterable(iter(range(4)), chunk_size=4)) == [[0, 1, 2, 3]]
+        assert list(utils.chunk_iterable([], chunk_size=3)) == []
+
+        with pytest.raises(ValueError, match="Argument chunk_size must be greater than zero"):
+            list(utils.chunk_iterable(range(5), chunk_size=0))
+
+    def test_split_text_into_chunks(self):
+        text = "First line of the text.\nSecond line. It has two sentences.\nThird line"
+
+        # Short texts are not split.
+        assert utils.split_text_into_chunks(text, chunk_size=len(text)) == [(0, text)]
+
+        # Chunks end at line boundaries first, then at sentence boundaries.
+        assert utils.split_text_into_chunks(text, chunk_size=30) == [
+            (0, "First line of the text.\n"),
+            (24, "Second line. "),
+            (37, "It has two sentences.\n"),
+            (59, "Third line"),
+        ]
+
+        # Consecutive chunks overlap and start after a separator.
+        chunks = utils.split_text_into_chunks(text, chunk_size=30, chunk_overlap=15)
+        assert chunks[1] == (11, "of the text.\nSecond line. ")
+        for (offset, chunk), (next_offset, next_chunk) in zip(chunks, chunks[1:]):
+            assert len(chunk) <= 30
+            assert text[offset : offset + len(chunk)] == chunk
+            assert offset < next_offset <= offset + len(chunk)
+        assert chunks[-1][0] + len(chunks[-1][1]) == len(text)
+
+        # Texts without separators are cut after exactly chunk_size characters.
+        assert utils.split_text_into_chunks("abcdefg", chunk_size=3, chunk_overlap=1) == [
+            (0, "abc"),
+            (2, "cde"),
+            (4, "efg"),
+        ]
+
+        with pytest.raises(ValueError, match="Argument chunk_size must be greater than zero"):
+            utils.split_text_into_chunks(text, chunk_size=0)
+        with pytest.raises(ValueError, match="Argument chunk_overlap must be between zero and chunk_size - 1"):
+            utils.split_text_into_chunks(text, chunk_size=10, chunk_overlap=10)
+
+    def test_is_debug_logging_enabled(self, mocker):
+        logger = logging.getLogger("test_is_debug_logging_enabled")
+
+        logger.setLevel(logging.INFO)
+        assert not utils.is_debug_logging_enabled(logger)
+
+        logger.setLevel(logging.DEBUG)
+        assert utils.is_debug_logging_enabled(logger)
+
+        # Debugging texts of other recognizers are not logged if specific recognizers are selected.
+        mocker.patch("text_anonymizer.utils.get_specific_recognizers", return_value={"CustomVinRecognizer"})
+        assert utils.is_debug_logging_enabled(logger, calling_recognizer="CustomVinRecognizer")
+        assert not utils.is_debug_logging_enabled(logger, calling_recognizer="CustomImeiRecognizer")
+        assert not utils.is_debug_logging_enabled(logger)
+
     @utils.log_and_reraise_exceptions(LOGGER)
     def raise_error_helper(self, parameter):
         raise ValueError(f"An error occured with parameter '{parameter}'")
@@ -9,3 +9,27 @@ def assert_recognizer_result(
     assert result.start == expected_start
     assert result.end == expected_end
     assert result.score == expected_score
+
+
+def assert_restricted_search_finds_all_matches(mocker, recognizer, text: str, text_without_anchors: str) -> list:
+    """Asserts that a pattern recognizer, which evaluates its patterns only in windows around anchors or trigger words,
+    finds the same results as a search of the whole text and nothing in a text without anchors or trigger words.
+
+    Returns:
+        list: The scan regions of every call of _find_matches while analyzing text_without_anchors.
+    """
+    recognizer_class = type(recognizer)
+    max_match_length = recognizer_class.MAX_MATCH_LENGTH
+    entities = recognizer.supported_entities
+
+    # Test that the restricted search finds the same results as a search of the whole text.
+    results = recognizer.analyze(text, entities)
+    assert results
+    mocker.patch.object(recognizer_class, "MAX_MATCH_LENGTH", None)
+    assert recognizer.analyze(text, entities) == results
+
+    # Test that nothing is found in a text without anchors or trigger words.
+    spy_find_matches = mocker.spy(recognizer, "_find_matches")
+    mocker.patch.object(recognizer_class, "MAX_MATCH_LENGTH", max_match_length)
+    assert recognizer.analyze(text_without_anchors, entities) == []
+    return [call.args[2] for call in spy_find_matches.call_args_list]